@@ -18,9 +18,7 @@
 # along with weboob. If not, see <http://www.gnu.org/licenses/>.
 
 from weboob.capabilities.recipe import CapRecipe, Recipe
-from weboob.tools.backend import Module
-
-from .browser import SevenFiftyGramsBrowser
+from weboob.tools.backend import Module, LazyBrowser
 
 import unicodedata
 
@@ -37,7 +35,7 @@ class SevenFiftyGramsModule(Module, CapRecipe):
     VERSION = '1.0'
     DESCRIPTION = u'750g French recipe website'
     LICENSE = 'AGPLv3+'
-    BROWSER = SevenFiftyGramsBrowser
+    BROWSER = LazyBrowser('.browser', 'SevenFiftyGramsBrowser')
 
     def get_recipe(self, id):
         return self.browser.get_recipe(id)
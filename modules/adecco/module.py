@@ -18,11 +18,10 @@
 # along with weboob. If not, see <http://www.gnu.org/licenses/>.
 
 
-from weboob.tools.backend import Module, BackendConfig
+from weboob.tools.backend import Module, BackendConfig, LazyBrowser
 from weboob.tools.ordereddict import OrderedDict
 from weboob.tools.value import Value
 from weboob.capabilities.job import CapJob
-from .browser import AdeccoBrowser
 from .job import AdeccoJobAdvert
 
 __all__ = ['AdeccoModule']
@@ -35,7 +34,7 @@ class AdeccoModule(Module, CapJob):
     EMAIL = 'carton_ben@yahoo.fr'
     VERSION = '1.0'
 
-    BROWSER = AdeccoBrowser
+    BROWSER = LazyBrowser('.browser', 'AdeccoBrowser')
 
     publicationDate_choices = OrderedDict([(k, u'%s' % (v)) for k, v in sorted({
         '000000': u'-- Indifférent --',
@@ -18,9 +18,7 @@
 # along with weboob. If not, see <http://www.gnu.org/licenses/>.
 
 from weboob.capabilities.cinema import CapCinema, Person, Movie
-from weboob.tools.backend import Module
-
-from .browser import AllocineBrowser
+from weboob.tools.backend import Module, LazyBrowser
 
 from urllib import quote_plus
 
@@ -34,7 +32,7 @@ class AllocineModule(Module, CapCinema):
     VERSION = '1.0'
     DESCRIPTION = u'AlloCiné French cinema database service'
     LICENSE = 'AGPLv3+'
-    BROWSER = AllocineBrowser
+    BROWSER = LazyBrowser('.browser', 'AllocineBrowser')
 
     def get_movie(self, id):
         return self.browser.get_movie(id)
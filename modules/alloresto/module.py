@@ -20,11 +20,9 @@
 
 
 from weboob.capabilities.bank import CapBank, AccountNotFound
-from weboob.tools.backend import Module, BackendConfig
+from weboob.tools.backend import Module, BackendConfig, LazyBrowser
 from weboob.tools.value import ValueBackendPassword
 
-from .browser import AlloRestoBrowser
-
 
 __all__ = ['AlloRestoModule']
 
@@ -38,7 +36,7 @@ class AlloRestoModule(Module, CapBank):
     LICENSE = 'AGPLv3+'
     CONFIG = BackendConfig(ValueBackendPassword('login',    label='Identifiant', masked=False),
                            ValueBackendPassword('password', label='Mot de passe'))
-    BROWSER = AlloRestoBrowser
+    BROWSER = LazyBrowser('.browser', 'AlloRestoBrowser')
 
     def create_default_browser(self):
         return self.create_browser(self.config['login'].get(),
@@ -18,9 +18,7 @@
 # along with weboob. If not, see <http://www.gnu.org/licenses/>.
 
 from weboob.capabilities.recipe import CapRecipe, Recipe
-from weboob.tools.backend import Module
-
-from .browser import AllrecipesBrowser
+from weboob.tools.backend import Module, LazyBrowser
 
 from urllib import quote_plus
 
@@ -34,7 +32,7 @@ class AllrecipesModule(Module, CapRecipe):
     VERSION = '1.0'
     DESCRIPTION = u'Allrecipes English recipe website'
     LICENSE = 'AGPLv3+'
-    BROWSER = AllrecipesBrowser
+    BROWSER = LazyBrowser('.browser', 'AllrecipesBrowser')
 
     def get_recipe(self, id):
         return self.browser.get_recipe(id)
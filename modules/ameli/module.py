@@ -19,9 +19,8 @@
 
 import urllib
 from weboob.capabilities.bill import CapBill, SubscriptionNotFound, BillNotFound, Subscription, Bill
-from weboob.tools.backend import Module, BackendConfig
+from weboob.tools.backend import Module, BackendConfig, LazyBrowser
 from weboob.tools.value import ValueBackendPassword
-from .browser import AmeliBrowser
 
 __all__ = ['AmeliModule']
 
@@ -33,7 +32,7 @@ class AmeliModule(Module, CapBill):
     EMAIL = 'weboob@lampin.net'
     VERSION = '1.0'
     LICENSE = 'AGPLv3+'
-    BROWSER = AmeliBrowser
+    BROWSER = LazyBrowser('.browser', 'AmeliBrowser')
     CONFIG = BackendConfig(ValueBackendPassword('login',
                                                 label='numero de SS',
                                                 masked=False),
@@ -41,7 +40,7 @@ class AmeliModule(Module, CapBill):
                                                 label='Password',
                                                 masked=True)
                            )
-    BROWSER = AmeliBrowser
+    BROWSER = LazyBrowser('.browser', 'AmeliBrowser')
 
     def create_default_browser(self):
         return self.create_browser(self.config['login'].get(),
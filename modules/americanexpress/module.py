@@ -20,11 +20,9 @@
 
 
 from weboob.capabilities.bank import CapBank, AccountNotFound
-from weboob.tools.backend import Module, BackendConfig
+from weboob.tools.backend import Module, BackendConfig, LazyBrowser
 from weboob.tools.value import ValueBackendPassword
 
-from .browser import AmericanExpressBrowser
-
 
 __all__ = ['AmericanExpressModule']
 
@@ -38,7 +36,7 @@ class AmericanExpressModule(Module, CapBank):
     LICENSE = 'AGPLv3+'
     CONFIG = BackendConfig(ValueBackendPassword('login',    label='Code utilisateur', masked=False),
                            ValueBackendPassword('password', label='Mot de passe'))
-    BROWSER = AmericanExpressBrowser
+    BROWSER = LazyBrowser('.browser', 'AmericanExpressBrowser')
 
     def create_default_browser(self):
         return self.create_browser(self.config['login'].get(),
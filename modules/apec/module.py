@@ -18,11 +18,10 @@
 # along with weboob. If not, see <http://www.gnu.org/licenses/>.
 
 
-from weboob.tools.backend import Module, BackendConfig
+from weboob.tools.backend import Module, BackendConfig, LazyBrowser
 from weboob.capabilities.job import CapJob
 from weboob.tools.ordereddict import OrderedDict
 from weboob.tools.value import Value
-from .browser import ApecBrowser
 from .job import ApecJobAdvert
 
 __all__ = ['ApecModule']
@@ -35,7 +34,7 @@ class ApecModule(Module, CapJob):
     EMAIL = 'carton_ben@yahoo.fr'
     VERSION = '1.0'
 
-    BROWSER = ApecBrowser
+    BROWSER = LazyBrowser('.browser', 'ApecBrowser')
 
     places_choices = OrderedDict([(k, u'%s' % (v)) for k, v in sorted({
         '00|': u'-- Indifférent --',
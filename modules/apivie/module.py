@@ -18,11 +18,9 @@
 # along with weboob. If not, see <http://www.gnu.org/licenses/>.
 
 from weboob.capabilities.bank import CapBank
-from weboob.tools.backend import Module, BackendConfig
+from weboob.tools.backend import Module, BackendConfig, LazyBrowser
 from weboob.tools.value import ValueBackendPassword
 
-from .browser import ApivieBrowser
-
 
 __all__ = ['ApivieModule']
 
@@ -34,7 +32,7 @@ class ApivieModule(Module, CapBank):
     EMAIL = 'romain@weboob.org'
     VERSION = '1.0'
 
-    BROWSER = ApivieBrowser
+    BROWSER = LazyBrowser('.browser', 'ApivieBrowser')
 
     CONFIG = BackendConfig(ValueBackendPassword('login',    label='Identifiant', masked=False),
                            ValueBackendPassword('password', label='Mot de passe'))
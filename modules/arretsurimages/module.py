@@ -20,10 +20,9 @@
 
 from weboob.capabilities.video import CapVideo, BaseVideo
 from weboob.capabilities.collection import CapCollection, CollectionNotFound
-from weboob.tools.backend import Module, BackendConfig
+from weboob.tools.backend import Module, BackendConfig, LazyBrowser
 from weboob.tools.value import ValueBackendPassword
 
-from .browser import ArretSurImagesBrowser
 from .video import ArretSurImagesVideo
 
 __all__ = ['ArretSurImagesModule']
@@ -38,7 +37,7 @@ class ArretSurImagesModule(Module, CapVideo, CapCollection):
 
     CONFIG = BackendConfig(ValueBackendPassword('login',    label='email', masked=False),
                            ValueBackendPassword('password', label='Password'))
-    BROWSER = ArretSurImagesBrowser
+    BROWSER = LazyBrowser('.browser', 'ArretSurImagesBrowser')
 
     def create_default_browser(self):
         return self.create_browser(self.config['login'].get(), self.config['password'].get())
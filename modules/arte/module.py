@@ -22,10 +22,9 @@ import re
 
 from weboob.capabilities.video import CapVideo, BaseVideo
 from weboob.capabilities.collection import CapCollection, CollectionNotFound, Collection
-from weboob.tools.backend import Module, BackendConfig
+from weboob.tools.backend import Module, BackendConfig, LazyBrowser
 from weboob.tools.value import Value
 
-from .browser import ArteBrowser
 from .video import ArteVideo, ArteLiveVideo
 
 
@@ -60,7 +59,7 @@ class ArteModule(Module, CapVideo, CapCollection):
                     'ed': ['EQ', 1]
                     }
 
-    BROWSER = ArteBrowser
+    BROWSER = LazyBrowser('.browser', 'ArteBrowser')
 
     def create_default_browser(self):
         return self.create_browser(lang=self.TRANSLATION[self.config['lang'].get()],
@@ -18,9 +18,7 @@
 # along with weboob. If not, see <http://www.gnu.org/licenses/>.
 
 from weboob.capabilities.subtitle import CapSubtitle, LanguageNotSupported
-from weboob.tools.backend import Module
-
-from .browser import AttilasubBrowser
+from weboob.tools.backend import Module, LazyBrowser
 
 from urllib import quote_plus
 
@@ -35,7 +33,7 @@ class AttilasubModule(Module, CapSubtitle):
     DESCRIPTION = '"Attila\'s Website 2.0" French subtitles'
     LICENSE = 'AGPLv3+'
     LANGUAGE_LIST = ['fr']
-    BROWSER = AttilasubBrowser
+    BROWSER = LazyBrowser('.browser', 'AttilasubBrowser')
 
     def get_subtitle(self, id):
         return self.browser.get_subtitle(id)
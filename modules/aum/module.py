@@ -33,7 +33,7 @@ from weboob.capabilities.messages import CapMessages, CapMessagesPost, Message,
 from weboob.capabilities.dating import CapDating, OptimizationNotFound, Event
 from weboob.capabilities.contact import CapContact, ContactPhoto, Query, QueryError
 from weboob.capabilities.account import CapAccount, StatusField
-from weboob.tools.backend import Module, BackendConfig
+from weboob.tools.backend import Module, BackendConfig, LazyBrowser
 from weboob.tools.browser import BrowserUnavailable, BrowserHTTPNotFound
 from weboob.tools.value import Value, ValuesDict, ValueBool, ValueBackendPassword
 from weboob.tools.log import getLogger
@@ -43,7 +43,6 @@ from weboob.tools.misc import to_unicode
 from .contact import Contact
 from .captcha import CaptchaError
 from .antispam import AntiSpam
-from .browser import AuMBrowser
 from .optim.profiles_walker import ProfilesWalker
 from .optim.visibility import Visibility
 from .optim.queries_queue import QueriesQueue
@@ -74,7 +73,7 @@ class AuMModule(Module, CapMessages, CapMessagesPost, CapDating, CapChat, CapCon
                'sluts': {},
                'notes': {},
               }
-    BROWSER = AuMBrowser
+    BROWSER = LazyBrowser('.browser', 'AuMBrowser')
 
     MAGIC_ID_BASKET = 1
 
@@ -19,11 +19,9 @@
 
 
 from weboob.capabilities.bank import CapBank, AccountNotFound
-from weboob.tools.backend import Module, BackendConfig
+from weboob.tools.backend import Module, BackendConfig, LazyBrowser
 from weboob.tools.value import ValueBackendPassword
 
-from .browser import AXABanque
-
 
 __all__ = ['AXABanqueModule']
 
@@ -37,7 +35,7 @@ class AXABanqueModule(Module, CapBank):
     LICENSE = 'AGPLv3+'
     CONFIG = BackendConfig(ValueBackendPassword('login',    label=u'N° de client', regexp='\d+', masked=False),
                            ValueBackendPassword('password', label='Code', regexp='\d+'))
-    BROWSER = AXABanque
+    BROWSER = LazyBrowser('.browser', 'AXABanque')
 
     def create_default_browser(self):
         return self.create_browser(self.config['login'].get(),
@@ -20,11 +20,9 @@
 
 from weboob.capabilities.base import find_object
 from weboob.capabilities.bank import CapBank, AccountNotFound
-from weboob.tools.backend import Module, BackendConfig
+from weboob.tools.backend import Module, BackendConfig, LazyBrowser
 from weboob.tools.value import ValueBackendPassword
 
-from .browser import BanqueAccordBrowser
-
 
 __all__ = ['BanqueAccordModule']
 
@@ -39,7 +37,7 @@ class BanqueAccordModule(Module, CapBank):
     CONFIG = BackendConfig(ValueBackendPassword('login',    label='Identifiant', regexp='\d+', masked=False),
                            ValueBackendPassword('password', label=u"Code d'accès", regexp='\d+'))
 
-    BROWSER = BanqueAccordBrowser
+    BROWSER = LazyBrowser('.browser', 'BanqueAccordBrowser')
 
     def create_default_browser(self):
         return self.create_browser(self.config['login'].get(),
@@ -19,12 +19,10 @@
 
 
 from weboob.capabilities.bank import CapBank, AccountNotFound
-from weboob.tools.backend import Module, BackendConfig
+from weboob.tools.backend import Module, BackendConfig, LazyBrowser
 from weboob.tools.ordereddict import OrderedDict
 from weboob.tools.value import ValueBackendPassword, Value
 
-from .browser import BanquePopulaire
-
 
 __all__ = ['BanquePopulaireModule']
 
@@ -60,7 +58,7 @@ class BanquePopulaireModule(Module, CapBank):
     CONFIG = BackendConfig(Value('website',  label=u'Région', choices=website_choices),
                            ValueBackendPassword('login',    label='Identifiant', masked=False),
                            ValueBackendPassword('password', label='Mot de passee'))
-    BROWSER = BanquePopulaire
+    BROWSER = LazyBrowser('.browser', 'BanquePopulaire')
 
     def create_default_browser(self):
         return self.create_browser(self.config['website'].get(),
@@ -19,11 +19,9 @@
 
 
 from weboob.capabilities.bank import CapBank, AccountNotFound
-from weboob.tools.backend import Module, BackendConfig
+from weboob.tools.backend import Module, BackendConfig, LazyBrowser
 from weboob.tools.value import ValueBackendPassword
 
-from .browser import Barclays
-
 
 __all__ = ['BarclaysModule']
 
@@ -38,7 +36,7 @@ class BarclaysModule(Module, CapBank):
     CONFIG = BackendConfig(ValueBackendPassword('login',    label=u"N° d'abonné", masked=False),
                            ValueBackendPassword('password', label='Code confidentiel'),
                            ValueBackendPassword('secret',   label='Mot secret'))
-    BROWSER = Barclays
+    BROWSER = LazyBrowser('.browser', 'Barclays')
 
     def create_default_browser(self):
         return self.create_browser(self.config['secret'].get(),
@@ -18,11 +18,10 @@
 # along with weboob. If not, see <http://www.gnu.org/licenses/>.
 
 
-from weboob.tools.backend import Module
+from weboob.tools.backend import Module, LazyBrowser
 from weboob.capabilities.calendar import CapCalendarEvent, CATEGORIES
 import itertools
 
-from .browser import BiplanBrowser
 from.calendar import BiplanCalendarEvent
 
 __all__ = ['BiplanModule']
@@ -36,7 +35,7 @@ class BiplanModule(Module, CapCalendarEvent):
     LICENSE = 'AGPLv3+'
     VERSION = '1.0'
     ASSOCIATED_CATEGORIES = [CATEGORIES.CONCERT, CATEGORIES.THEATRE]
-    BROWSER = BiplanBrowser
+    BROWSER = LazyBrowser('.browser', 'BiplanBrowser')
 
     def search_events(self, query):
         if self.has_matching_categories(query):
@@ -21,11 +21,9 @@
 
 
 from weboob.capabilities.bank import CapBank, AccountNotFound
-from weboob.tools.backend import Module, BackendConfig
+from weboob.tools.backend import Module, BackendConfig, LazyBrowser
 from weboob.tools.value import ValueBackendPassword, ValueBool, Value
 
-from .browser import Boursorama
-
 
 __all__ = ['BoursoramaModule']
 
@@ -42,7 +40,7 @@ class BoursoramaModule(Module, CapBank):
                            ValueBool('enable_twofactors',     label='Send validation sms', default=False),
                            Value('device',                    label='Device name', regexp='\w*', default=''),
                           )
-    BROWSER = Boursorama
+    BROWSER = LazyBrowser('.browser', 'Boursorama')
 
     def create_default_browser(self):
         return self.create_browser(
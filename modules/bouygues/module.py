@@ -21,11 +21,9 @@
 
 
 from weboob.capabilities.messages import CantSendMessage, CapMessages, CapMessagesPost
-from weboob.tools.backend import Module, BackendConfig
+from weboob.tools.backend import Module, BackendConfig, LazyBrowser
 from weboob.tools.value import ValueBackendPassword, Value
 
-from .browser import BouyguesBrowser
-
 
 __all__ = ['BouyguesModule']
 
@@ -39,7 +37,7 @@ class BouyguesModule(Module, CapMessages, CapMessagesPost):
     LICENSE = 'AGPLv3+'
     CONFIG = BackendConfig(Value('login', label='Login'),
                            ValueBackendPassword('password', label='Password'))
-    BROWSER = BouyguesBrowser
+    BROWSER = LazyBrowser('.browser', 'BouyguesBrowser')
     ACCOUNT_REGISTER_PROPERTIES = None
 
     def create_default_browser(self):
@@ -19,11 +19,9 @@
 
 
 from weboob.capabilities.bank import CapBank, Account
-from weboob.tools.backend import Module, BackendConfig
+from weboob.tools.backend import Module, BackendConfig, LazyBrowser
 from weboob.tools.value import ValueBackendPassword
 
-from .browser import BPBrowser
-
 
 __all__ = ['BPModule']
 
@@ -37,7 +35,7 @@ class BPModule(Module, CapBank):
     DESCRIPTION = u'La Banque Postale'
     CONFIG = BackendConfig(ValueBackendPassword('login',    label='Identifiant', masked=False),
                            ValueBackendPassword('password', label='Mot de passe', regexp='^(\d{6}|)$'))
-    BROWSER = BPBrowser
+    BROWSER = LazyBrowser('.browser', 'BPBrowser')
 
     def create_default_browser(self):
         return self.create_browser(self.config['login'].get(), self.config['password'].get())
@@ -20,11 +20,9 @@
 
 
 from weboob.capabilities.bank import CapBank, AccountNotFound
-from weboob.tools.backend import Module, BackendConfig
+from weboob.tools.backend import Module, BackendConfig, LazyBrowser
 from weboob.tools.value import ValueBackendPassword, Value
 
-from .browser import BredBrowser
-
 
 __all__ = ['BredModule']
 
@@ -42,7 +40,7 @@ class BredModule(Module, CapBank):
                                  choices={'bred': 'BRED', 'dispobank': 'DispoBank'}),
                            Value('accnum', label=u'Account number to force (optional)', default='', masked=False)
                           )
-    BROWSER = BredBrowser
+    BROWSER = LazyBrowser('.browser', 'BredBrowser')
 
     def create_default_browser(self):
         return self.create_browser(self.config['website'].get(),
@@ -1,9 +1,7 @@
 # -*- coding: utf-8 -*-
 
 from weboob.capabilities.torrent import CapTorrent
-from weboob.tools.backend import Module
-
-from .browser import BTDiggBrowser
+from weboob.tools.backend import Module, LazyBrowser
 
 
 __all__ = ['BTDiggModule']
@@ -15,7 +13,7 @@ class BTDiggModule(Module, CapTorrent):
     VERSION = '1.0'
     DESCRIPTION = 'The BitTorrent DHT search engine.'
     LICENSE = 'CC0'
-    BROWSER = BTDiggBrowser
+    BROWSER = LazyBrowser('.browser', 'BTDiggBrowser')
 
     def create_default_browser(self):
         return self.create_browser()
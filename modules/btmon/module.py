@@ -18,9 +18,7 @@
 # along with weboob. If not, see <http://www.gnu.org/licenses/>.
 
 from weboob.capabilities.torrent import CapTorrent, Torrent
-from weboob.tools.backend import Module
-
-from .browser import BtmonBrowser
+from weboob.tools.backend import Module, LazyBrowser
 
 from urllib import quote_plus
 
@@ -34,7 +32,7 @@ class BtmonModule(Module, CapTorrent):
     VERSION = '1.0'
     DESCRIPTION = 'BTMon BitTorrent database'
     LICENSE = 'AGPLv3+'
-    BROWSER = BtmonBrowser
+    BROWSER = LazyBrowser('.browser', 'BtmonBrowser')
 
     def get_torrent(self, id):
         return self.browser.get_torrent(id)
@@ -19,11 +19,9 @@
 
 
 from weboob.capabilities.bank import CapBank, AccountNotFound
-from weboob.tools.backend import Module, BackendConfig
+from weboob.tools.backend import Module, BackendConfig, LazyBrowser
 from weboob.tools.value import Value, ValueBackendPassword
 
-from .browser import CaisseEpargne
-
 
 __all__ = ['CaisseEpargneModule']
 
@@ -38,7 +36,7 @@ class CaisseEpargneModule(Module, CapBank):
     CONFIG = BackendConfig(ValueBackendPassword('login',    label='Identifiant client', masked=False),
                            ValueBackendPassword('password', label='Code personnel', regexp='\d+'),
                            Value('nuser', label='User ID (optional)', default=''))
-    BROWSER = CaisseEpargne
+    BROWSER = LazyBrowser('.browser', 'CaisseEpargne')
 
     def create_default_browser(self):
         return self.create_browser(self.config['nuser'].get(),
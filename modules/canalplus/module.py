@@ -20,10 +20,9 @@
 import re
 
 from weboob.capabilities.video import CapVideo, BaseVideo
-from weboob.tools.backend import Module, BackendConfig
+from weboob.tools.backend import Module, BackendConfig, LazyBrowser
 from weboob.tools.value import Value
 
-from .browser import CanalplusBrowser
 from .video import CanalplusVideo
 
 from weboob.capabilities.collection import CapCollection
@@ -40,7 +39,7 @@ class CanalplusModule(Module, CapVideo, CapCollection):
     DESCRIPTION = 'Canal Plus French TV'
     LICENSE = 'AGPLv3+'
     CONFIG = BackendConfig(Value('quality', label='Quality of videos', choices=['hd', 'sd'], default='hd'))
-    BROWSER = CanalplusBrowser
+    BROWSER = LazyBrowser('.browser', 'CanalplusBrowser')
 
     def create_default_browser(self):
         return self.create_browser(quality=self.config['quality'].get())
@@ -18,9 +18,7 @@
 # along with weboob. If not, see <http://www.gnu.org/licenses/>.
 
 from weboob.capabilities.travel import CapTravel, Station, Departure
-from weboob.tools.backend import Module
-
-from .browser import CanalTP
+from weboob.tools.backend import Module, LazyBrowser
 
 
 __all__ = ['CanalTPModule']
@@ -33,7 +31,7 @@ class CanalTPModule(Module, CapTravel):
     VERSION = '1.0'
     LICENSE = 'AGPLv3+'
     DESCRIPTION = "French trains"
-    BROWSER = CanalTP
+    BROWSER = LazyBrowser('.browser', 'CanalTP')
 
     def iter_station_search(self, pattern):
         for _id, name in self.browser.iter_station_search(pattern):
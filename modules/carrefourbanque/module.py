@@ -20,11 +20,9 @@
 
 from weboob.capabilities.base import find_object
 from weboob.capabilities.bank import CapBank, AccountNotFound
-from weboob.tools.backend import Module, BackendConfig
+from weboob.tools.backend import Module, BackendConfig, LazyBrowser
 from weboob.tools.value import ValueBackendPassword
 
-from .browser import CarrefourBanque
-
 
 __all__ = ['CarrefourBanqueModule']
 
@@ -38,7 +36,7 @@ class CarrefourBanqueModule(Module, CapBank):
     LICENSE = 'AGPLv3+'
     CONFIG = BackendConfig(ValueBackendPassword('login',    label=u'Votre Identifiant Internet', masked=False),
                            ValueBackendPassword('password', label=u"Code d'accès",    regexp=u'\d+'))
-    BROWSER = CarrefourBanque
+    BROWSER = LazyBrowser('.browser', 'CarrefourBanque')
 
     def create_default_browser(self):
         return self.create_browser(self.config['login'].get(),
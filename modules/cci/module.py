@@ -18,12 +18,10 @@
 # along with weboob. If not, see <http://www.gnu.org/licenses/>.
 
 
-from weboob.tools.backend import Module, BackendConfig
+from weboob.tools.backend import Module, BackendConfig, LazyBrowser
 from weboob.capabilities.job import CapJob, BaseJobAdvert
 from weboob.tools.value import Value
 
-from .browser import CciBrowser
-
 
 __all__ = ['CciModule']
 
@@ -36,7 +34,7 @@ class CciModule(Module, CapJob):
     LICENSE = 'AGPLv3+'
     VERSION = '1.0'
 
-    BROWSER = CciBrowser
+    BROWSER = LazyBrowser('.browser', 'CciBrowser')
 
     CONFIG = BackendConfig(Value('metier', label='Job name', masked=False, default=''))
 
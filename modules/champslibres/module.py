@@ -19,11 +19,9 @@
 
 
 from weboob.capabilities.library import CapBook
-from weboob.tools.backend import Module, BackendConfig
+from weboob.tools.backend import Module, BackendConfig, LazyBrowser
 from weboob.tools.value import ValueBackendPassword, Value
 
-from .browser import ChampslibresBrowser
-
 
 __all__ = ['ChampslibresModule']
 
@@ -38,7 +36,7 @@ class ChampslibresModule(Module, CapBook):
     CONFIG = BackendConfig(Value('login', label='Account ID', regexp='^\d{1,15}|$'),
                            ValueBackendPassword('password', label='Password of account'),
                            )
-    BROWSER = ChampslibresBrowser
+    BROWSER = LazyBrowser('.browser', 'ChampslibresBrowser')
 
     def create_default_browser(self):
         browser = self.create_browser(self.config['login'].get(),
@@ -19,9 +19,7 @@
 
 
 from weboob.capabilities.parcel import CapParcel
-from weboob.tools.backend import Module
-
-from .browser import ChronopostBrowser
+from weboob.tools.backend import Module, LazyBrowser
 
 
 __all__ = ['ChronopostModule']
@@ -34,7 +32,7 @@ class ChronopostModule(Module, CapParcel):
     EMAIL = 'romain@weboob.org'
     VERSION = '1.0'
 
-    BROWSER = ChronopostBrowser
+    BROWSER = LazyBrowser('.browser', 'ChronopostBrowser')
 
     def get_parcel_tracking(self, id):
         with self.browser:
@@ -23,11 +23,9 @@ from decimal import Decimal
 import string
 
 from weboob.capabilities.bank import CapBank, AccountNotFound, Recipient, Account
-from weboob.tools.backend import Module, BackendConfig
+from weboob.tools.backend import Module, BackendConfig, LazyBrowser
 from weboob.tools.value import ValueBackendPassword
 
-from .browser import CICBrowser
-
 
 __all__ = ['CICModule']
 
@@ -41,7 +39,7 @@ class CICModule(Module, CapBank):
     LICENSE = 'AGPLv3+'
     CONFIG = BackendConfig(ValueBackendPassword('login',    label='Identifiant', regexp='^\d{1,13}\w$', masked=False),
                            ValueBackendPassword('password', label='Mot de passe'))
-    BROWSER = CICBrowser
+    BROWSER = LazyBrowser('.browser', 'CICBrowser')
 
     def create_default_browser(self):
         return self.create_browser(self.config['login'].get(), self.config['password'].get())
@@ -18,12 +18,10 @@
 # along with weboob. If not, see <http://www.gnu.org/licenses/>.
 
 
-from weboob.tools.backend import Module, BackendConfig
+from weboob.tools.backend import Module, BackendConfig, LazyBrowser
 from weboob.tools.value import ValueBackendPassword
 from weboob.capabilities.bank import CapBank, AccountNotFound
 
-from .browser import CitelisBrowser
-
 
 __all__ = ['CitelisModule']
 
@@ -36,7 +34,7 @@ class CitelisModule(Module, CapBank):
     LICENSE = 'AGPLv3+'
     VERSION = '1.0'
 
-    BROWSER = CitelisBrowser
+    BROWSER = LazyBrowser('.browser', 'CitelisBrowser')
 
     CONFIG = BackendConfig(
         ValueBackendPassword('merchant_id', label='Merchant ID', masked=False),
@@ -19,11 +19,9 @@
 
 
 from weboob.capabilities.bank import CapBank, AccountNotFound
-from weboob.tools.backend import Module, BackendConfig
+from weboob.tools.backend import Module, BackendConfig, LazyBrowser
 from weboob.tools.value import ValueBackendPassword
 
-from .browser import Cmso
-
 
 __all__ = ['CmsoModule']
 
@@ -37,7 +35,7 @@ class CmsoModule(Module, CapBank):
     LICENSE = 'AGPLv3+'
     CONFIG = BackendConfig(ValueBackendPassword('login',    label='Identifiant', masked=False),
                            ValueBackendPassword('password', label='Mot de passe'))
-    BROWSER = Cmso
+    BROWSER = LazyBrowser('.browser', 'Cmso')
 
     def create_default_browser(self):
         return self.create_browser(self.config['login'].get(),
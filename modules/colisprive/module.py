@@ -18,9 +18,7 @@
 # along with weboob. If not, see <http://www.gnu.org/licenses/>.
 
 from weboob.capabilities.parcel import CapParcel
-from weboob.tools.backend import Module
-
-from .browser import ColispriveBrowser
+from weboob.tools.backend import Module, LazyBrowser
 
 __all__ = ['ColispriveModule']
 
@@ -33,7 +31,7 @@ class ColispriveModule(Module, CapParcel):
     VERSION = '1.0'
     LICENSE = 'AGPLv3+'
 
-    BROWSER = ColispriveBrowser
+    BROWSER = LazyBrowser('.browser', 'ColispriveBrowser')
 
     def get_parcel_tracking(self, _id):
         with self.browser:
@@ -18,9 +18,8 @@
 # along with weboob. If not, see <http://www.gnu.org/licenses/>.
 
 from weboob.capabilities.parcel import CapParcel, Parcel, Event, ParcelNotFound
-from weboob.tools.backend import Module
+from weboob.tools.backend import Module, LazyBrowser
 
-from .browser import ColissimoBrowser
 from datetime import date
 
 __all__ = ['ColissimoModule']
@@ -34,7 +33,7 @@ class ColissimoModule(Module, CapParcel):
     VERSION = '1.0'
     LICENSE = 'AGPLv3+'
 
-    BROWSER = ColissimoBrowser
+    BROWSER = LazyBrowser('.browser', 'ColissimoBrowser')
 
     def get_parcel_tracking(self, _id):
         # 13 is the magic length of colissimo tracking ids
@@ -20,12 +20,10 @@
 
 
 from weboob.capabilities.bank import CapBank, AccountNotFound
-from weboob.tools.backend import Module, BackendConfig
+from weboob.tools.backend import Module, BackendConfig, LazyBrowser
 from weboob.tools.ordereddict import OrderedDict
 from weboob.tools.value import ValueBackendPassword, Value
 
-from .browser import CreditDuNordBrowser
-
 
 __all__ = ['CreditDuNordModule']
 
@@ -47,7 +45,7 @@ class CreditDuNordModule(Module, CapBank):
     CONFIG = BackendConfig(Value('website',  label='Banque', choices=website_choices, default='www.credit-du-nord.fr'),
                            ValueBackendPassword('login',    label='Identifiant', masked=False),
                            ValueBackendPassword('password', label='Code confidentiel'))
-    BROWSER = CreditDuNordBrowser
+    BROWSER = LazyBrowser('.browser', 'CreditDuNordBrowser')
 
     def create_default_browser(self):
         return self.create_browser(self.config['website'].get(),
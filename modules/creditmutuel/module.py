@@ -24,11 +24,9 @@ from decimal import Decimal
 import string
 
 from weboob.capabilities.bank import CapBank, AccountNotFound, Recipient, Account
-from weboob.tools.backend import Module, BackendConfig
+from weboob.tools.backend import Module, BackendConfig, LazyBrowser
 from weboob.tools.value import ValueBackendPassword
 
-from .browser import CreditMutuelBrowser
-
 
 __all__ = ['CreditMutuelModule']
 
@@ -42,7 +40,7 @@ class CreditMutuelModule(Module, CapBank):
     LICENSE = 'AGPLv3+'
     CONFIG = BackendConfig(ValueBackendPassword('login',    label='Identifiant', regexp='^\d{1,13}\w$', masked=False),
                            ValueBackendPassword('password', label='Mot de passe'))
-    BROWSER = CreditMutuelBrowser
+    BROWSER = LazyBrowser('.browser', 'CreditMutuelBrowser')
 
     def create_default_browser(self):
         return self.create_browser(self.config['login'].get(), self.config['password'].get())
@@ -18,9 +18,7 @@
 # along with weboob. If not, see <http://www.gnu.org/licenses/>.
 
 from weboob.capabilities.recipe import CapRecipe, Recipe
-from weboob.tools.backend import Module
-
-from .browser import CuisineazBrowser
+from weboob.tools.backend import Module, LazyBrowser
 
 import unicodedata
 
@@ -37,7 +35,7 @@ class CuisineazModule(Module, CapRecipe):
     VERSION = '1.0'
     DESCRIPTION = u'Cuisine AZ French recipe website'
     LICENSE = 'AGPLv3+'
-    BROWSER = CuisineazBrowser
+    BROWSER = LazyBrowser('.browser', 'CuisineazBrowser')
 
     def get_recipe(self, id):
         return self.browser.get_recipe(id)
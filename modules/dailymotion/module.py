@@ -19,9 +19,8 @@
 
 from weboob.capabilities.video import CapVideo, BaseVideo
 from weboob.capabilities.collection import CapCollection, CollectionNotFound
-from weboob.tools.backend import Module
+from weboob.tools.backend import Module, LazyBrowser
 
-from .browser import DailymotionBrowser
 from .video import DailymotionVideo
 
 
@@ -35,7 +34,7 @@ class DailymotionModule(Module, CapVideo, CapCollection):
     VERSION = '1.0'
     DESCRIPTION = 'Dailymotion video streaming website'
     LICENSE = 'AGPLv3+'
-    BROWSER = DailymotionBrowser
+    BROWSER = LazyBrowser('.browser', 'DailymotionBrowser')
 
     def get_video(self, _id):
         with self.browser:
@@ -18,11 +18,9 @@
 # along with weboob. If not, see <http://www.gnu.org/licenses/>.
 
 from weboob.capabilities.bank import CapBank
-from weboob.tools.backend import Module, BackendConfig
+from weboob.tools.backend import Module, BackendConfig, LazyBrowser
 from weboob.tools.value import ValueBackendPassword
 
-from .browser import DelubacBrowser
-
 
 __all__ = ['DelubacModule']
 
@@ -34,7 +32,7 @@ class DelubacModule(Module, CapBank):
     EMAIL = 'nru@budget-insight.com'
     VERSION = '1.0'
 
-    BROWSER = DelubacBrowser
+    BROWSER = LazyBrowser('.browser', 'DelubacBrowser')
 
     CONFIG = BackendConfig(ValueBackendPassword('login',    label='Identifiant', masked=False),
                            ValueBackendPassword('password', label='Mot de passe'))
@@ -23,14 +23,13 @@
 from datetime import datetime, timedelta
 import time
 
-from weboob.tools.backend import Module, BackendConfig
+from weboob.tools.backend import Module, BackendConfig, LazyBrowser
 from weboob.tools.browser import BrowserForbidden
 from weboob.tools.newsfeed import Newsfeed
 from weboob.tools.value import Value, ValueBool, ValueBackendPassword
 from weboob.capabilities.messages import CapMessages, CapMessagesPost, Message, Thread, CantSendMessage
 from weboob.capabilities.content import CapContent, Content
 
-from .browser import DLFP
 from .tools import rssid, id2url
 
 
@@ -53,7 +52,7 @@ class DLFPModule(Module, CapMessages, CapMessagesPost, CapContent):
                            ValueBool('get_wiki',            label='Get wiki', default=False),
                            ValueBool('get_tracker',         label='Get tracker', default=False))
     STORAGE = {'seen': {}}
-    BROWSER = DLFP
+    BROWSER = LazyBrowser('.browser', 'DLFP')
 
     FEEDS = {'get_news':     "https://linuxfr.org/news.atom",
              'get_diaries':  "https://linuxfr.org/journaux.atom",
@@ -18,11 +18,10 @@
 # along with weboob. If not, see <http://www.gnu.org/licenses/>.
 
 
-from .browser import DresdenWetterBrowser
 from weboob.capabilities.gauge import CapGauge, GaugeSensor, Gauge,\
         SensorNotFound
 from weboob.capabilities.base import find_object
-from weboob.tools.backend import Module
+from weboob.tools.backend import Module, LazyBrowser
 
 
 __all__ = ['DresdenWetterModule']
@@ -35,7 +34,7 @@ class DresdenWetterModule(Module, CapGauge):
     VERSION = '1.0'
     LICENSE = 'AGPLv3+'
     DESCRIPTION = u"Private wetter station Dresden"
-    BROWSER = DresdenWetterBrowser
+    BROWSER = LazyBrowser('.browser', 'DresdenWetterBrowser')
 
     def iter_gauges(self, pattern=None):
         if pattern is None or pattern.lower() in u"dresden"\
@@ -18,9 +18,8 @@
 # along with weboob. If not, see <http://www.gnu.org/licenses/>.
 
 from weboob.capabilities.bill import CapBill, SubscriptionNotFound, BillNotFound, Subscription, Bill
-from weboob.tools.backend import Module, BackendConfig
+from weboob.tools.backend import Module, BackendConfig, LazyBrowser
 from weboob.tools.value import ValueBackendPassword
-from .browser import EdfBrowser
 
 __all__ = ['EdfModule']
 
@@ -32,7 +31,7 @@ class EdfModule(Module, CapBill):
     EMAIL = 'bechris13250@gmail.com'
     VERSION = '1.0'
     LICENSE = 'AGPLv3+'
-    BROWSER = EdfBrowser
+    BROWSER = LazyBrowser('.browser', 'EdfBrowser')
     CONFIG = BackendConfig(ValueBackendPassword('login',
                                                 label='Identifiant',
                                                 masked=False),
@@ -40,7 +39,7 @@ class EdfModule(Module, CapBill):
                                                 label='Password',
                                                 masked=True)
                            )
-    BROWSER = EdfBrowser
+    BROWSER = LazyBrowser('.browser', 'EdfBrowser')
 
     def create_default_browser(self):
         return self.create_browser(self.config['login'].get(),
@@ -22,11 +22,10 @@
 import re
 from weboob.capabilities.gallery import CapGallery, BaseGallery
 from weboob.capabilities.collection import CapCollection, CollectionNotFound
-from weboob.tools.backend import Module, BackendConfig
+from weboob.tools.backend import Module, BackendConfig, LazyBrowser
 from weboob.tools.misc import ratelimit
 from weboob.tools.value import Value, ValueBackendPassword
 
-from .browser import EHentaiBrowser
 from .gallery import EHentaiGallery, EHentaiImage
 
 
@@ -40,7 +39,7 @@ class EHentaiModule(Module, CapGallery, CapCollection):
     VERSION = '1.0'
     DESCRIPTION = 'E-Hentai galleries'
     LICENSE = 'AGPLv3+'
-    BROWSER = EHentaiBrowser
+    BROWSER = LazyBrowser('.browser', 'EHentaiBrowser')
     CONFIG = BackendConfig(
         Value('domain', label='Domain', default='g.e-hentai.org'),
         Value('username', label='Username', default=''),
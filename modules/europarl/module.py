@@ -22,10 +22,9 @@
 
 
 from weboob.capabilities.video import CapVideo, BaseVideo
-from weboob.tools.backend import Module
+from weboob.tools.backend import Module, LazyBrowser
 from weboob.capabilities.collection import CapCollection, CollectionNotFound
 
-from .browser import EuroparlBrowser
 from .video import EuroparlVideo
 
 
@@ -39,7 +38,7 @@ class EuroparlModule(Module, CapVideo, CapCollection):
     VERSION = '1.0'
     DESCRIPTION = 'Europarl parliamentary video streaming website'
     LICENSE = 'AGPLv3+'
-    BROWSER = EuroparlBrowser
+    BROWSER = LazyBrowser('.browser', 'EuroparlBrowser')
 
     def get_video(self, _id):
         with self.browser:
@@ -18,12 +18,11 @@
 # along with weboob. If not, see <http://www.gnu.org/licenses/>.
 
 
-from weboob.tools.backend import Module, BackendConfig
+from weboob.tools.backend import Module, BackendConfig, LazyBrowser
 from weboob.capabilities.collection import CapCollection
 from weboob.capabilities.messages import CapMessages, Message, Thread
 from weboob.tools.value import Value, ValueBackendPassword
 
-from .browser import FeedlyBrowser
 from .google import GoogleBrowser
 
 __all__ = ['FeedlyModule']
@@ -40,7 +39,7 @@ class FeedlyModule(Module, CapMessages, CapCollection):
     CONFIG = BackendConfig(Value('username', label='Username', default=''),
                            ValueBackendPassword('password', label='Password', default=''))
 
-    BROWSER = FeedlyBrowser
+    BROWSER = LazyBrowser('.browser', 'FeedlyBrowser')
 
     def iter_resources(self, objs, split_path):
         collection = self.get_collection(objs, split_path)
@@ -19,11 +19,9 @@
 
 
 from weboob.capabilities.bank import CapBank, AccountNotFound
-from weboob.tools.backend import Module, BackendConfig
+from weboob.tools.backend import Module, BackendConfig, LazyBrowser
 from weboob.tools.value import ValueBackendPassword
 
-from .browser import Fortuneo
-
 
 __all__ = ['FortuneoModule']
 
@@ -48,7 +46,7 @@ class FortuneoModule(Module, CapBank):
                         required=True
                 )
     )
-    BROWSER = Fortuneo
+    BROWSER = LazyBrowser('.browser', 'Fortuneo')
 
     def create_default_browser(self):
         return self.create_browser(
@@ -21,11 +21,9 @@
 
 
 from weboob.capabilities.messages import CapMessages, Message, Thread
-from weboob.tools.backend import Module, BackendConfig
+from weboob.tools.backend import Module, BackendConfig, LazyBrowser
 from weboob.tools.value import Value
 
-from .browser import FourChan
-
 
 __all__ = ['FourChanModule']
 
@@ -39,7 +37,7 @@ class FourChanModule(Module, CapMessages):
     DESCRIPTION = '4chan image board'
     CONFIG = BackendConfig(Value('boards', label='Boards to fetch'))
     STORAGE = {'boards': {}}
-    BROWSER = FourChan
+    BROWSER = LazyBrowser('.browser', 'FourChan')
 
     def _splitid(self, id):
         return id.split('.', 1)
@@ -20,9 +20,7 @@
 
 from weboob.capabilities.video import CapVideo, BaseVideo
 from weboob.capabilities.collection import CapCollection, CollectionNotFound
-from weboob.tools.backend import Module
-
-from .browser import PluzzBrowser
+from weboob.tools.backend import Module, LazyBrowser
 
 
 __all__ = ['PluzzModule']
@@ -35,7 +33,7 @@ class PluzzModule(Module, CapVideo, CapCollection):
     VERSION = '1.0'
     DESCRIPTION = u'France Télévisions video website'
     LICENSE = 'AGPLv3+'
-    BROWSER = PluzzBrowser
+    BROWSER = LazyBrowser('.browser', 'PluzzBrowser')
 
     def get_video(self, _id):
         return self.browser.get_video(_id)
@@ -19,11 +19,9 @@
 
 from weboob.capabilities.bill import CapBill, Subscription, Bill, SubscriptionNotFound, BillNotFound
 from weboob.capabilities.base import find_object
-from weboob.tools.backend import Module, BackendConfig
+from weboob.tools.backend import Module, BackendConfig, LazyBrowser
 from weboob.tools.value import ValueBackendPassword
 
-from .browser import Freemobile
-
 
 __all__ = ['FreeMobileModule']
 
@@ -42,7 +40,7 @@ class FreeMobileModule(Module, CapBill):
                            ValueBackendPassword('password',
                                                 label='Password')
                            )
-    BROWSER = Freemobile
+    BROWSER = LazyBrowser('.browser', 'Freemobile')
 
     def create_default_browser(self):
         return self.create_browser(self.config['login'].get(),
@@ -19,12 +19,10 @@
 
 
 from weboob.capabilities.bank import CapBank, AccountNotFound
-from weboob.tools.backend import Module, BackendConfig
+from weboob.tools.backend import Module, BackendConfig, LazyBrowser
 from weboob.tools.ordereddict import OrderedDict
 from weboob.tools.value import ValueBackendPassword, Value
 
-from .browser import GanAssurances
-
 
 __all__ = ['GanAssurancesModule']
 
@@ -43,7 +41,7 @@ class GanAssurancesModule(Module, CapBank):
     CONFIG = BackendConfig(Value('website',  label='Banque', choices=website_choices, default='espaceclient.ganassurances.fr'),
                            ValueBackendPassword('login',    label=u'Numéro client', masked=False),
                            ValueBackendPassword('password', label=u"Code d'accès"))
-    BROWSER = GanAssurances
+    BROWSER = LazyBrowser('.browser', 'GanAssurances')
 
     def create_default_browser(self):
         return self.create_browser(self.config['website'].get(),
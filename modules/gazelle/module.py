@@ -18,11 +18,9 @@
 # along with weboob. If not, see <http://www.gnu.org/licenses/>.
 
 from weboob.capabilities.torrent import CapTorrent
-from weboob.tools.backend import Module, BackendConfig
+from weboob.tools.backend import Module, BackendConfig, LazyBrowser
 from weboob.tools.value import ValueBackendPassword, Value
 
-from .browser import GazelleBrowser
-
 
 __all__ = ['GazelleModule']
 
@@ -38,7 +36,7 @@ class GazelleModule(Module, CapTorrent):
                            Value('protocol', label='Protocol to use', choices=('http', 'https')),
                            Value('username', label='Username'),
                            ValueBackendPassword('password', label='Password'))
-    BROWSER = GazelleBrowser
+    BROWSER = LazyBrowser('.browser', 'GazelleBrowser')
 
     def create_default_browser(self):
         return self.create_browser(self.config['protocol'].get(), self.config['domain'].get(),
@@ -22,11 +22,10 @@
 
 
 from weboob.capabilities.video import CapVideo, BaseVideo
-from weboob.tools.backend import Module, BackendConfig
+from weboob.tools.backend import Module, BackendConfig, LazyBrowser
 from weboob.capabilities.collection import CapCollection, CollectionNotFound
 from weboob.tools.value import Value, ValueBackendPassword
 
-from .browser import GDCVaultBrowser
 from .video import GDCVaultVideo
 
 
@@ -40,7 +39,7 @@ class GDCVaultModule(Module, CapVideo, CapCollection):
     VERSION = '1.0'
     DESCRIPTION = 'Game Developers Conferences Vault video streaming website'
     LICENSE = 'AGPLv3+'
-    BROWSER = GDCVaultBrowser
+    BROWSER = LazyBrowser('.browser', 'GDCVaultBrowser')
     CONFIG = BackendConfig(Value('username',                  label='Username', default=''),
                            ValueBackendPassword('password',   label='Password', default=''))
 
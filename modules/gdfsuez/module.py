@@ -19,9 +19,8 @@
 
 from weboob.capabilities.bill import CapBill, SubscriptionNotFound,\
     BillNotFound, Subscription, Bill
-from weboob.tools.backend import Module, BackendConfig
+from weboob.tools.backend import Module, BackendConfig, LazyBrowser
 from weboob.tools.value import ValueBackendPassword
-from .browser import GdfSuez
 
 __all__ = ['GdfSuezModule']
 
@@ -40,7 +39,7 @@ class GdfSuezModule(Module, CapBill):
                                                 label='Password',
                                                 masked=True)
                            )
-    BROWSER = GdfSuez
+    BROWSER = LazyBrowser('.browser', 'GdfSuez')
 
     def create_default_browser(self):
         return self.create_browser(self.config['login'].get(),
@@ -18,12 +18,10 @@
 # along with weboob. If not, see <http://www.gnu.org/licenses/>.
 
 
-from weboob.tools.backend import Module, BackendConfig
+from weboob.tools.backend import Module, BackendConfig, LazyBrowser
 from weboob.tools.value import Value, ValueBackendPassword
 from weboob.capabilities.bugtracker import CapBugTracker, Issue, Project, User, Version, Status, Update, Attachment
 
-from .browser import GithubBrowser
-
 
 __all__ = ['GithubModule']
 
@@ -42,7 +40,7 @@ class GithubModule(Module, CapBugTracker):
     CONFIG = BackendConfig(Value('username', label='Username', default=''),
                            ValueBackendPassword('password', label='Password', default=''))
 
-    BROWSER = GithubBrowser
+    BROWSER = LazyBrowser('.browser', 'GithubBrowser')
 
     def create_default_browser(self):
         username = self.config['username'].get()
@@ -20,9 +20,7 @@
 
 
 from weboob.capabilities.translate import CapTranslate, Translation, TranslationFail, LanguageNotSupported
-from weboob.tools.backend import Module
-
-from .browser import GoogleTranslateBrowser
+from weboob.tools.backend import Module, LazyBrowser
 
 
 __all__ = ['GoogleTranslateModule']
@@ -35,7 +33,7 @@ class GoogleTranslateModule(Module, CapTranslate):
     LICENSE = 'AGPLv3+'
     NAME = 'googletranslate'
     DESCRIPTION = u'Google translation web service'
-    BROWSER = GoogleTranslateBrowser
+    BROWSER = LazyBrowser('.browser', 'GoogleTranslateBrowser')
     GOOGLELANGUAGE = {
         'Arabic':'ar', 'Afrikaans':'af', 'Albanian':'sq', 'Armenian':'hy', 'Azerbaijani':'az', 'Basque':'eu', 'Belarusian':'be',
         'Bengali':'bn', 'Bulgarian':'bg', 'Catalan':'ca', 'Chinese':'zh-CN', 'Croatian':'hr', 'Czech':'cs', 'Danish':'da',
@@ -18,10 +18,9 @@
 # along with weboob. If not, see <http://www.gnu.org/licenses/>.
 
 
-from weboob.tools.backend import Module, BackendConfig
+from weboob.tools.backend import Module, BackendConfig, LazyBrowser
 from weboob.capabilities.audio import CapAudio, BaseAudio, Album, Playlist, decode_id
 from weboob.capabilities.collection import CapCollection, CollectionNotFound
-from .browser import GroovesharkBrowser
 from weboob.tools.value import ValueBackendPassword, Value
 
 __all__ = ['GroovesharkModule']
@@ -43,7 +42,7 @@ class GroovesharkModule(Module, CapAudio, CapCollection):
     VERSION = '1.0'
     LICENSE = 'AGPLv3+'
 
-    BROWSER = GroovesharkBrowser
+    BROWSER = LazyBrowser('.browser', 'GroovesharkBrowser')
     CONFIG = BackendConfig(Value('username', label='Login', default=''),
                            ValueBackendPassword('password', label='Password', default=''))
 
@@ -18,12 +18,10 @@
 # along with weboob. If not, see <http://www.gnu.org/licenses/>.
 
 from weboob.capabilities.bank import CapBank, AccountNotFound
-from weboob.tools.backend import Module, BackendConfig
+from weboob.tools.backend import Module, BackendConfig, LazyBrowser
 from weboob.tools.value import ValueBackendPassword
 from weboob.capabilities.base import find_object
 
-from .browser import GroupamaesBrowser
-
 
 __all__ = ['GroupamaesModule']
 
@@ -36,7 +34,7 @@ class GroupamaesModule(Module, CapBank):
     LICENSE = 'AGPLv3+'
     VERSION = '1.0'
 
-    BROWSER = GroupamaesBrowser
+    BROWSER = LazyBrowser('.browser', 'GroupamaesBrowser')
 
     CONFIG = BackendConfig(ValueBackendPassword('login', label='Identifiant', regexp='\d{8}', masked=False),
                            ValueBackendPassword('password', label='Mot de passe'))
@@ -18,12 +18,10 @@
 # along with weboob. If not, see <http://www.gnu.org/licenses/>.
 
 
-from weboob.tools.backend import Module, BackendConfig
+from weboob.tools.backend import Module, BackendConfig, LazyBrowser
 from weboob.capabilities.messages import CapMessages, CapMessagesPost, Thread, Message
 from weboob.tools.value import Value
 
-from .browser import GuerrillamailBrowser
-
 
 __all__ = ['GuerrillamailModule']
 
@@ -36,7 +34,7 @@ class GuerrillamailModule(Module, CapMessages, CapMessagesPost):
     LICENSE = 'AGPLv3+'
     VERSION = '1.0'
 
-    BROWSER = GuerrillamailBrowser
+    BROWSER = LazyBrowser('.browser', 'GuerrillamailBrowser')
 
     CONFIG = BackendConfig(Value('inbox', label='Inbox', default=''))
 
@@ -20,11 +20,9 @@
 
 
 
-from weboob.tools.backend import Module
+from weboob.tools.backend import Module, LazyBrowser
 from weboob.capabilities.messages import CapMessages, Message, Thread
 
-from .browser import HDSBrowser
-
 
 __all__ = ['HDSModule']
 
@@ -37,7 +35,7 @@ class HDSModule(Module, CapMessages):
     LICENSE = 'AGPLv3+'
     DESCRIPTION = u"Histoires de Sexe French erotic novels"
     STORAGE = {'seen': []}
-    BROWSER = HDSBrowser
+    BROWSER = LazyBrowser('.browser', 'HDSBrowser')
 
     #### CapMessages ##############################################
 
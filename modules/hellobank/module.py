@@ -24,11 +24,9 @@ from datetime import datetime, timedelta
 
 from weboob.capabilities.bank import CapBank, AccountNotFound, Account, Recipient
 from weboob.capabilities.messages import CapMessages, Thread
-from weboob.tools.backend import Module, BackendConfig
+from weboob.tools.backend import Module, BackendConfig, LazyBrowser
 from weboob.tools.value import ValueBackendPassword
 
-from .browser import HelloBank
-
 
 __all__ = ['HelloBankModule']
 
@@ -42,7 +40,7 @@ class HelloBankModule(Module, CapBank, CapMessages):
     DESCRIPTION = u'Hello Bank!'
     CONFIG = BackendConfig(ValueBackendPassword('login',      label='Identifiant', masked=False),
                            ValueBackendPassword('password',   label='Code secret', regexp='^(\d{6}|)$'))
-    BROWSER = HelloBank
+    BROWSER = LazyBrowser('.browser', 'HelloBank')
     STORAGE = {'seen': []}
 
     # Store the messages *list* for this duration
@@ -21,11 +21,9 @@
 
 from weboob.capabilities.bank import CapBank, AccountNotFound
 from weboob.capabilities.base import find_object
-from weboob.tools.backend import Module, BackendConfig
+from weboob.tools.backend import Module, BackendConfig, LazyBrowser
 from weboob.tools.value import ValueBackendPassword, Value
 
-from .browser import HSBC
-
 
 __all__ = ['HSBCModule']
 
@@ -40,7 +38,7 @@ class HSBCModule(Module, CapBank):
     CONFIG = BackendConfig(ValueBackendPassword('login',      label='Identifiant', masked=False),
                            ValueBackendPassword('password',   label='Mot de passe'),
                            Value(               'secret',     label=u'Réponse secrète'))
-    BROWSER = HSBC
+    BROWSER = LazyBrowser('.browser', 'HSBC')
 
     def create_default_browser(self):
         return self.create_browser(self.config['login'].get(),
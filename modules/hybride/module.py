@@ -18,10 +18,9 @@
 # along with weboob. If not, see <http://www.gnu.org/licenses/>.
 
 
-from weboob.tools.backend import Module
+from weboob.tools.backend import Module, LazyBrowser
 from weboob.capabilities.calendar import CapCalendarEvent, CATEGORIES
 
-from .browser import HybrideBrowser
 from .calendar import HybrideCalendarEvent
 
 __all__ = ['HybrideModule']
@@ -35,7 +34,7 @@ class HybrideModule(Module, CapCalendarEvent):
     LICENSE = 'AGPLv3+'
     VERSION = '1.0'
     ASSOCIATED_CATEGORIES = [CATEGORIES.CINE]
-    BROWSER = HybrideBrowser
+    BROWSER = LazyBrowser('.browser', 'HybrideBrowser')
 
     def search_events(self, query):
         if self.has_matching_categories(query):
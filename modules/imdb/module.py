@@ -18,9 +18,7 @@
 # along with weboob. If not, see <http://www.gnu.org/licenses/>.
 
 from weboob.capabilities.cinema import CapCinema, Person, Movie
-from weboob.tools.backend import Module
-
-from .browser import ImdbBrowser
+from weboob.tools.backend import Module, LazyBrowser
 
 from urllib import quote_plus
 
@@ -34,7 +32,7 @@ class ImdbModule(Module, CapCinema):
     VERSION = '1.0'
     DESCRIPTION = 'Internet Movie Database service'
     LICENSE = 'AGPLv3+'
-    BROWSER = ImdbBrowser
+    BROWSER = LazyBrowser('.browser', 'ImdbBrowser')
 
     def get_movie(self, id):
         return self.browser.get_movie(id)
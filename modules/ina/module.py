@@ -19,9 +19,8 @@
 
 
 from weboob.capabilities.video import CapVideo
-from weboob.tools.backend import Module
+from weboob.tools.backend import Module, LazyBrowser
 
-from .browser import InaBrowser
 from .video import InaVideo
 
 
@@ -35,7 +34,7 @@ class InaModule(Module, CapVideo):
     VERSION = '1.0'
     DESCRIPTION = 'INA French TV video archives'
     LICENSE = 'AGPLv3+'
-    BROWSER = InaBrowser
+    BROWSER = LazyBrowser('.browser', 'InaBrowser')
 
     def get_video(self, _id):
         return self.browser.get_video(_id)
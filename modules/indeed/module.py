@@ -18,11 +18,10 @@
 # along with weboob. If not, see <http://www.gnu.org/licenses/>.
 
 
-from weboob.tools.backend import Module, BackendConfig
+from weboob.tools.backend import Module, BackendConfig, LazyBrowser
 from weboob.tools.ordereddict import OrderedDict
 from weboob.capabilities.job import CapJob, BaseJobAdvert
 from weboob.tools.value import Value
-from .browser import IndeedBrowser
 
 __all__ = ['IndeedModule']
 
@@ -35,7 +34,7 @@ class IndeedModule(Module, CapJob):
     LICENSE = 'AGPLv3+'
     VERSION = '1.0'
 
-    BROWSER = IndeedBrowser
+    BROWSER = LazyBrowser('.browser', 'IndeedBrowser')
 
     type_contrat_choices = OrderedDict([(k, u'%s' % (v)) for k, v in sorted({
         'all': u'Tous les emplois',
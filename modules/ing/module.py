@@ -23,11 +23,9 @@ from weboob.capabilities.bank import CapBank, AccountNotFound,\
 from weboob.capabilities.bill import CapBill, Bill, Subscription,\
     SubscriptionNotFound, BillNotFound
 from weboob.capabilities.base import UserError, find_object
-from weboob.tools.backend import Module, BackendConfig
+from weboob.tools.backend import Module, BackendConfig, LazyBrowser
 from weboob.tools.value import ValueBackendPassword
 
-from .browser import IngBrowser
-
 __all__ = ['INGModule']
 
 
@@ -49,7 +47,7 @@ class INGModule(Module, CapBank, CapBill):
                                                 regexp='^(\d{8}|)$',
                                                 masked=False)
                            )
-    BROWSER = IngBrowser
+    BROWSER = LazyBrowser('.browser', 'IngBrowser')
 
     def create_default_browser(self):
         return self.create_browser(self.config['login'].get(),
@@ -20,7 +20,7 @@
 
 from weboob.capabilities.messages import CapMessages
 from weboob.tools.capabilities.messages.GenericModule import GenericNewspaperModule
-from .browser import NewspaperInrocksBrowser
+from weboob.tools.backend import LazyBrowser
 from .tools import rssid
 
 
@@ -32,6 +32,6 @@ class NewspaperInrocksModule(GenericNewspaperModule, CapMessages):
     STORAGE = {'seen': {}}
     NAME = 'inrocks'
     DESCRIPTION = u'Les Inrocks French news website'
-    BROWSER = NewspaperInrocksBrowser
+    BROWSER = LazyBrowser('.browser', 'NewspaperInrocksBrowser')
     RSS_FEED = 'http://www.lesinrocks.com/fileadmin/rss/actus.xml'
     RSSID = rssid
@@ -19,9 +19,8 @@
 
 from weboob.capabilities.video import CapVideo, BaseVideo
 from weboob.capabilities.collection import CapCollection, CollectionNotFound
-from weboob.tools.backend import Module
+from weboob.tools.backend import Module, LazyBrowser
 
-from .browser import JacquieEtMichelBrowser
 from .video import JacquieEtMichelVideo
 
 
@@ -35,7 +34,7 @@ class JacquieEtMichelModule(Module, CapVideo, CapCollection):
     VERSION = '1.0'
     DESCRIPTION = 'Jacquie et Michel TV'
     LICENSE = 'AGPLv3+'
-    BROWSER = JacquieEtMichelBrowser
+    BROWSER = LazyBrowser('.browser', 'JacquieEtMichelBrowser')
 
     def get_video(self, _id):
         with self.browser:
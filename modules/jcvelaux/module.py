@@ -18,14 +18,12 @@
 # along with weboob. If not, see <http://www.gnu.org/licenses/>.
 
 
-from weboob.tools.backend import Module, BackendConfig
+from weboob.tools.backend import Module, BackendConfig, LazyBrowser
 from weboob.capabilities.base import StringField
 from weboob.capabilities.gauge import CapGauge, GaugeSensor, Gauge, GaugeMeasure, SensorNotFound
 from weboob.tools.value import Value
 from weboob.tools.ordereddict import OrderedDict
 
-from .browser import VelibBrowser
-
 
 __all__ = ['jcvelauxModule']
 
@@ -60,7 +58,7 @@ class jcvelauxModule(Module, CapGauge):
     VERSION = '1.0'
     LICENSE = 'AGPLv3'
 
-    BROWSER = VelibBrowser
+    BROWSER = LazyBrowser('.browser', 'VelibBrowser')
     STORAGE = {'boards': {}}
 
     CONFIG = BackendConfig(Value('city', label='City', default='Paris',
@@ -18,9 +18,7 @@
 # along with weboob. If not, see <http://www.gnu.org/licenses/>.
 
 from weboob.capabilities.travel import CapTravel, RoadStep
-from weboob.tools.backend import Module
-
-from .browser import JVMalin
+from weboob.tools.backend import Module, LazyBrowser
 
 
 __all__ = ['JVMalinModule']
@@ -33,7 +31,7 @@ class JVMalinModule(Module, CapTravel):
     VERSION = '1.0'
     LICENSE = 'AGPLv3+'
     DESCRIPTION = u"Multimodal public transportation for whole Région Centre, France"
-    BROWSER = JVMalin
+    BROWSER = LazyBrowser('.browser', 'JVMalin')
 
     def iter_roadmap(self, departure, arrival, filters):
         with self.browser:
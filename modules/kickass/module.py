@@ -18,9 +18,7 @@
 # along with weboob. If not, see <http://www.gnu.org/licenses/>.
 
 from weboob.capabilities.torrent import CapTorrent, Torrent
-from weboob.tools.backend import Module
-
-from .browser import KickassBrowser
+from weboob.tools.backend import Module, LazyBrowser
 
 from urllib import quote_plus
 from contextlib import closing
@@ -36,7 +34,7 @@ class KickassModule(Module, CapTorrent):
     VERSION = '1.0'
     DESCRIPTION = 'Kickass Torrents BitTorrent tracker'
     LICENSE = 'AGPLv3+'
-    BROWSER = KickassBrowser
+    BROWSER = LazyBrowser('.browser', 'KickassBrowser')
 
     def get_torrent(self, id):
         return self.browser.get_torrent(id)
@@ -19,11 +19,9 @@
 
 import re
 from weboob.capabilities.pricecomparison import CapPriceComparison, Price
-from weboob.tools.backend import Module
+from weboob.tools.backend import Module, LazyBrowser
 #from weboob.tools.value import Value
 
-from .browser import LaCentraleBrowser
-
 
 __all__ = ['LaCentraleModule']
 
@@ -36,7 +34,7 @@ class LaCentraleModule(Module, CapPriceComparison):
     VERSION = '1.0'
     DESCRIPTION = 'Vehicule prices at LaCentrale.fr'
     LICENSE = 'AGPLv3+'
-    BROWSER = LaCentraleBrowser
+    BROWSER = LazyBrowser('.browser', 'LaCentraleBrowser')
 
     # inherited from CapPriceComparison
     def search_products(self, patternString=None):
@@ -18,10 +18,9 @@
 # along with weboob. If not, see <http://www.gnu.org/licenses/>.
 
 
-from weboob.tools.backend import Module, BackendConfig
+from weboob.tools.backend import Module, BackendConfig, LazyBrowser
 from weboob.capabilities.housing import CapHousing, Query, Housing, HousingPhoto
 from weboob.tools.value import Value
-from .browser import LeboncoinBrowser
 
 
 __all__ = ['LeboncoinModule']
@@ -35,7 +34,7 @@ class LeboncoinModule(Module, CapHousing):
     LICENSE = 'AGPLv3+'
     VERSION = '1.0'
 
-    BROWSER = LeboncoinBrowser
+    BROWSER = LazyBrowser('.browser', 'LeboncoinBrowser')
 
     CONFIG = BackendConfig(Value('advert_type', label='Advert type',
                                  choices={'c': 'Agency', 'p': 'Owner', 'a': 'All'}, default='a'))
@@ -20,11 +20,9 @@
 
 from weboob.capabilities.bill import CapBill, SubscriptionNotFound,\
     BillNotFound, Subscription, Bill
-from weboob.tools.backend import Module, BackendConfig
+from weboob.tools.backend import Module, BackendConfig, LazyBrowser
 from weboob.tools.value import ValueBackendPassword
 
-from .browser import Leclercmobile
-
 
 __all__ = ['LeclercMobileModule']
 
@@ -43,7 +41,7 @@ class LeclercMobileModule(Module, CapBill):
                            ValueBackendPassword('password',
                                                 label='Password')
                            )
-    BROWSER = Leclercmobile
+    BROWSER = LazyBrowser('.browser', 'Leclercmobile')
 
     def create_default_browser(self):
         return self.create_browser(self.config['login'].get(),
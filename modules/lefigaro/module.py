@@ -20,7 +20,7 @@
 
 from weboob.capabilities.messages import CapMessages
 from weboob.tools.capabilities.messages.GenericModule import GenericNewspaperModule
-from .browser import NewspaperFigaroBrowser
+from weboob.tools.backend import LazyBrowser
 from .tools import rssid
 
 
@@ -32,6 +32,6 @@ class NewspaperFigaroModule(GenericNewspaperModule, CapMessages):
     STORAGE = {'seen': {}}
     NAME = 'lefigaro'
     DESCRIPTION = u'Le Figaro French newspaper website'
-    BROWSER = NewspaperFigaroBrowser
+    BROWSER = LazyBrowser('.browser', 'NewspaperFigaroBrowser')
     RSS_FEED = 'http://rss.lefigaro.fr/lefigaro/laune?format=xml'
     RSSID = rssid
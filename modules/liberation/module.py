@@ -21,9 +21,8 @@
 from weboob.tools.newsfeed import Newsfeed
 from weboob.capabilities.messages import CapMessages, Thread
 from weboob.tools.capabilities.messages.GenericModule import GenericNewspaperModule
-from weboob.tools.backend import BackendConfig
+from weboob.tools.backend import BackendConfig, LazyBrowser
 from weboob.tools.value import Value
-from .browser import NewspaperLibeBrowser
 from .tools import rssid, url2id
 
 
@@ -35,7 +34,7 @@ class NewspaperLibeModule(GenericNewspaperModule, CapMessages):
     STORAGE = {'seen': {}}
     NAME = 'liberation'
     DESCRIPTION = u'Libération newspaper website'
-    BROWSER = NewspaperLibeBrowser
+    BROWSER = LazyBrowser('.browser', 'NewspaperLibeBrowser')
     RSSID = staticmethod(rssid)
     URL2ID = staticmethod(url2id)
     RSSSIZE = 30
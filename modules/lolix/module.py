@@ -17,12 +17,11 @@
 # You should have received a copy of the GNU Affero General Public License
 # along with weboob. If not, see <http://www.gnu.org/licenses/>.
 
-from weboob.tools.backend import Module, BackendConfig
+from weboob.tools.backend import Module, BackendConfig, LazyBrowser
 from weboob.tools.ordereddict import OrderedDict
 from weboob.tools.value import Value
 from weboob.capabilities.job import CapJob
 
-from .browser import LolixBrowser
 from .job import LolixJobAdvert
 
 __all__ = ['LolixModule']
@@ -35,7 +34,7 @@ class LolixModule(Module, CapJob):
     EMAIL = 'carton_ben@yahoo.fr'
     VERSION = '1.0'
 
-    BROWSER = LolixBrowser
+    BROWSER = LazyBrowser('.browser', 'LolixBrowser')
 
     region_choices = OrderedDict([(k, u'%s' % (v)) for k, v in sorted({
         '0': u'-- Indifférent --',
@@ -18,15 +18,13 @@
 # along with weboob. If not, see <http://www.gnu.org/licenses/>.
 
 
-from weboob.tools.backend import Module, BackendConfig
+from weboob.tools.backend import Module, BackendConfig, LazyBrowser
 from weboob.capabilities.paste import CapPaste, BasePaste
 from weboob.tools.capabilities.paste import image_mime
 from weboob.tools.value import Value
 import re
 from urlparse import urljoin
 
-from .browser import LutimBrowser
-
 
 __all__ = ['LutimModule']
 
@@ -39,7 +37,7 @@ class LutimModule(Module, CapPaste):
     LICENSE = 'AGPLv3+'
     VERSION = '1.0'
 
-    BROWSER = LutimBrowser
+    BROWSER = LazyBrowser('.browser', 'LutimBrowser')
 
     CONFIG = BackendConfig(Value('base_url', label='Hoster base URL', default='http://lut.im/'))
 
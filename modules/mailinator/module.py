@@ -18,12 +18,10 @@
 # along with weboob. If not, see <http://www.gnu.org/licenses/>.
 
 
-from weboob.tools.backend import Module, BackendConfig
+from weboob.tools.backend import Module, BackendConfig, LazyBrowser
 from weboob.capabilities.messages import CapMessages, Thread, Message
 from weboob.tools.value import Value
 
-from .browser import MailinatorBrowser
-
 
 __all__ = ['MailinatorModule']
 
@@ -38,7 +36,7 @@ class MailinatorModule(Module, CapMessages):
     LICENSE = 'AGPLv3+'
     VERSION = '1.0'
 
-    BROWSER = MailinatorBrowser
+    BROWSER = LazyBrowser('.browser', 'MailinatorBrowser')
 
     CONFIG = BackendConfig(Value('inbox', label='Inbox', default=''))
 
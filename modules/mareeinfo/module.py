@@ -18,10 +18,9 @@
 # along with weboob. If not, see <http://www.gnu.org/licenses/>.
 
 
-from weboob.tools.backend import Module
+from weboob.tools.backend import Module, LazyBrowser
 from weboob.capabilities.base import find_object
 from weboob.capabilities.gauge import CapGauge, Gauge, SensorNotFound
-from .browser import MareeinfoBrowser
 
 
 __all__ = ['MareeinfoModule']
@@ -35,7 +34,7 @@ class MareeinfoModule(Module, CapGauge):
     LICENSE = 'AGPLv3+'
     VERSION = '1.0'
 
-    BROWSER = MareeinfoBrowser
+    BROWSER = LazyBrowser('.browser', 'MareeinfoBrowser')
 
     def get_last_measure(self, sensor_id):
         gauge_id = sensor_id.split('-')[0]
@@ -18,9 +18,7 @@
 # along with weboob. If not, see <http://www.gnu.org/licenses/>.
 
 from weboob.capabilities.recipe import CapRecipe, Recipe
-from weboob.tools.backend import Module
-
-from .browser import MarmitonBrowser
+from weboob.tools.backend import Module, LazyBrowser
 
 from urllib import quote_plus
 
@@ -34,7 +32,7 @@ class MarmitonModule(Module, CapRecipe):
     VERSION = '1.0'
     DESCRIPTION = u'Marmiton French recipe website'
     LICENSE = 'AGPLv3+'
-    BROWSER = MarmitonBrowser
+    BROWSER = LazyBrowser('.browser', 'MarmitonBrowser')
 
     def get_recipe(self, id):
         return self.browser.get_recipe(id)
@@ -19,13 +19,11 @@
 
 
 
-from weboob.tools.backend import Module, BackendConfig
+from weboob.tools.backend import Module, BackendConfig, LazyBrowser
 from weboob.capabilities.content import CapContent, Content
 from weboob.tools.value import ValueBackendPassword, Value
 
 
-from .browser import MediawikiBrowser
-
 
 __all__ = ['MediawikiModule']
 
@@ -42,7 +40,7 @@ class MediawikiModule(Module, CapContent):
                            Value('username', label='Login', default=''),
                            ValueBackendPassword('password', label='Password', default=''))
 
-    BROWSER = MediawikiBrowser
+    BROWSER = LazyBrowser('.browser', 'MediawikiBrowser')
 
     def create_default_browser(self):
         username = self.config['username'].get()
@@ -19,9 +19,7 @@
 
 
 from weboob.capabilities.weather import CapWeather
-from weboob.tools.backend import Module
-
-from .browser import MeteofranceBrowser
+from weboob.tools.backend import Module, LazyBrowser
 
 
 __all__ = ['MeteofranceModule']
@@ -34,7 +32,7 @@ class MeteofranceModule(Module, CapWeather):
     VERSION = '1.0'
     DESCRIPTION = 'Get forecasts from the MeteoFrance website'
     LICENSE = 'AGPLv3+'
-    BROWSER = MeteofranceBrowser
+    BROWSER = LazyBrowser('.browser', 'MeteofranceBrowser')
 
     def get_current(self, city_id):
         return self.browser.get_current(city_id)
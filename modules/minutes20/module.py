@@ -20,7 +20,7 @@
 
 from weboob.capabilities.messages import CapMessages
 from weboob.tools.capabilities.messages.GenericModule import GenericNewspaperModule
-from .browser import Newspaper20minutesBrowser
+from weboob.tools.backend import LazyBrowser
 from .tools import rssid
 
 
@@ -32,6 +32,6 @@ class Newspaper20minutesModule(GenericNewspaperModule, CapMessages):
     STORAGE = {'seen': {}}
     NAME = 'minutes20'
     DESCRIPTION = u'2 Minutes French newspaper website'
-    BROWSER = Newspaper20minutesBrowser
+    BROWSER = LazyBrowser('.browser', 'Newspaper20minutesBrowser')
     RSS_FEED = 'http://www.20minutes.fr/rss/une.xml'
     RSSID = rssid
@@ -18,12 +18,11 @@
 # along with weboob. If not, see <http://www.gnu.org/licenses/>.
 
 
-from weboob.tools.backend import Module, BackendConfig
+from weboob.tools.backend import Module, BackendConfig, LazyBrowser
 from weboob.capabilities.job import CapJob
 from weboob.tools.value import Value
 from weboob.tools.ordereddict import OrderedDict
 
-from .browser import MonsterBrowser
 from .job import MonsterJobAdvert
 
 __all__ = ['MonsterModule']
@@ -37,7 +36,7 @@ class MonsterModule(Module, CapJob):
     LICENSE = 'AGPLv3+'
     VERSION = '1.0'
 
-    BROWSER = MonsterBrowser
+    BROWSER = LazyBrowser('.browser', 'MonsterBrowser')
 
     type_contrat_choices = OrderedDict([(k, u'%s' % (v)) for k, v in sorted({
         '97': u'Interim ou CDD ou mission',
@@ -18,8 +18,7 @@
 
 from weboob.capabilities.radio import CapRadio, Radio
 from weboob.capabilities.collection import CapCollection
-from weboob.tools.backend import Module
-from .browser import NectarineBrowser
+from weboob.tools.backend import Module, LazyBrowser
 
 __all__ = ['NectarineModule']
 
@@ -32,7 +31,7 @@ class NectarineModule(Module, CapRadio, CapCollection):
     # License of your module
     LICENSE = 'AGPLv3+'
 
-    BROWSER = NectarineBrowser
+    BROWSER = LazyBrowser('.browser', 'NectarineBrowser')
 
     def iter_resources(self, objs, split_path):
         if Radio in objs:
@@ -20,11 +20,9 @@
 
 
 from weboob.capabilities.bill import CapBill, Subscription, SubscriptionNotFound, Detail
-from weboob.tools.backend import Module, BackendConfig
+from weboob.tools.backend import Module, BackendConfig, LazyBrowser
 from weboob.tools.value import ValueBackendPassword
 
-from .browser import Nettokom
-
 
 __all__ = ['NettoKomModule']
 
@@ -43,7 +41,7 @@ class NettoKomModule(Module, CapBill):
                            ValueBackendPassword('password',
                                                 label='Password')
                           )
-    BROWSER = Nettokom
+    BROWSER = LazyBrowser('.browser', 'Nettokom')
 
     def create_default_browser(self):
         return self.create_browser(self.config['login'].get(),
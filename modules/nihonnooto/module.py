@@ -18,8 +18,7 @@
 
 from weboob.capabilities.radio import CapRadio, Radio
 from weboob.capabilities.collection import CapCollection
-from weboob.tools.backend import Module
-from .browser import NihonNoOtoBrowser
+from weboob.tools.backend import Module, LazyBrowser
 
 __all__ = ['NihonNoOtoModule']
 
@@ -32,7 +31,7 @@ class NihonNoOtoModule(Module, CapRadio, CapCollection):
     # License of your module
     LICENSE = 'AGPLv3+'
 
-    BROWSER = NihonNoOtoBrowser
+    BROWSER = LazyBrowser('.browser', 'NihonNoOtoBrowser')
     _RADIOS = {'nihonnooto': (u'Nihon no OTO', True) }
 
     def iter_resources(self, objs, split_path):
@@ -21,9 +21,8 @@
 from weboob.capabilities.video import CapVideo, BaseVideo
 from weboob.capabilities.collection import CapCollection, CollectionNotFound, Collection
 from weboob.tools.value import Value, ValueBackendPassword
-from weboob.tools.backend import Module, BackendConfig
+from weboob.tools.backend import Module, BackendConfig, LazyBrowser
 
-from .browser import NolifeTVBrowser
 from .video import NolifeTVVideo
 
 import urllib, time
@@ -38,7 +37,7 @@ class NolifeTVModule(Module, CapVideo, CapCollection):
     VERSION = '1.0'
     DESCRIPTION = 'NolifeTV French video streaming website'
     LICENSE = 'AGPLv3+'
-    BROWSER = NolifeTVBrowser
+    BROWSER = LazyBrowser('.browser', 'NolifeTVBrowser')
     CONFIG = BackendConfig(Value('username',                label='Username', default=''),
                            ValueBackendPassword('password', label='Password', default=''),
                            Value('quality', label='Quality',
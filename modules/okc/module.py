@@ -27,11 +27,10 @@ from dateutil.parser import parse as _parse_dt
 from weboob.capabilities.messages import CapMessages, CapMessagesPost, Message, Thread
 from weboob.capabilities.dating import CapDating, OptimizationNotFound, Event
 from weboob.capabilities.contact import CapContact, ContactPhoto, Contact, Query, QueryError
-from weboob.tools.backend import Module, BackendConfig
+from weboob.tools.backend import Module, BackendConfig, LazyBrowser
 from weboob.tools.value import Value, ValueBackendPassword
 from weboob.tools.date import local2utc
 
-from .browser import OkCBrowser
 from .optim.profiles_walker import ProfilesWalker
 
 
@@ -77,7 +76,7 @@ class OkCModule(Module, CapMessages, CapContact, CapMessagesPost, CapDating):
                'sluts': {},
                #'notes': {},
               }
-    BROWSER = OkCBrowser
+    BROWSER = LazyBrowser('.browser', 'OkCBrowser')
 
     def create_default_browser(self):
         return self.create_browser(self.config['username'].get(), self.config['password'].get())
@@ -21,11 +21,9 @@
 
 from weboob.capabilities.bank import CapBank, AccountNotFound
 from weboob.capabilities.base import find_object
-from weboob.tools.backend import Module, BackendConfig
+from weboob.tools.backend import Module, BackendConfig, LazyBrowser
 from weboob.tools.value import ValueBackendPassword
 
-from .browser import OneyBrowser
-
 
 __all__ = ['OneyModule']
 
@@ -39,7 +37,7 @@ class OneyModule(Module, CapBank):
     DESCRIPTION = 'Oney'
     CONFIG = BackendConfig(ValueBackendPassword('login',      label='Identifiant', masked=False),
                            ValueBackendPassword('password',   label='Mot de passe'))
-    BROWSER = OneyBrowser
+    BROWSER = LazyBrowser('.browser', 'OneyBrowser')
 
     def create_default_browser(self):
         return self.create_browser(self.config['login'].get(),
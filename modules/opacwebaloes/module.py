@@ -21,11 +21,9 @@
 
 
 from weboob.capabilities.library import CapBook
-from weboob.tools.backend import Module, BackendConfig
+from weboob.tools.backend import Module, BackendConfig, LazyBrowser
 from weboob.tools.value import ValueBackendPassword, Value
 
-from .browser import AloesBrowser
-
 
 __all__ = ['AloesModule']
 
@@ -41,7 +39,7 @@ class AloesModule(Module, CapBook):
                            ValueBackendPassword('password', label='Password of account'),
                            Value('baseurl',    label='Base URL')
                            )
-    BROWSER = AloesBrowser
+    BROWSER = LazyBrowser('.browser', 'AloesBrowser')
 
     def create_default_browser(self):
         return self.create_browser(self.config['baseurl'].get(),
@@ -19,9 +19,7 @@
 
 from weboob.capabilities.subtitle import CapSubtitle, LanguageNotSupported, Subtitle
 from weboob.applications.suboob.suboob import LANGUAGE_CONV
-from weboob.tools.backend import Module
-
-from .browser import OpensubtitlesBrowser
+from weboob.tools.backend import Module, LazyBrowser
 
 from urllib import quote_plus
 
@@ -35,7 +33,7 @@ class OpensubtitlesModule(Module, CapSubtitle):
     VERSION = '1.0'
     DESCRIPTION = 'Opensubtitles subtitle website'
     LICENSE = 'AGPLv3+'
-    BROWSER = OpensubtitlesBrowser
+    BROWSER = LazyBrowser('.browser', 'OpensubtitlesBrowser')
 
     def get_subtitle(self, id):
         return self.browser.get_subtitle(id)
@@ -22,11 +22,9 @@
 
 from weboob.capabilities.messages import CantSendMessage, CapMessages, CapMessagesPost
 from weboob.capabilities.account import CapAccount, StatusField
-from weboob.tools.backend import Module, BackendConfig
+from weboob.tools.backend import Module, BackendConfig, LazyBrowser
 from weboob.tools.value import ValueBackendPassword, Value
 
-from .browser import OrangeBrowser
-
 
 __all__ = ['OrangeModule']
 
@@ -42,7 +40,7 @@ class OrangeModule(Module, CapAccount, CapMessages, CapMessagesPost):
                            ValueBackendPassword('password', label='Password'),
                            Value('phonenumber', Label='Phone number')
                            )
-    BROWSER = OrangeBrowser
+    BROWSER = LazyBrowser('.browser', 'OrangeBrowser')
     ACCOUNT_REGISTER_PROPERTIES = None
 
     def create_default_browser(self):
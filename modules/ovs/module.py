@@ -17,14 +17,12 @@
 # You should have received a copy of the GNU Affero General Public License
 # along with weboob. If not, see <http://www.gnu.org/licenses/>.
 
-from weboob.tools.backend import Module, BackendConfig
+from weboob.tools.backend import Module, BackendConfig, LazyBrowser
 from weboob.tools.browser import BrowserForbidden
 from weboob.tools.value import Value, ValueBackendPassword
 from weboob.capabilities.messages import CapMessages, CapMessagesPost, Message
 from weboob.capabilities.contact import CapContact
 
-from .browser import OvsBrowser
-
 
 __all__ = ['OvsModule']
 
@@ -71,7 +69,7 @@ class OvsModule(Module, CapMessages, CapMessagesPost, CapContact):
                            ValueBackendPassword('password', label='Password', default=''),
                            Value('city',                    label='City (subdomain)', default='paris', choices=CITIES))
 
-    BROWSER = OvsBrowser
+    BROWSER = LazyBrowser('.browser', 'OvsBrowser')
 
     STORAGE = {'seen': {}}
 
@@ -20,9 +20,7 @@
 
 
 from weboob.capabilities.housing import CapHousing, City, Housing, HousingPhoto
-from weboob.tools.backend import Module
-
-from .browser import PapBrowser
+from weboob.tools.backend import Module, LazyBrowser
 
 
 __all__ = ['PapModule']
@@ -35,7 +33,7 @@ class PapModule(Module, CapHousing):
     VERSION = '1.0'
     DESCRIPTION = 'French housing website'
     LICENSE = 'AGPLv3+'
-    BROWSER = PapBrowser
+    BROWSER = LazyBrowser('.browser', 'PapBrowser')
 
     def search_housings(self, query):
         cities = [c.id for c in query.cities if c.backend == self.name]
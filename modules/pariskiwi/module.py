@@ -18,12 +18,10 @@
 # along with weboob. If not, see <http://www.gnu.org/licenses/>.
 
 
-from weboob.tools.backend import Module
+from weboob.tools.backend import Module, LazyBrowser
 from weboob.capabilities.calendar import CapCalendarEvent, BaseCalendarEvent, CATEGORIES, TRANSP, STATUS
 from datetime import datetime, time
 
-from .browser import ParisKiwiBrowser
-
 
 __all__ = ['ParisKiwiModule']
 
@@ -36,7 +34,7 @@ class ParisKiwiModule(Module, CapCalendarEvent):
     LICENSE = 'AGPLv3+'
     VERSION = '1.0'
 
-    BROWSER = ParisKiwiBrowser
+    BROWSER = LazyBrowser('.browser', 'ParisKiwiBrowser')
 
     ASSOCIATED_CATEGORIES = [CATEGORIES.CONCERT]
 
@@ -18,9 +18,7 @@
 # along with weboob. If not, see <http://www.gnu.org/licenses/>.
 
 from weboob.capabilities.lyrics import CapLyrics, SongLyrics
-from weboob.tools.backend import Module
-
-from .browser import ParolesmaniaBrowser
+from weboob.tools.backend import Module, LazyBrowser
 
 from urllib import quote_plus
 
@@ -34,7 +32,7 @@ class ParolesmaniaModule(Module, CapLyrics):
     VERSION = '1.0'
     DESCRIPTION = 'Paroles Mania lyrics website'
     LICENSE = 'AGPLv3+'
-    BROWSER = ParolesmaniaBrowser
+    BROWSER = LazyBrowser('.browser', 'ParolesmaniaBrowser')
 
     def get_lyrics(self, id):
         return self.browser.get_lyrics(id)
@@ -18,9 +18,7 @@
 # along with weboob. If not, see <http://www.gnu.org/licenses/>.
 
 from weboob.capabilities.lyrics import CapLyrics, SongLyrics
-from weboob.tools.backend import Module
-
-from .browser import ParolesmusiqueBrowser
+from weboob.tools.backend import Module, LazyBrowser
 
 __all__ = ['ParolesmusiqueModule']
 
@@ -32,7 +30,7 @@ class ParolesmusiqueModule(Module, CapLyrics):
     VERSION = '1.0'
     DESCRIPTION = 'paroles-musique lyrics website'
     LICENSE = 'AGPLv3+'
-    BROWSER = ParolesmusiqueBrowser
+    BROWSER = LazyBrowser('.browser', 'ParolesmusiqueBrowser')
 
     def get_lyrics(self, id):
         return self.browser.get_lyrics(id)
@@ -18,9 +18,7 @@
 # along with weboob. If not, see <http://www.gnu.org/licenses/>.
 
 from weboob.capabilities.lyrics import CapLyrics, SongLyrics
-from weboob.tools.backend import Module
-
-from .browser import ParolesnetBrowser
+from weboob.tools.backend import Module, LazyBrowser
 
 __all__ = ['ParolesnetModule']
 
@@ -32,7 +30,7 @@ class ParolesnetModule(Module, CapLyrics):
     VERSION = '1.0'
     DESCRIPTION = 'paroles.net lyrics website'
     LICENSE = 'AGPLv3+'
-    BROWSER = ParolesnetBrowser
+    BROWSER = LazyBrowser('.browser', 'ParolesnetBrowser')
 
     def get_lyrics(self, id):
         return self.browser.get_lyrics(id)
@@ -19,11 +19,9 @@
 
 
 from weboob.capabilities.bank import CapBank, AccountNotFound
-from weboob.tools.backend import Module, BackendConfig
+from weboob.tools.backend import Module, BackendConfig, LazyBrowser
 from weboob.tools.value import ValueBackendPassword
 
-from .browser import Paypal
-
 
 __all__ = ['PaypalModule']
 
@@ -37,7 +35,7 @@ class PaypalModule(Module, CapBank):
     DESCRIPTION = u'PayPal'
     CONFIG = BackendConfig(ValueBackendPassword('login',      label='E-mail', masked=False),
                            ValueBackendPassword('password',   label='Password'))
-    BROWSER = Paypal
+    BROWSER = LazyBrowser('.browser', 'Paypal')
 
     def create_default_browser(self):
         return self.create_browser(self.config['login'].get(),
@@ -20,13 +20,12 @@
 
 
 
-from weboob.tools.backend import Module, BackendConfig
+from weboob.tools.backend import Module, BackendConfig, LazyBrowser
 from weboob.tools.newsfeed import Newsfeed
 from weboob.tools.value import Value, ValueInt, ValueBackendPassword
 from weboob.tools.misc import limit
 from weboob.capabilities.messages import CapMessages, CapMessagesPost, Message, Thread, CantSendMessage
 
-from .browser import PhpBB
 from .tools import rssid, url2id, id2url, id2topic
 
 
@@ -46,7 +45,7 @@ class PhpBBModule(Module, CapMessages, CapMessagesPost):
                            ValueInt('thread_unread_messages', label='Limit number of unread messages to retrieve for a thread', default=500)
                           )
     STORAGE = {'seen': {}}
-    BROWSER = PhpBB
+    BROWSER = LazyBrowser('.browser', 'PhpBB')
 
     def create_default_browser(self):
         username = self.config['username'].get()
@@ -18,12 +18,10 @@
 # along with weboob. If not, see <http://www.gnu.org/licenses/>.
 
 from weboob.capabilities.torrent import CapTorrent, MagnetOnly, Torrent
-from weboob.tools.backend import Module, BackendConfig
+from weboob.tools.backend import Module, BackendConfig, LazyBrowser
 from weboob.tools.value import Value
 from weboob.capabilities.base import NotAvailable
 
-from .browser import PiratebayBrowser
-
 
 __all__ = ['PiratebayModule']
 
@@ -35,7 +33,7 @@ class PiratebayModule(Module, CapTorrent):
     VERSION = '1.0'
     DESCRIPTION = 'The Pirate Bay BitTorrent tracker'
     LICENSE = 'AGPLv3+'
-    BROWSER = PiratebayBrowser
+    BROWSER = LazyBrowser('.browser', 'PiratebayBrowser')
     CONFIG = BackendConfig(Value('proxybay', label='Use a Proxy Bay', regexp=r'https?://.*', default='', required=False))
 
     def create_default_browser(self):
@@ -18,13 +18,11 @@
 # along with weboob. If not, see <http://www.gnu.org/licenses/>.
 
 
-from weboob.tools.backend import Module
+from weboob.tools.backend import Module, LazyBrowser
 from weboob.capabilities.paste import CapPaste, BasePaste
 from weboob.tools.capabilities.paste import image_mime
 import re
 
-from .browser import PixtoilelibreBrowser
-
 
 __all__ = ['PixtoilelibreModule']
 
@@ -43,7 +41,7 @@ class PixtoilelibreModule(Module, CapPaste):
     LICENSE = 'AGPLv3+'
     VERSION = '1.0'
 
-    BROWSER = PixtoilelibreBrowser
+    BROWSER = LazyBrowser('.browser', 'PixtoilelibreBrowser')
 
     def can_post(self, contents, title=None, public=None, max_age=None):
         if re.search(r'[^a-zA-Z0-9=+/\s]', contents):
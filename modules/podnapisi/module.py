@@ -19,9 +19,7 @@
 
 from weboob.capabilities.subtitle import CapSubtitle, LanguageNotSupported, Subtitle
 from weboob.applications.suboob.suboob import LANGUAGE_CONV
-from weboob.tools.backend import Module
-
-from .browser import PodnapisiBrowser
+from weboob.tools.backend import Module, LazyBrowser
 
 from urllib import quote_plus
 
@@ -35,7 +33,7 @@ class PodnapisiModule(Module, CapSubtitle):
     VERSION = '1.0'
     DESCRIPTION = 'Podnapisi movies and tv series subtitle website'
     LICENSE = 'AGPLv3+'
-    BROWSER = PodnapisiBrowser
+    BROWSER = LazyBrowser('.browser', 'PodnapisiBrowser')
 
     def get_subtitle(self, id):
         return self.browser.get_subtitle(id)
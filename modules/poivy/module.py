@@ -20,11 +20,9 @@
 
 from weboob.capabilities.bill import CapBill, Subscription, SubscriptionNotFound, Detail
 from weboob.capabilities.base import find_object
-from weboob.tools.backend import Module, BackendConfig
+from weboob.tools.backend import Module, BackendConfig, LazyBrowser
 from weboob.tools.value import ValueBackendPassword
 
-from .browser import PoivyBrowser
-
 
 __all__ = ['PoivyModule']
 
@@ -42,7 +40,7 @@ class PoivyModule(Module, CapBill):
                            ValueBackendPassword('password',
                                                 label='Password')
                            )
-    BROWSER = PoivyBrowser
+    BROWSER = LazyBrowser('.browser', 'PoivyBrowser')
 
     def create_default_browser(self):
         return self.create_browser(self.config['login'].get(),
@@ -18,12 +18,11 @@
 # along with weboob. If not, see <http://www.gnu.org/licenses/>.
 
 
-from weboob.tools.backend import Module, BackendConfig
+from weboob.tools.backend import Module, BackendConfig, LazyBrowser
 from weboob.capabilities.job import CapJob
 from weboob.tools.value import Value
 from weboob.tools.ordereddict import OrderedDict
 
-from .browser import PopolemploiBrowser
 from .job import PopolemploiJobAdvert
 
 __all__ = ['PopolemploiModule']
@@ -36,7 +35,7 @@ class PopolemploiModule(Module, CapJob):
     EMAIL = 'carton_ben@yahoo.fr'
     VERSION = '1.0'
 
-    BROWSER = PopolemploiBrowser
+    BROWSER = LazyBrowser('.browser', 'PopolemploiBrowser')
 
     places_choices = OrderedDict([(k, u'%s' % (v)) for k, v in sorted({
         '100|FRANCE|O1': u'France entière',
@@ -20,9 +20,8 @@
 
 from weboob.capabilities.messages import CapMessages, Thread
 from weboob.tools.capabilities.messages.GenericModule import GenericNewspaperModule
-from weboob.tools.backend import BackendConfig
+from weboob.tools.backend import BackendConfig, LazyBrowser
 from weboob.tools.value import Value
-from .browser import NewspaperPresseuropBrowser
 from .tools import rssid, url2id
 from weboob.tools.newsfeed import Newsfeed
 
@@ -35,7 +34,7 @@ class NewspaperPresseuropModule(GenericNewspaperModule, CapMessages):
     STORAGE = {'seen': {}}
     NAME = 'presseurop'
     DESCRIPTION = u'Presseurop website'
-    BROWSER = NewspaperPresseuropBrowser
+    BROWSER = LazyBrowser('.browser', 'NewspaperPresseuropBrowser')
     RSSID = staticmethod(rssid)
     URL2ID = staticmethod(url2id)
     RSSSIZE = 300
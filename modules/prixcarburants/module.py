@@ -17,12 +17,10 @@
 # You should have received a copy of the GNU Affero General Public License
 # along with weboob. If not, see <http://www.gnu.org/licenses/>.
 
-from weboob.tools.backend import Module, BackendConfig
+from weboob.tools.backend import Module, BackendConfig, LazyBrowser
 from weboob.tools.value import Value
 from weboob.capabilities.pricecomparison import CapPriceComparison, Price, Product
 
-from .browser import PrixCarburantsBrowser
-
 
 __all__ = ['PrixCarburantsModule']
 
@@ -34,7 +32,7 @@ class PrixCarburantsModule(Module, CapPriceComparison):
     VERSION = '1.0'
     DESCRIPTION = 'French governement website to compare fuel prices'
     LICENSE = 'AGPLv3+'
-    BROWSER = PrixCarburantsBrowser
+    BROWSER = LazyBrowser('.browser', 'PrixCarburantsBrowser')
     CONFIG = BackendConfig(Value('zipcode', label='Zipcode', regexp='\d+'))
 
     def search_products(self, pattern=None):
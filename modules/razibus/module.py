@@ -18,12 +18,11 @@
 # along with weboob. If not, see <http://www.gnu.org/licenses/>.
 
 
-from weboob.tools.backend import Module, BackendConfig
+from weboob.tools.backend import Module, BackendConfig, LazyBrowser
 from weboob.capabilities.calendar import CapCalendarEvent, CATEGORIES
 from weboob.tools.ordereddict import OrderedDict
 from weboob.tools.value import Value
 
-from .browser import RazibusBrowser
 from .calendar import RazibusCalendarEvent
 
 __all__ = ['RazibusModule']
@@ -37,7 +36,7 @@ class RazibusModule(Module, CapCalendarEvent):
     LICENSE = 'AGPLv3+'
     VERSION = '1.0'
     ASSOCIATED_CATEGORIES = [CATEGORIES.CONCERT]
-    BROWSER = RazibusBrowser
+    BROWSER = LazyBrowser('.browser', 'RazibusBrowser')
 
     region_choices = OrderedDict([(k, u'%s' % (v)) for k, v in sorted({
         '': u'-- Indifférent --',
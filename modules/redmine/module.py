@@ -25,12 +25,10 @@ from weboob.capabilities.bugtracker import CapBugTracker, Issue, Project, User,
                                            Version, Status, Update, Attachment, \
                                            Query, Change
 from weboob.capabilities.collection import CapCollection, Collection, CollectionNotFound
-from weboob.tools.backend import Module, BackendConfig
+from weboob.tools.backend import Module, BackendConfig, LazyBrowser
 from weboob.tools.exceptions import BrowserHTTPNotFound
 from weboob.tools.value import ValueBackendPassword, Value
 
-from .browser import RedmineBrowser
-
 
 __all__ = ['RedmineModule']
 
@@ -45,7 +43,7 @@ class RedmineModule(Module, CapContent, CapBugTracker, CapCollection):
     CONFIG = BackendConfig(Value('url',      label='URL of the Redmine website', regexp=r'https?://.*'),
                            Value('username', label='Login'),
                            ValueBackendPassword('password', label='Password'))
-    BROWSER = RedmineBrowser
+    BROWSER = LazyBrowser('.browser', 'RedmineBrowser')
 
     def create_default_browser(self):
         return self.create_browser(self.config['url'].get(),
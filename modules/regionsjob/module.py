@@ -18,9 +18,8 @@
 # along with weboob. If not, see <http://www.gnu.org/licenses/>.
 
 
-from weboob.tools.backend import Module, BackendConfig
+from weboob.tools.backend import Module, BackendConfig, LazyBrowser
 from weboob.capabilities.job import CapJob, BaseJobAdvert
-from .browser import RegionsjobBrowser
 from weboob.tools.ordereddict import OrderedDict
 from weboob.tools.value import Value
 
@@ -36,7 +35,7 @@ class RegionsjobModule(Module, CapJob):
     LICENSE = 'AGPLv3+'
     VERSION = '1.0'
 
-    BROWSER = RegionsjobBrowser
+    BROWSER = LazyBrowser('.browser', 'RegionsjobBrowser')
 
     website_choices = OrderedDict([(k, u'%s (%s)' % (v, k)) for k, v in sorted({
         'www.centrejob.com': u'CentreJob',
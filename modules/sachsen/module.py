@@ -17,11 +17,10 @@
 # You should have received a copy of the GNU Affero General Public License
 # along with weboob. If not, see <http://www.gnu.org/licenses/>.
 
-from .browser import SachsenBrowser
 from weboob.capabilities.gauge import CapGauge, GaugeSensor, Gauge,\
         SensorNotFound
 from weboob.capabilities.base import find_object
-from weboob.tools.backend import Module
+from weboob.tools.backend import Module, LazyBrowser
 
 
 __all__ = ['SachsenLevelModule']
@@ -34,7 +33,7 @@ class SachsenLevelModule(Module, CapGauge):
     VERSION = '1.0'
     LICENSE = 'AGPLv3+'
     DESCRIPTION = u"Level of Sachsen river"
-    BROWSER = SachsenBrowser
+    BROWSER = LazyBrowser('.browser', 'SachsenBrowser')
 
     def iter_gauges(self, pattern=None):
         if pattern is None:
@@ -18,9 +18,7 @@
 # along with weboob. If not, see <http://www.gnu.org/licenses/>.
 
 from weboob.capabilities.lyrics import CapLyrics, SongLyrics
-from weboob.tools.backend import Module
-
-from .browser import SeeklyricsBrowser
+from weboob.tools.backend import Module, LazyBrowser
 
 from urllib import quote_plus
 
@@ -34,7 +32,7 @@ class SeeklyricsModule(Module, CapLyrics):
     VERSION = '1.0'
     DESCRIPTION = 'SeekLyrics lyrics website'
     LICENSE = 'AGPLv3+'
-    BROWSER = SeeklyricsBrowser
+    BROWSER = LazyBrowser('.browser', 'SeeklyricsBrowser')
 
     def get_lyrics(self, id):
         return self.browser.get_lyrics(id)
@@ -20,9 +20,7 @@
 
 
 from weboob.capabilities.housing import CapHousing, City, Housing, HousingPhoto
-from weboob.tools.backend import Module
-
-from .browser import SeLogerBrowser
+from weboob.tools.backend import Module, LazyBrowser
 
 
 __all__ = ['SeLogerModule']
@@ -36,7 +34,7 @@ class SeLogerModule(Module, CapHousing):
     DESCRIPTION = 'French housing website'
     LICENSE = 'AGPLv3+'
     ICON = 'http://static.poliris.com/z/portail/svx/portals/sv6_gen/favicon.png'
-    BROWSER = SeLogerBrowser
+    BROWSER = LazyBrowser('.browser', 'SeLogerBrowser')
 
     def search_housings(self, query):
         cities = [c.id for c in query.cities if c.backend == self.name]
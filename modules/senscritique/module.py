@@ -17,12 +17,11 @@
 # You should have received a copy of the GNU Affero General Public License
 # along with weboob. If not, see <http://www.gnu.org/licenses/>.
 
-from weboob.tools.backend import Module, BackendConfig
+from weboob.tools.backend import Module, BackendConfig, LazyBrowser
 from weboob.tools.ordereddict import OrderedDict
 from weboob.tools.value import Value, ValueBool
 from weboob.capabilities.calendar import CapCalendarEvent, CATEGORIES
 
-from .browser import SenscritiqueBrowser
 from .calendar import SensCritiquenCalendarEvent
 
 __all__ = ['SenscritiqueModule']
@@ -36,7 +35,7 @@ class SenscritiqueModule(Module, CapCalendarEvent):
     LICENSE = 'AGPLv3+'
     VERSION = '1.0'
     ASSOCIATED_CATEGORIES = [CATEGORIES.TELE]
-    BROWSER = SenscritiqueBrowser
+    BROWSER = LazyBrowser('.browser', 'SenscritiqueBrowser')
 
     tv_settings_choices = OrderedDict([(k, u'%s' % (v)) for k, v in sorted({
         '000000': u'-- Indifférent --',
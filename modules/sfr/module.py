@@ -22,11 +22,9 @@
 
 from weboob.capabilities.messages import CantSendMessage, CapMessages, CapMessagesPost
 from weboob.capabilities.account import CapAccount, StatusField
-from weboob.tools.backend import Module, BackendConfig
+from weboob.tools.backend import Module, BackendConfig, LazyBrowser
 from weboob.tools.value import Value, ValueBackendPassword
 
-from .browser import SfrBrowser
-
 
 __all__ = ['SfrModule']
 
@@ -40,7 +38,7 @@ class SfrModule(Module, CapAccount, CapMessages, CapMessagesPost):
     LICENSE = 'AGPLv3+'
     CONFIG = BackendConfig(Value('login', label='Login'),
                            ValueBackendPassword('password', label='Password'))
-    BROWSER = SfrBrowser
+    BROWSER = LazyBrowser('.browser', 'SfrBrowser')
     ACCOUNT_REGISTER_PROPERTIES = None
 
     def create_default_browser(self):
@@ -18,12 +18,10 @@
 # along with weboob. If not, see <http://www.gnu.org/licenses/>.
 
 
-from weboob.tools.backend import Module
+from weboob.tools.backend import Module, LazyBrowser
 from weboob.capabilities.calendar import CapCalendarEvent, BaseCalendarEvent, CATEGORIES, TRANSP, STATUS
 import datetime
 
-from .browser import SueurDeMetalBrowser
-
 
 __all__ = ['SueurDeMetalModule']
 
@@ -42,7 +40,7 @@ class SueurDeMetalModule(Module, CapCalendarEvent):
     LICENSE = 'AGPLv3+'
     VERSION = '1.0'
 
-    BROWSER = SueurDeMetalBrowser
+    BROWSER = LazyBrowser('.browser', 'SueurDeMetalBrowser')
 
     ASSOCIATED_CATEGORIES = [CATEGORIES.CONCERT]
 
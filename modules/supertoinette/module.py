@@ -18,9 +18,7 @@
 # along with weboob. If not, see <http://www.gnu.org/licenses/>.
 
 from weboob.capabilities.recipe import CapRecipe, Recipe
-from weboob.tools.backend import Module
-
-from .browser import SupertoinetteBrowser
+from weboob.tools.backend import Module, LazyBrowser
 
 __all__ = ['SupertoinetteModule']
 
@@ -32,7 +30,7 @@ class SupertoinetteModule(Module, CapRecipe):
     VERSION = '1.0'
     DESCRIPTION = u'Super Toinette, la cuisine familiale French recipe website'
     LICENSE = 'AGPLv3+'
-    BROWSER = SupertoinetteBrowser
+    BROWSER = LazyBrowser('.browser', 'SupertoinetteBrowser')
 
     def get_recipe(self, id):
         return self.browser.get_recipe(id)
@@ -20,7 +20,7 @@
 
 from weboob.capabilities.messages import CapMessages
 from weboob.tools.capabilities.messages.GenericModule import GenericNewspaperModule
-from .browser import NewspaperTazBrowser
+from weboob.tools.backend import LazyBrowser
 from .tools import rssid, url2id
 
 
@@ -32,7 +32,7 @@ class NewspaperTazModule(GenericNewspaperModule, CapMessages):
     STORAGE = {'seen': {}}
     NAME = 'taz'
     DESCRIPTION = u'Taz newspaper website'
-    BROWSER = NewspaperTazBrowser
+    BROWSER = LazyBrowser('.browser', 'NewspaperTazBrowser')
     RSSID = staticmethod(rssid)
     URL2ID = staticmethod(url2id)
     RSSSIZE = 30
@@ -19,9 +19,7 @@
 # along with weboob. If not, see <http://www.gnu.org/licenses/>.
 
 from weboob.capabilities.travel import CapTravel
-from weboob.tools.backend import Module
-
-from .browser import Transilien
+from weboob.tools.backend import Module, LazyBrowser
 
 
 class TransilienModule(Module, CapTravel):
@@ -31,7 +29,7 @@ class TransilienModule(Module, CapTravel):
     VERSION = '1.0'
     LICENSE = 'AGPLv3+'
     DESCRIPTION = u"Public transportation in the Paris area"
-    BROWSER = Transilien
+    BROWSER = LazyBrowser('.browser', 'Transilien')
 
     def iter_station_search(self, pattern):
         return self.browser.get_stations(pattern)
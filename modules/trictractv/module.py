@@ -22,9 +22,8 @@
 
 
 from weboob.capabilities.video import CapVideo
-from weboob.tools.backend import Module
+from weboob.tools.backend import Module, LazyBrowser
 
-from .browser import TricTracTVBrowser
 from .video import TricTracTVVideo
 
 
@@ -38,7 +37,7 @@ class TricTracTVModule(Module, CapVideo):
     VERSION = '1.0'
     DESCRIPTION = u'TricTrac.tv video website'
     LICENSE = 'AGPLv3+'
-    BROWSER = TricTracTVBrowser
+    BROWSER = LazyBrowser('.browser', 'TricTracTVBrowser')
 
     def get_video(self, _id):
         with self.browser:
@@ -19,12 +19,11 @@
 
 from datetime import datetime, timedelta
 from weboob.tools.value import Value, ValueBackendPassword
-from weboob.tools.backend import Module, BackendConfig
+from weboob.tools.backend import Module, BackendConfig, LazyBrowser
 from weboob.capabilities.messages import CapMessages, Thread, CapMessagesPost
 from weboob.capabilities.collection import CapCollection, CollectionNotFound, Collection
 from weboob.capabilities.base import find_object
 from weboob.tools.exceptions import BrowserForbidden
-from .browser import TwitterBrowser
 import itertools
 
 __all__ = ['TwitterModule']
@@ -37,7 +36,7 @@ class TwitterModule(Module, CapMessages, CapMessagesPost, CapCollection):
     EMAIL = 'carton_ben@yahoo.fr'
     LICENSE = 'AGPLv3+'
     VERSION = '1.0'
-    BROWSER = TwitterBrowser
+    BROWSER = LazyBrowser('.browser', 'TwitterBrowser')
     STORAGE = {'seen': {}}
 
     CONFIG = BackendConfig(Value('username',                label='Username', default=''),
@@ -18,14 +18,12 @@
 # along with weboob. If not, see <http://www.gnu.org/licenses/>.
 
 
-from weboob.tools.backend import Module
+from weboob.tools.backend import Module, LazyBrowser
 from weboob.capabilities.paste import BasePaste
 from weboob.tools.capabilities.paste import BasePasteModule
 from weboob.tools.capabilities.paste import image_mime
 import re
 
-from .browser import UnseeBrowser
-
 
 __all__ = ['UnseeModule']
 
@@ -44,7 +42,7 @@ class UnseeModule(Module, BasePasteModule):
     LICENSE = 'AGPLv3+'
     VERSION = '1.0'
 
-    BROWSER = UnseeBrowser
+    BROWSER = LazyBrowser('.browser', 'UnseeBrowser')
 
     EXPIRATIONS = {3600: 'hour', 86400: 'day', 86400 * 7: 'week'}
 
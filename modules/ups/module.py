@@ -19,9 +19,7 @@
 
 
 from weboob.capabilities.parcel import CapParcel
-from weboob.tools.backend import Module
-
-from .browser import UpsBrowser
+from weboob.tools.backend import Module, LazyBrowser
 
 
 __all__ = ['UpsModule']
@@ -34,7 +32,7 @@ class UpsModule(Module, CapParcel):
     EMAIL = 'romain@weboob.org'
     VERSION = '1.0'
 
-    BROWSER = UpsBrowser
+    BROWSER = LazyBrowser('.browser', 'UpsBrowser')
 
     def get_parcel_tracking(self, id):
         with self.browser:
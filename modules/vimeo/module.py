@@ -20,11 +20,9 @@
 
 
 from weboob.capabilities.video import CapVideo, BaseVideo
-from weboob.tools.backend import Module
+from weboob.tools.backend import Module, LazyBrowser
 from weboob.capabilities.collection import CapCollection, CollectionNotFound
 
-from .browser import VimeoBrowser
-
 import re
 
 __all__ = ['VimeoModule']
@@ -37,7 +35,7 @@ class VimeoModule(Module, CapVideo, CapCollection):
     VERSION = '1.0'
     DESCRIPTION = 'Vimeo video streaming website'
     LICENSE = 'AGPLv3+'
-    BROWSER = VimeoBrowser
+    BROWSER = LazyBrowser('.browser', 'VimeoBrowser')
 
     SORTBY = ['relevance', 'rating', 'views', 'time']
 
@@ -18,12 +18,10 @@
 # along with weboob. If not, see <http://www.gnu.org/licenses/>.
 import re
 
-from weboob.tools.backend import Module
+from weboob.tools.backend import Module, LazyBrowser
 from weboob.capabilities.base import find_object
 from weboob.capabilities.gauge import CapGauge, GaugeSensor, Gauge, SensorNotFound
 
-from .browser import VlilleBrowser
-
 __all__ = ['VlilleModule']
 
 
@@ -34,7 +32,7 @@ class VlilleModule(Module, CapGauge):
     EMAIL = 'carton_ben@yahoo.fr'
     VERSION = '1.0'
 
-    BROWSER = VlilleBrowser
+    BROWSER = LazyBrowser('.browser', 'VlilleBrowser')
 
     def iter_gauges(self, pattern=None):
         if pattern is None:
@@ -18,14 +18,12 @@
 # along with weboob. If not, see <http://www.gnu.org/licenses/>.
 
 
-from weboob.tools.backend import Module, BackendConfig
+from weboob.tools.backend import Module, BackendConfig, LazyBrowser
 from weboob.tools.ordereddict import OrderedDict
 from weboob.tools.value import Value
 from weboob.capabilities.travel import CapTravel, Station, Departure
 from weboob.capabilities import UserError
 
-from .browser import VoyagesSNCFBrowser
-
 
 __all__ = ['VoyagesSNCFModule']
 
@@ -69,7 +67,7 @@ class VoyagesSNCFModule(Module, CapTravel):
                                  choices=OrderedDict((('1', u'1e classe'),
                                                       ('2', u'2e classe')))))
 
-    BROWSER = VoyagesSNCFBrowser
+    BROWSER = LazyBrowser('.browser', 'VoyagesSNCFBrowser')
     STATIONS = []
 
     def _populate_stations(self):
@@ -19,9 +19,7 @@
 
 
 from weboob.capabilities.weather import CapWeather
-from weboob.tools.backend import Module
-
-from .browser import WeatherBrowser
+from weboob.tools.backend import Module, LazyBrowser
 
 __all__ = ['WeatherModule']
 
@@ -33,7 +31,7 @@ class WeatherModule(Module, CapWeather):
     VERSION = '1.0'
     DESCRIPTION = 'Get forecasts from weather.com'
     LICENSE = 'AGPLv3+'
-    BROWSER = WeatherBrowser
+    BROWSER = LazyBrowser('.browser', 'WeatherBrowser')
 
     def iter_city_search(self, pattern):
         return self.browser.iter_city_search(pattern)
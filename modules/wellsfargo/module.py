@@ -19,11 +19,9 @@
 
 
 from weboob.capabilities.bank import CapBank
-from weboob.tools.backend import Module, BackendConfig
+from weboob.tools.backend import Module, BackendConfig, LazyBrowser
 from weboob.tools.value import ValueBackendPassword
 
-from .browser import WellsFargo
-
 
 __all__ = ['WellsFargoModule']
 
@@ -37,7 +35,7 @@ class WellsFargoModule(Module, CapBank):
     DESCRIPTION = u'Wells Fargo'
     CONFIG = BackendConfig(ValueBackendPassword('login',      label='Username', masked=False),
                            ValueBackendPassword('password',   label='Password'))
-    BROWSER = WellsFargo
+    BROWSER = LazyBrowser('.browser', 'WellsFargo')
 
     def create_default_browser(self):
         return self.create_browser(self.config['login'].get(),
@@ -20,9 +20,7 @@
 
 
 from weboob.capabilities.translate import CapTranslate, Translation, TranslationFail, LanguageNotSupported
-from weboob.tools.backend import Module
-
-from .browser import WordReferenceBrowser
+from weboob.tools.backend import Module, LazyBrowser
 
 
 __all__ = ['WordReferenceModule']
@@ -35,7 +33,7 @@ class WordReferenceModule(Module, CapTranslate):
     LICENSE = 'AGPLv3+'
     NAME = 'wordreference'
     DESCRIPTION = u'Free online translator'
-    BROWSER = WordReferenceBrowser
+    BROWSER = LazyBrowser('.browser', 'WordReferenceBrowser')
     WRLANGUAGE = {
         'Arabic':'ar', 'Chinese':'zh', 'Czech':'cz', 'English':'en', 'French':'fr', 'Greek':'gr',
         'Italian':'it', 'Japanese':'ja', 'Korean':'ko', 'Polish':'pl', 'Portuguese':'pt',
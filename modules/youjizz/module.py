@@ -22,9 +22,7 @@
 
 from weboob.capabilities.video import CapVideo, BaseVideo
 from weboob.capabilities.collection import CapCollection, CollectionNotFound
-from weboob.tools.backend import Module
-
-from .browser import YoujizzBrowser
+from weboob.tools.backend import Module, LazyBrowser
 
 
 __all__ = ['YoujizzModule']
@@ -37,7 +35,7 @@ class YoujizzModule(Module, CapVideo, CapCollection):
     VERSION = '1.0'
     DESCRIPTION = 'YouJizz pornographic video streaming website'
     LICENSE = 'AGPLv3+'
-    BROWSER = YoujizzBrowser
+    BROWSER = LazyBrowser('.browser', 'YoujizzBrowser')
 
     def get_video(self, _id):
         video = self.browser.get_video(_id)
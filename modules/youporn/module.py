@@ -21,10 +21,9 @@
 
 
 from weboob.capabilities.video import CapVideo, BaseVideo
-from weboob.tools.backend import Module
+from weboob.tools.backend import Module, LazyBrowser
 from weboob.capabilities.collection import CapCollection, CollectionNotFound
 
-from .browser import YoupornBrowser
 from .video import YoupornVideo
 
 
@@ -38,7 +37,7 @@ class YoupornModule(Module, CapVideo, CapCollection):
     VERSION = '1.0'
     DESCRIPTION = 'YouPorn pornographic video streaming website'
     LICENSE = 'AGPLv3+'
-    BROWSER = YoupornBrowser
+    BROWSER = LazyBrowser('.browser', 'YoupornBrowser')
 
     def get_video(self, _id):
         with self.browser:
@@ -33,11 +33,10 @@ from weboob.capabilities.base import NotAvailable
 from weboob.capabilities.image import BaseImage
 from weboob.capabilities.video import CapVideo, BaseVideo
 from weboob.capabilities.collection import CapCollection, CollectionNotFound
-from weboob.tools.backend import Module, BackendConfig
+from weboob.tools.backend import Module, BackendConfig, LazyBrowser
 from weboob.tools.misc import to_unicode
 from weboob.tools.value import ValueBackendPassword, Value
 
-from .browser import YoutubeBrowser
 from .video import YoutubeVideo
 
 
@@ -51,7 +50,7 @@ class YoutubeModule(Module, CapVideo, CapCollection):
     VERSION = '1.0'
     DESCRIPTION = 'YouTube video streaming website'
     LICENSE = 'AGPLv3+'
-    BROWSER = YoutubeBrowser
+    BROWSER = LazyBrowser('.browser', 'YoutubeBrowser')
     CONFIG = BackendConfig(Value('username', label='Email address', default=''),
                            ValueBackendPassword('password', label='Password', default=''))
 
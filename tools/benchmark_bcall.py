@@ -0,0 +1,71 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Measure the latency of WebNip.do() calls.
+
+For each number of backends and each duration of backends (DURATIONS), it
+prints the median and worst time between the moment the last backend has
+returned its result and the end of the iteration on the BackendsCall
+object. Backends taking hundreds of milliseconds, like the ones loading
+web pages, show how long the consumer sleeps before it sees the end of the
+call.
+
+Usage: benchmark_bcall.py [RUNS]
+"""
+from __future__ import print_function
+
+import os
+import sys
+from time import time, sleep
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), os.path.pardir)))
+
+from weboob.core.ouiboube import WebNip
+from weboob.tools.backend import Module
+
+
+# Seconds spent by backends before their result.
+DURATIONS = (0, 0.05, 0.3)
+
+
+class FakeModule(Module):
+    NAME = 'fake'
+
+    def iter_values(self, duration, finished):
+        sleep(duration)
+        yield self.name
+        # Some work after the last result, like checking there is no next page.
+        sleep(0.001)
+        finished.append(time())
+
+
+def measure(weboob, nb_backends, duration, runs):
+    weboob.unload_backends()
+    for i in xrange(nb_backends):
+        name = 'fake%d' % i
+        weboob.backend_instances[name] = FakeModule(weboob, name, {})
+
+    latencies = []
+    for _ in xrange(runs):
+        finished = []
+        for _ in weboob.do('iter_values', duration, finished):
+            pass
+        end = time()
+        latencies.append((end - max(finished)) * 1000)
+
+    latencies.sort()
+    return latencies[len(latencies) // 2], latencies[-1]
+
+
+def main(runs=30):
+    weboob = WebNip(modules_path=False, max_workers=100)
+    print('%-10s %14s %12s %12s' % ('backends', 'duration (ms)', 'median (ms)', 'max (ms)'))
+    for duration in DURATIONS:
+        for nb_backends in (1, 10, 100):
+            median, worst = measure(weboob, nb_backends, duration, runs)
+            print('%-10d %14d %12.3f %12.3f' % (nb_backends, duration * 1000, median, worst))
+    weboob.deinit()
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:2]])
@@ -0,0 +1,61 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Measure the cost of many events in the weboob scheduler.
+
+It schedules EVENTS events (default: 10000) spread over SPREAD seconds
+(default: 2), then prints the time taken to schedule them, the number of
+threads used and how late events have been called.
+
+Usage: benchmark_scheduler.py [EVENTS [SPREAD]]
+"""
+from __future__ import print_function
+
+import os
+import random
+import sys
+import threading
+from time import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), os.path.pardir)))
+
+from weboob.core.scheduler import Scheduler
+
+
+def main(events=10000, spread=2.0):
+    scheduler = Scheduler()
+    lock = threading.Lock()
+    delays = []
+    done = threading.Event()
+    # Threads are sampled when events are called.
+    max_threads = [threading.active_count()]
+
+    def event(expected):
+        with lock:
+            delays.append((time() - expected) * 1000)
+            max_threads[0] = max(max_threads[0], threading.active_count())
+            if len(delays) == events:
+                done.set()
+
+    start = time()
+    for _ in range(events):
+        interval = random.uniform(0, spread)
+        scheduler.schedule(interval, event, time() + interval)
+    scheduled = time() - start
+
+    done.wait(spread * 10)
+    scheduler.want_stop()
+
+    delays.sort()
+    print('events:           %d over %.1f seconds' % (events, spread))
+    print('called:           %d' % len(delays))
+    print('schedule time:    %.3f s' % scheduled)
+    print('max threads:      %d' % max_threads[0])
+    if delays:
+        print('median lateness:  %.3f ms' % delays[len(delays) // 2])
+        print('p99 lateness:     %.3f ms' % delays[int(len(delays) * 0.99)])
+        print('max lateness:     %.3f ms' % delays[-1])
+
+
+if __name__ == '__main__':
+    main(*[float(arg) if i else int(arg) for i, arg in enumerate(sys.argv[1:3])])
@@ -0,0 +1,263 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Measure startup and first command latency of weboob scripts.
+
+Each script of scripts/ (except Qt ones and daemons) is run in a fixture workdir, with
+a local repository which only contains a generated "benchmark" module. This
+module gives canned results in place of website responses, so nothing is
+fetched from network.
+
+For each script, it measures, in seconds since the process was spawned:
+
+- ``prompt``: the interactive prompt is displayed (REPL applications only);
+- ``load_backends``: backends have been loaded;
+- ``first_result``: the first result of a canned command has been given by
+  a backend (scripts listed in COMMANDS only);
+- ``exit``: the process has exited.
+
+A run which lasts more than TIMEOUT seconds is killed, and reported with
+``"timeout": true``.
+
+The median of RUNS runs (default: 5) is printed as one JSON object per
+script and line, to be compared across releases.
+
+Usage: benchmark_startup.py [RUNS [SCRIPT ...]]
+"""
+from __future__ import print_function
+
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+from threading import Timer
+from time import time
+
+PROJECT = os.path.abspath(os.path.join(os.path.dirname(__file__), os.path.pardir))
+sys.path.insert(0, PROJECT)
+
+from weboob.core.ouiboube import WebNip
+
+
+# Scripts which serve forever, and are not measured by default.
+DAEMONS = ('weboobd',)
+
+# Seconds after which a run is killed.
+TIMEOUT = 60
+
+# Canned command of scripts, run after startup was measured.
+COMMANDS = {
+    'boobank':       ['list'],
+    'boobmsg':       ['list'],
+    'videoob':       ['search', 'weboob'],
+    'weboob-cli':    ['CapBank', 'iter_accounts'],
+    'weboob-config': ['list'],
+}
+
+MODULE = '''# -*- coding: utf-8 -*-
+from decimal import Decimal
+
+from weboob.capabilities.bank import CapBank, Account
+from weboob.capabilities.messages import CapMessages, Thread
+from weboob.capabilities.video import CapVideo, BaseVideo
+from weboob.tools.backend import Module
+
+
+class BenchmarkModule(Module, CapBank, CapMessages, CapVideo):
+    NAME = 'benchmark'
+    MAINTAINER = u'Weboob'
+    EMAIL = 'weboob@weboob.org'
+    VERSION = '%(version)s'
+    DESCRIPTION = u'Canned results to measure applications'
+    LICENSE = 'AGPLv3+'
+
+    def iter_accounts(self):
+        for i in range(3):
+            account = Account()
+            account.id = '%%d' %% i
+            account.label = u'Account %%d' %% i
+            account.balance = Decimal('42.%%02d' %% i)
+            account.currency = u'EUR'
+            account.type = Account.TYPE_CHECKING
+            yield account
+
+    def iter_threads(self):
+        for i in range(3):
+            thread = Thread(u'%%d' %% i)
+            thread.title = u'Thread %%d' %% i
+            yield thread
+
+    def search_videos(self, pattern, sortby=CapVideo.SEARCH_RELEVANCE, nsfw=False):
+        for i in range(3):
+            video = BaseVideo(u'%%d' %% i)
+            video.title = u'%%s %%d' %% (pattern, i)
+            yield video
+'''
+
+# Run in the benchmarked process, before the script. It records when
+# steps happen in the file given by WEBOOB_BENCHMARK_REPORT.
+BOOTSTRAP = '''
+import atexit, json, os, runpy, sys
+from cmd import Cmd
+from time import time
+
+from weboob.core.bcall import BackendsCall
+from weboob.core.ouiboube import Weboob
+
+timings = {}
+
+def wrap(klass, method, step, before=False):
+    original = getattr(klass, method)
+    def wrapper(*args, **kwargs):
+        if before:
+            timings.setdefault(step, time())
+        try:
+            return original(*args, **kwargs)
+        finally:
+            timings.setdefault(step, time())
+    setattr(klass, method, wrapper)
+
+wrap(Weboob, 'load_backends', 'load_backends')
+wrap(BackendsCall, 'store_result', 'first_result', before=True)
+wrap(Cmd, 'cmdloop', 'prompt', before=True)
+
+def dump():
+    with open(os.environ['WEBOOB_BENCHMARK_REPORT'], 'w') as fp:
+        json.dump(timings, fp)
+atexit.register(dump)
+
+sys.argv = sys.argv[1:]
+runpy.run_path(sys.argv[0], run_name='__main__')
+'''
+
+
+def create_fixture(path):
+    """
+    Create a workdir with a local repository and a backend of the benchmark
+    module, and return the environment to run scripts in it.
+    """
+    repo = os.path.join(path, 'repository')
+    os.makedirs(os.path.join(repo, 'benchmark'))
+    with open(os.path.join(repo, 'benchmark', '__init__.py'), 'w') as fp:
+        fp.write('from .module import BenchmarkModule\n\n__all__ = [\'BenchmarkModule\']\n')
+    with open(os.path.join(repo, 'benchmark', 'module.py'), 'w') as fp:
+        fp.write(MODULE % {'version': WebNip.VERSION})
+
+    workdir = os.path.join(path, 'config')
+    os.makedirs(workdir)
+    with open(os.path.join(workdir, 'sources.list'), 'w') as fp:
+        fp.write('file://%s\n' % repo)
+    with open(os.path.join(workdir, 'backends'), 'w') as fp:
+        fp.write('[benchmark]\n_module = benchmark\n')
+    os.chmod(os.path.join(workdir, 'backends'), 0o600)
+
+    env = os.environ.copy()
+    env['PYTHONPATH'] = os.pathsep.join(p for p in [PROJECT, os.getenv('PYTHONPATH')] if p)
+    env['WEBOOB_WORKDIR'] = workdir
+    env['WEBOOB_BACKENDS'] = os.path.join(workdir, 'backends')
+    env['XDG_DATA_HOME'] = os.path.join(path, 'data')
+    # Do not ask questions.
+    env['EDITOR'] = 'true'
+
+    with open(os.devnull, 'w') as devnull:
+        subprocess.check_call([sys.executable, os.path.join(PROJECT, 'scripts', 'weboob-config'), 'update'],
+                              env=env, stdout=devnull)
+    return env
+
+
+def run(env, script, args):
+    """
+    Run a script once, and get the times of its steps.
+    """
+    fd, report = tempfile.mkstemp(suffix='.json')
+    os.close(fd)
+    env = dict(env, WEBOOB_BENCHMARK_REPORT=report)
+    try:
+        with open(os.devnull, 'r+') as devnull:
+            start = time()
+            process = subprocess.Popen([sys.executable, '-c', BOOTSTRAP,
+                                        os.path.join(PROJECT, 'scripts', script)] + args,
+                                       env=env, stdin=devnull, stdout=devnull, stderr=devnull)
+            killed = []
+
+            def kill():
+                killed.append(True)
+                try:
+                    process.kill()
+                except OSError:
+                    # Process has just exited.
+                    pass
+
+            # Do not let a hung script block the whole benchmark.
+            timer = Timer(TIMEOUT, kill)
+            timer.start()
+            try:
+                returncode = process.wait()
+            finally:
+                timer.cancel()
+            timings = {'exit': time() - start}
+            if killed:
+                timings['timeout'] = True
+
+        with open(report) as fp:
+            content = fp.read()
+        if content:
+            for step, when in json.loads(content).items():
+                timings[step] = when - start
+        return returncode, timings
+    finally:
+        os.remove(report)
+
+
+def median(values):
+    values = sorted(values)
+    if not values:
+        return None
+    return values[len(values) // 2]
+
+
+def measure(env, script, runs):
+    result = {'script': script, 'python': sys.version.split()[0]}
+    measures = []
+    for _ in range(runs):
+        returncode, timings = run(env, script, [])
+        measures.append(timings)
+    for step in ('prompt', 'load_backends', 'exit'):
+        result[step] = median([m[step] for m in measures if step in m])
+    result['returncode'] = returncode
+    result['timeout'] = any(m.get('timeout', False) for m in measures)
+
+    command = COMMANDS.get(script)
+    if command is not None:
+        measures = []
+        for _ in range(runs):
+            returncode, timings = run(env, script, command)
+            measures.append(timings)
+        result['command'] = ' '.join(command)
+        result['command_load_backends'] = median([m['load_backends'] for m in measures if 'load_backends' in m])
+        result['first_result'] = median([m['first_result'] for m in measures if 'first_result' in m])
+        result['command_exit'] = median([m['exit'] for m in measures])
+        result['command_returncode'] = returncode
+        result['command_timeout'] = any(m.get('timeout', False) for m in measures)
+    return result
+
+
+def main(runs=5, *scripts):
+    if not scripts:
+        scripts = sorted(name for name in os.listdir(os.path.join(PROJECT, 'scripts'))
+                         if not name.startswith('q') and not name.endswith('-qt') and name not in DAEMONS)
+
+    path = tempfile.mkdtemp(prefix='weboob-benchmark-')
+    try:
+        env = create_fixture(path)
+        for script in scripts:
+            print(json.dumps(measure(env, script, int(runs)), sort_keys=True))
+            sys.stdout.flush()
+    finally:
+        shutil.rmtree(path)
+
+
+if __name__ == '__main__':
+    main(*sys.argv[1:])
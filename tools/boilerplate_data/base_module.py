@@ -1,7 +1,5 @@
 <%inherit file="layout.py"/>
-from weboob.tools.backend import Module
-
-from .browser import ${r.classname}Browser
+from weboob.tools.backend import Module, LazyBrowser
 
 
 __all__ = ['${r.classname}Module']
@@ -15,4 +13,4 @@ class ${r.classname}Module(Module):
     LICENSE = 'AGPLv3+'
     VERSION = '${r.version}'
 
-    BROWSER = ${r.classname}Browser
+    BROWSER = LazyBrowser('.browser', '${r.classname}Browser')
@@ -1,9 +1,7 @@
 <%inherit file="layout.py"/>
-from weboob.tools.backend import Module
+from weboob.tools.backend import Module, LazyBrowser
 from ${r.capmodulename} import ${r.capname}
 
-from .browser import ${r.classname}Browser
-
 
 __all__ = ['${r.classname}Module']
 
@@ -16,6 +14,6 @@ class ${r.classname}Module(Module, ${r.capname}):
     LICENSE = 'AGPLv3+'
     VERSION = '${r.version}'
 
-    BROWSER = ${r.classname}Browser
+    BROWSER = LazyBrowser('.browser', '${r.classname}Browser')
 
 ${r.methods_code}
@@ -19,9 +19,7 @@
 
 from __future__ import print_function
 
-import datetime, uuid
-from dateutil.relativedelta import relativedelta
-from dateutil.parser import parse as parse_date
+import datetime
 from decimal import Decimal, InvalidOperation
 
 from weboob.capabilities.base import empty
@@ -47,6 +45,8 @@ class OfxFormatter(IFormatter):
         self.balance = account.balance
         self.coming = account.coming
 
+        import uuid
+
         self.output(u'OFXHEADER:100')
         self.output(u'DATA:OFXSGML')
         self.output(u'VERSION:102')
@@ -331,6 +331,8 @@ class Boobank(ReplApplication):
             return 2
 
         if end_date is not None:
+            from dateutil.relativedelta import relativedelta
+            from dateutil.parser import parse as parse_date
             try:
                 end_date = parse_date(end_date)
             except ValueError:
@@ -23,7 +23,6 @@ import datetime
 import hashlib
 
 from tempfile import NamedTemporaryFile
-from lxml import etree
 
 from weboob.core import CallErrors
 from weboob.capabilities.messages import CapMessages, Message, Thread
@@ -50,6 +49,8 @@ class AtomFormatter(IFormatter):
         self.output(u'<id>urn:md5:%s</id>' % m.hexdigest())
 
     def format_obj(self, obj, alias):
+        from lxml import etree
+
         elem = etree.Element('entry')
 
         title = etree.Element('title')
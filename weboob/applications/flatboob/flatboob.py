@@ -189,7 +189,7 @@ class Flatboob(ReplApplication):
     def complete_search(self, query):
         self.change_path([u'housings'])
         self.start_format()
-        for backend, housing in self.do('search_housings', query):
+        for backend, housing in self.do('search_housings', query, dedup=True):
             self.cached_format(housing)
 
     def ask_int(self, txt):
@@ -96,7 +96,7 @@ class Handjoob(ReplApplication):
         """
         self.change_path([u'search'])
         self.start_format(pattern=pattern)
-        for backend, job_advert in self.do('search_job', pattern):
+        for backend, job_advert in self.do('search_job', pattern, dedup=True):
             self.cached_format(job_advert)
 
     @defaultcount(10)
@@ -107,7 +107,7 @@ class Handjoob(ReplApplication):
         Search for an advert matching to advanced filters.
         """
         self.change_path([u'advanced'])
-        for backend, job_advert in self.do('advanced_search_job'):
+        for backend, job_advert in self.do('advanced_search_job', dedup=True):
             self.cached_format(job_advert)
 
     def complete_info(self, text, line, *ignored):
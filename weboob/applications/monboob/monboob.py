@@ -254,7 +254,11 @@ class Monboob(ReplApplication):
 
         Run the fetching daemon.
         """
-        self.weboob.repeat(self.config.get('interval'), self.process)
+        # Each backend is polled by its own job, so backends without new
+        # messages are polled less often, and polls are spread in time.
+        for backend in self.weboob.iter_backends():
+            self.weboob.repeat(self.config.get('interval'), self.process, [backend],
+                               jitter=0.1, backoff=2)
         self.weboob.loop()
 
     def do_once(self, line):
@@ -263,15 +267,23 @@ class Monboob(ReplApplication):
 
         Send mails only once, then exit.
         """
-        return self.process()
+        self.process()
 
-    def process(self):
+    def process(self, backends=None):
+        """
+        Send unread messages by email.
+
+        :returns: number of sent messages
+        """
+        sent = 0
         try:
-            for backend, message in self.weboob.do('iter_unread_messages'):
+            for backend, message in self.weboob.do('iter_unread_messages', backends=backends):
                 if self.send_email(backend, message):
                     backend.set_message_read(message)
+                    sent += 1
         except CallErrors as e:
             self.bcall_errors_handler(e)
+        return sent
 
     def send_email(self, backend, mail):
         domain = self.config.get('domain')
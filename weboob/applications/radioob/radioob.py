@@ -20,7 +20,6 @@
 import subprocess
 import os
 import re
-import requests
 
 from weboob.capabilities.radio import CapRadio, Radio
 from weboob.capabilities.audio import CapAudio, BaseAudio, Playlist, Album
@@ -265,6 +264,7 @@ class Radioob(ReplApplication):
                 if isinstance(stream, BaseAudio) and not stream.url:
                     stream = self.get_object(stream.id, 'get_audio')
                 else:
+                    import requests
                     r = requests.get(stream.url, stream=True)
                     buf = r.iter_content(512).next()
                     r.close()
@@ -18,7 +18,6 @@
 # along with weboob. If not, see <http://www.gnu.org/licenses/>.
 
 
-import requests
 import subprocess
 import os
 
@@ -120,6 +119,7 @@ class Videoob(ReplApplication):
         os.spawnlp(os.P_WAIT, args[0], *args)
 
     def read_url(self, url):
+        import requests
         r = requests.get(url, stream=True)
         buf = r.iter_lines()
         r.close()
@@ -336,5 +336,5 @@ class Videoob(ReplApplication):
 
         self.change_path([u'search'])
         self.start_format(pattern=pattern)
-        for backend, video in self.do('search_videos', pattern=pattern, nsfw=self.nsfw):
+        for backend, video in self.do('search_videos', pattern=pattern, nsfw=self.nsfw, dedup=True):
             self.cached_format(video)
@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+
+# Copyright(C) 2014 Romain Bignon
+#
+# This file is part of weboob.
+#
+# weboob is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# weboob is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with weboob. If not, see <http://www.gnu.org/licenses/>.
+
+
+
+import signal
+from optparse import OptionGroup
+
+from weboob.core.daemon import DaemonError, WeboobDaemon, get_socket_path
+from weboob.tools.application.base import Application
+
+
+__all__ = ['Weboobd']
+
+
+class Weboobd(Application):
+    APPNAME = 'weboobd'
+    VERSION = '1.0'
+    COPYRIGHT = 'Copyright(C) 2014 Romain Bignon'
+    DESCRIPTION = "Weboobd is a daemon which keeps backends loaded and logged in. Console " \
+                  "applications run with the --daemon option use them, instead of loading " \
+                  "modules and backends again."
+    SHORT_DESCRIPTION = "keep backends loaded for console applications"
+
+    def __init__(self, option_parser=None):
+        super(Weboobd, self).__init__(option_parser)
+        options = OptionGroup(self._parser, 'Weboobd options')
+        options.add_option('-s', '--socket', help='path of the socket (default: %s)'
+                                                  % get_socket_path(self.weboob.workdir))
+        options.add_option('--parallel-load', action='store_true',
+                           help='load backends in threads (modules must support it)')
+        self._parser.add_option_group(options)
+
+    def main(self, argv):
+        errors = []
+        self.load_backends(storage=self.create_storage(), errors=errors, parallel=self.options.parallel_load)
+        for error in errors:
+            self.logger.error(u'Unable to load backend %s: %s' % (error.backend_name, error))
+
+        daemon = WeboobDaemon(self.weboob, self.options.socket or get_socket_path(self.weboob.workdir))
+        try:
+            daemon.bind()
+        except DaemonError as e:
+            print >>self.stderr, 'Error: %s' % e
+            return 1
+
+        signal.signal(signal.SIGTERM, lambda signum, frame: daemon.stop())
+        try:
+            daemon.serve_forever()
+        finally:
+            daemon.stop()
+        return 0
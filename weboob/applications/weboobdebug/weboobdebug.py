@@ -20,7 +20,9 @@
 
 from optparse import OptionGroup
 
+from weboob.core.modules import ModuleLoadError
 from weboob.tools.application.base import Application
+from weboob.tools.importprofile import get_profiler, start_profiler
 
 
 class WeboobDebug(Application):
@@ -34,6 +36,8 @@ class WeboobDebug(Application):
         super(WeboobDebug, self).__init__(option_parser)
         options = OptionGroup(self._parser, 'Weboob-Debug options')
         options.add_option('-B', '--bpython', action='store_true', help='Prefer bpython over ipython')
+        options.add_option('--profile-imports', action='store_true',
+                           help='Display time spent to import modules (all installed ones if none is given)')
         self._parser.add_option_group(options)
 
     def load_default_backends(self):
@@ -45,6 +49,9 @@ class WeboobDebug(Application):
 
         Debug BACKEND.
         """
+        if self.options.profile_imports:
+            return self.profile_imports(argv[1:])
+
         try:
             backend_name = argv[1]
         except IndexError:
@@ -73,6 +80,36 @@ class WeboobDebug(Application):
             else:
                 break
 
+    def profile_imports(self, module_names):
+        """
+        Load modules and display the time spent by their imports.
+
+        Imports of weboob itself are measured only when the
+        WEBOOB_IMPORT_PROFILE=1 environment variable is set.
+        """
+        profiler = get_profiler()
+        # When the profiler is started by WEBOOB_IMPORT_PROFILE, it reports at exit.
+        report = profiler is None
+        if profiler is None:
+            profiler = start_profiler(report_at_exit=False)
+
+        if not module_names:
+            module_names = [name for name, info in self.weboob.repositories.get_all_modules_info().iteritems()
+                            if info.is_installed()]
+
+        loader = self.weboob.modules_loader
+        for name in sorted(module_names):
+            try:
+                loader.load_module(name)
+            except ModuleLoadError as e:
+                print >>self.stderr, u'Unable to load module "%s": %s' % (name, e)
+
+        profiler.stop()
+        loaded = [loader.loaded[name] for name in module_names if name in loader.loaded]
+        print >>self.stdout, '%d modules loaded in %.1f ms' % (len(loaded), sum(m.load_time for m in loaded) * 1000)
+        if report:
+            profiler.report(self.stdout)
+
     def ipython(self, locs, banner):
         try:
             from IPython import embed
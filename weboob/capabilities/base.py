@@ -20,6 +20,7 @@
 
 import warnings
 import re
+import unicodedata
 from decimal import Decimal
 from copy import deepcopy, copy
 
@@ -31,7 +32,7 @@ from weboob.tools.ordereddict import OrderedDict
 __all__ = ['UserError', 'FieldNotFound', 'NotAvailable',
            'NotLoaded', 'Capability', 'Field', 'IntField', 'DecimalField',
            'FloatField', 'StringField', 'BytesField',
-           'empty', 'BaseObject']
+           'empty', 'normalize_text', 'BaseObject']
 
 
 def empty(value):
@@ -45,6 +46,27 @@ def empty(value):
             return True
     return False
 
+_NON_WORD = re.compile(r'\W+', re.UNICODE)
+
+def normalize_text(text):
+    u"""
+    Normalize a text to compare it with texts from other websites: case,
+    accents, punctuation and spaces are ignored.
+
+    Returns None if the text is empty.
+
+    >>> normalize_text(u'  Appartement T2, Paris  ')
+    u'appartement t2 paris'
+    >>> normalize_text(u'Évreux-Centre')
+    u'evreux centre'
+    >>> normalize_text(NotLoaded)
+    """
+    if empty(text):
+        return None
+    text = unicodedata.normalize('NFKD', to_unicode(text))
+    text = u''.join(c for c in text if not unicodedata.combining(c))
+    return u' '.join(_NON_WORD.split(text.lower())).strip() or None
+
 def find_object(mylist, error=None, **kwargs):
     """
     Very simple tools to return an object with the matching parameters in
@@ -111,6 +133,10 @@ class NotAvailableType(object):
     def __deepcopy__(self, memo):
         return self
 
+    def __reduce__(self):
+        # Unpickle the constant itself, so it can be compared with "is".
+        return 'NotAvailable'
+
     def __repr__(self):
         return 'NotAvailable'
 
@@ -140,6 +166,9 @@ class NotLoadedType(object):
     def __deepcopy__(self, memo):
         return self
 
+    def __reduce__(self):
+        return 'NotLoaded'
+
     def __repr__(self):
         return u'NotLoaded'
 
@@ -333,6 +362,19 @@ class BaseObject(object):
                 return False
         return True
 
+    def fingerprint(self):
+        """
+        Get a value identifying this object, even when it has been found on
+        several backends, so duplicates can be dropped (see the *dedup*
+        parameter of :func:`weboob.core.ouiboube.WebNip.do`).
+
+        The default implementation returns None, which means the object is
+        never considered as a duplicate. Capability objects overload it.
+
+        :rtype: hashable object or None
+        """
+        return None
+
     def copy(self):
         obj = copy(self)
         obj._fields = copy(self._fields)
@@ -440,8 +482,8 @@ class Currency(object):
     @classmethod
     def get_currency(klass, text):
         u"""
-        >>> Currency.get_currency(u'42')
-        None
+        >>> Currency.get_currency(u'42') is None
+        True
         >>> Currency.get_currency(u'42 €')
         u'EUR'
         >>> Currency.get_currency(u'$42')
@@ -452,8 +494,8 @@ class Currency(object):
         u'USD'
         >>> Currency.get_currency(u'%42 USD')
         u'USD'
-        >>> Currency.get_currency(u'US1D')
-        None
+        >>> Currency.get_currency(u'US1D') is None
+        True
         """
         curtexts = klass.EXTRACTOR.sub(' ', text.upper()).split()
         for curtext in curtexts:
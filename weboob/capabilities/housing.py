@@ -19,7 +19,7 @@
 
 
 from .base import Capability, BaseObject, Field, IntField, DecimalField, \
-                  StringField, BytesField
+                  StringField, BytesField, empty, normalize_text
 from .date import DateField
 
 __all__ = ['HousingPhoto', 'Housing', 'Query', 'City', 'CapHousing']
@@ -62,6 +62,15 @@ class Housing(BaseObject):
     photos =        Field('List of photos', list)
     details =       Field('Key/values of details', dict)
 
+    def fingerprint(self):
+        """
+        Housings with the same title, cost and location are duplicates.
+        """
+        title = normalize_text(self.title)
+        if title is None or empty(self.cost):
+            return None
+        return (title, self.cost, normalize_text(self.location))
+
 
 class Query(BaseObject):
     """
@@ -17,7 +17,7 @@
 # You should have received a copy of the GNU Affero General Public License
 # along with weboob. If not, see <http://www.gnu.org/licenses/>.
 
-from .base import BaseObject, Capability, StringField
+from .base import BaseObject, Capability, StringField, normalize_text
 from .date import DateField
 
 __all__ = ['BaseJobAdvert', 'CapJob']
@@ -39,6 +39,15 @@ class BaseJobAdvert(BaseObject):
     formation =        StringField('Required formation')
     experience =       StringField('Required experience')
 
+    def fingerprint(self):
+        """
+        Adverts with the same title, society and place are duplicates.
+        """
+        title = normalize_text(self.title)
+        if title is None:
+            return None
+        return (title, normalize_text(self.society_name), normalize_text(self.place))
+
     def __unicode__(self):
         message = u'\r\n-- Advert --\r\n'
         message += u'id : %s\r\n' % self.id
@@ -20,7 +20,6 @@
 
 from .base import Capability, BaseObject, StringField, IntField, Field, empty
 
-import lxml.etree as ET
 
 import base64
 import re
@@ -80,6 +79,8 @@ class Recipe(BaseObject):
         else:
             sauthor += author
 
+        import lxml.etree as ET
+
         header = u'<?xml version="1.0" encoding="UTF-8" ?>\n'
         initial_xml = '''\
 <krecipes version='2.0-beta2' lang='fr' xmlns:xsi='http://www.w3.org/2001/XMLSchema-instance' xsi:noNamespaceSchemaLocation='krecipes.xsd'>
@@ -20,7 +20,7 @@
 
 from datetime import timedelta
 
-from .base import Field
+from .base import Field, empty, normalize_text
 from .image import CapImage, BaseImage
 
 
@@ -35,6 +35,18 @@ class BaseVideo(BaseImage):
     """
     duration =  Field('file duration', int, long, timedelta)
 
+    def fingerprint(self):
+        """
+        Videos with the same title and duration are duplicates.
+        """
+        title = normalize_text(self.title)
+        if title is None or empty(self.duration):
+            return None
+        duration = self.duration
+        if isinstance(duration, timedelta):
+            duration = duration.days * 86400 + duration.seconds
+        return (title, duration)
+
 
 class CapVideo(CapImage):
     """
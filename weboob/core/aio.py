@@ -0,0 +1,233 @@
+# -*- coding: utf-8 -*-
+
+# Copyright(C) 2014 Romain Bignon
+#
+# This file is part of weboob.
+#
+# weboob is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# weboob is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with weboob. If not, see <http://www.gnu.org/licenses/>.
+
+
+from collections import deque
+from time import time
+
+try:
+    import asyncio
+except ImportError:
+    try:
+        import trollius as asyncio
+    except ImportError:
+        raise ImportError('Please install python-trollius')
+
+from .bcall import BackendsCall, CallErrors
+
+
+__all__ = ['AsyncBackendsCall', 'AsyncResultsIterator', 'StopAsyncIteration']
+
+
+try:
+    StopAsyncIteration = StopAsyncIteration
+except NameError:
+    class StopAsyncIteration(Exception):
+        """
+        Raised by :func:`AsyncBackendsCall.__anext__` when there is no more
+        result, on Python versions without the ``async for`` statement.
+        """
+
+
+class AsyncBackendsCall(BackendsCall):
+    """
+    Call backends and give their results to an asyncio event loop.
+
+    Backends are still run in the threads of the pool, but their results
+    are pushed to the event loop, so no thread is needed to wait for them.
+
+    It is an asynchronous iterator::
+
+        async for backend, result in weboob.ado('iter_accounts'):
+            print(backend.name, result)
+
+    Leaving this loop before the end cancels backends still running.
+
+    And :func:`gather` returns a future of every results::
+
+        results = await weboob.ado('iter_accounts').gather()
+
+    :param loop: event loop where results are given
+    :type loop: :class:`asyncio.AbstractEventLoop`
+
+    Other parameters are the ones of :class:`weboob.core.bcall.BackendsCall`.
+    """
+    def __init__(self, loop, backends, function, *args, **kwargs):
+        self.loop = loop
+        # Responses given by backends, not read yet by the consumer.
+        self.pending = deque()
+        # Future returned by __anext__ and waiting for a response.
+        self.waiter = None
+        # Handle of the timer to expire backends.
+        self.timer = None
+
+        BackendsCall.__init__(self, backends, function, *args, **kwargs)
+
+    def put_response(self, response):
+        if self._enqueue(response):
+            self.loop.call_soon_threadsafe(self._deliver, response)
+
+    def _enqueue(self, response):
+        # The responses queue is only used to count responses given to the
+        # event loop and not read yet, when max_buffered is set.
+        if self.responses.maxsize <= 0:
+            return True
+        return BackendsCall._enqueue(self, response)
+
+    def _wakeup_consumer(self):
+        if not self.loop.is_closed():
+            self.loop.call_soon_threadsafe(self._wakeup)
+
+    def _deliver(self, response):
+        self.pending.append(response)
+        self._wakeup()
+
+    def _on_deadline(self):
+        self.timer = None
+        self._expire_backends()
+        self._wakeup()
+
+    def _wakeup(self):
+        """
+        Give the next response to the waiting future, if there is one.
+        """
+        waiter = self.waiter
+        if waiter is None or waiter.done():
+            return
+
+        while not self.ready and self.pending:
+            response = self.pending.popleft()
+            if self.responses.maxsize > 0:
+                # Free a slot for backends.
+                self.responses.get_nowait()
+            self._process_response(response)
+
+        if self.ready:
+            self.waiter = None
+            waiter.set_result(self.ready.popleft())
+            return
+
+        if self.running <= 0 or self.cancelled.is_set():
+            self.waiter = None
+            if self.timer is not None:
+                self.timer.cancel()
+                self.timer = None
+            self._finish()
+            if self.errors:
+                waiter.set_exception(CallErrors(self.errors))
+            else:
+                waiter.set_exception(StopAsyncIteration())
+            return
+
+        deadline = self._get_next_deadline()
+        if deadline is not None and self.timer is None:
+            self.timer = self.loop.call_later(max(0, deadline - time()), self._on_deadline)
+
+    def __aiter__(self):
+        return AsyncResultsIterator(self)
+
+    def close(self):
+        """
+        Stop reading results.
+
+        If some backends are still running, they are cancelled, as when a
+        synchronous iteration is left before the end.
+        """
+        if self.timer is not None:
+            self.timer.cancel()
+            self.timer = None
+        if self.running > 0:
+            self.cancel()
+        self._finish()
+
+    def __anext__(self):
+        """
+        Get a future of the next (backend, result) tuple.
+
+        The future raises :class:`StopAsyncIteration` once every backend
+        has finished, or :class:`weboob.core.bcall.CallErrors` if some of
+        them have failed.
+        """
+        future = asyncio.Future(loop=self.loop)
+        self.waiter = future
+        self._wakeup()
+        return future
+
+    def gather(self):
+        """
+        Get a future of the list of every (backend, result) tuples.
+
+        As when iterating, the future raises
+        :class:`weboob.core.bcall.CallErrors` if some backends have failed.
+        """
+        future = asyncio.Future(loop=self.loop)
+        results = []
+
+        def step(previous=None):
+            if previous is not None:
+                if previous.cancelled():
+                    future.cancel()
+                    return
+                error = previous.exception()
+                if isinstance(error, StopAsyncIteration):
+                    future.set_result(results)
+                    return
+                elif error is not None:
+                    future.set_exception(error)
+                    return
+                results.append(previous.result())
+
+            if not future.done():
+                self.__anext__().add_done_callback(step)
+
+        step()
+        return future
+
+
+class AsyncResultsIterator(object):
+    """
+    Asynchronous iterator on results of an :class:`AsyncBackendsCall`.
+
+    When an ``async for`` loop is left before the end, with ``break`` or an
+    exception, this iterator is garbage-collected and the call is closed,
+    so backends do not work for a consumer which is gone. It can also be
+    closed explicitly with :func:`aclose`.
+    """
+    def __init__(self, call):
+        self.call = call
+
+    def __aiter__(self):
+        return self
+
+    def __anext__(self):
+        return self.call.__anext__()
+
+    def aclose(self):
+        """
+        Close the call.
+
+        :rtype: :class:`asyncio.Future`
+        """
+        self.call.close()
+        future = asyncio.Future(loop=self.call.loop)
+        future.set_result(None)
+        return future
+
+    def __del__(self):
+        self.call.close()
@@ -18,19 +18,30 @@
 # along with weboob. If not, see <http://www.gnu.org/licenses/>.
 
 
+from collections import deque
 from copy import copy
-from threading import Thread
+from heapq import heappush, heappop
+from operator import attrgetter
+from threading import Thread, Lock, Event
+from time import time
 try:
     import Queue
 except ImportError:
     import queue as Queue
 
 from weboob.capabilities.base import BaseObject
-from weboob.tools.misc import get_backtrace
+from weboob.core.pool import ThreadPool, Wakeup, can_fork, iter_in_process
+from weboob.tools.compat import basestring
+from weboob.tools.misc import get_backtrace, cancellable, deduplicating
+from weboob.tools.ordereddict import OrderedDict
 from weboob.tools.log import getLogger
 
 
-__all__ = ['BackendsCall', 'CallErrors']
+__all__ = ['BackendsCall', 'CallErrors', 'BackendTimeout', 'ResultsMerger', 'CallStats', 'BackendStats']
+
+
+# Put in the responses queue by a backend once it has finished.
+END_OF_STREAM = object()
 
 
 class CallErrors(Exception):
@@ -46,64 +57,667 @@ class CallErrors(Exception):
         return self.errors.__iter__()
 
 
+class BackendTimeout(Exception):
+    """
+    Raised in :class:`CallErrors` when a backend has not finished before
+    the deadline of the call.
+    """
+    def __init__(self, backend, timeout):
+        Exception.__init__(self, 'Backend %s has not finished after %s seconds' % (backend.name, timeout))
+        self.timeout = timeout
+
+
+class _ReversedKey(object):
+    __slots__ = ('key',)
+
+    def __init__(self, key):
+        self.key = key
+
+    def __lt__(self, other):
+        return other.key < self.key
+
+    def __eq__(self, other):
+        return self.key == other.key
+
+
+class ResultsMerger(object):
+    """
+    Merge results of several backends into one ordered stream.
+
+    Each backend is expected to give its results already ordered by *key*.
+    A result is released only when every backend still running has given a
+    result, so that the smallest one is known. Only heads of streams are
+    kept in a heap, and the buffering depends on the number of backends,
+    not on the number of results.
+
+    :param backends: backends to merge results of
+    :type backends: list[:class:`Module`]
+    :param key: function to get the sort key of a result, or name of the
+                attribute to use
+    :type key: :class:`callable` or :class:`str`
+    :param reverse: if True, results are ordered from the greatest
+    :type reverse: :class:`bool`
+
+    >>> merger = ResultsMerger(['a', 'b'], key=lambda x: x)
+    >>> merger.push('a', 1)
+    >>> merger.push('a', 4)
+    >>> list(merger.pop_ready())
+    []
+    >>> merger.push('b', 2)
+    >>> list(merger.pop_ready())
+    [('a', 1), ('b', 2)]
+    >>> merger.close('b')
+    >>> list(merger.pop_ready())
+    [('a', 4)]
+    """
+    def __init__(self, backends, key, reverse=False):
+        if isinstance(key, basestring):
+            key = attrgetter(key)
+        self.key = key
+        self.reverse = reverse
+
+        # Results received and not released yet, for each backend.
+        self.buffers = dict((backend, deque()) for backend in backends)
+        # Backends still able to give results.
+        self.running = set(self.buffers)
+        # Running backends which have no result in buffer.
+        self.starving = set(self.buffers)
+        # Heap of (key, counter, backend) of the first result of each buffer.
+        self.heap = []
+        self.counter = 0
+
+    def _push_head(self, backend):
+        key = self.key(self.buffers[backend][0])
+        if self.reverse:
+            key = _ReversedKey(key)
+        self.counter += 1
+        heappush(self.heap, (key, self.counter, backend))
+
+    def push(self, backend, result):
+        """
+        Add a result given by a backend.
+        """
+        buf = self.buffers[backend]
+        buf.append(result)
+        if len(buf) == 1:
+            self._push_head(backend)
+            self.starving.discard(backend)
+
+    def close(self, backend):
+        """
+        Tell that a backend will not give any other result.
+        """
+        self.running.discard(backend)
+        self.starving.discard(backend)
+
+    def pop_ready(self):
+        """
+        Iter on results which can be released.
+
+        :rtype: iter[tuple]
+        """
+        while self.heap and not self.starving:
+            _, _, backend = heappop(self.heap)
+            buf = self.buffers[backend]
+            result = buf.popleft()
+            if buf:
+                self._push_head(backend)
+            elif backend in self.running:
+                self.starving.add(backend)
+            yield backend, result
+
+
+class BackendStats(object):
+    """
+    Measures of a backend during a call. Times are in seconds.
+    """
+    def __init__(self, name):
+        self.name = name
+        # Timestamps
+        self.start = None
+        self.first_result = None
+        self.end = None
+        # Counters
+        self.results = 0
+        self.errors = 0
+        # Results dropped because another backend has already given them.
+        self.duplicates = 0
+        # Time spent waiting for the backend lock, held by another call.
+        self.lock_wait = 0.0
+
+    @property
+    def wall_time(self):
+        if self.start is None or self.end is None:
+            return None
+        return self.end - self.start
+
+    @property
+    def time_to_first(self):
+        if self.start is None or self.first_result is None:
+            return None
+        return self.first_result - self.start
+
+    def __repr__(self):
+        return '<BackendStats %s results=%d errors=%d wall_time=%r>' % (self.name, self.results, self.errors, self.wall_time)
+
+
+class CallStats(object):
+    """
+    Measures of a :class:`BackendsCall`, available as its ``stats``
+    attribute.
+
+    Iterate on it to get the :class:`BackendStats` of each backend, or get
+    one by its backend name.
+    """
+    def __init__(self, function, backends):
+        self.function = function if isinstance(function, basestring) else getattr(function, '__name__', repr(function))
+        self.start = time()
+        # Set when the consumer has finished to read results.
+        self.end = None
+        # Seconds spent by backends waiting for the consumer to read results.
+        self.blocked_time = 0.0
+        self.backends = OrderedDict((backend.name, BackendStats(backend.name)) for backend in backends)
+
+    @property
+    def wall_time(self):
+        if self.end is None:
+            return None
+        return self.end - self.start
+
+    def __getitem__(self, name):
+        return self.backends[name]
+
+    def __iter__(self):
+        return iter(self.backends.values())
+
+    def __len__(self):
+        return len(self.backends)
+
+    def __repr__(self):
+        return '<CallStats %s backends=%d wall_time=%r>' % (self.function, len(self), self.wall_time)
+
+
 class BackendsCall(object):
+    # Seconds between two checks that a blocked producer is still expected.
+    PRODUCER_WAIT = 0.5
+
     def __init__(self, backends, function, *args, **kwargs):
         """
         :param backends: List of backends to call
         :type backends: list[:class:`Module`]
         :param function: backends' method name, or callable object.
         :type function: :class:`str` or :class:`callable`
+        :param args: arguments to give to function
+        :param kwargs: keyword arguments to give to function
+
+        The following keyword arguments are options of the call, and are not
+        given to function:
+
+        :param pool: pool of threads where backends are called
+        :type pool: :class:`weboob.core.pool.ThreadPool`
+        :param timeout: seconds after which every unfinished backend is
+                        given up
+        :type timeout: :class:`float`
+        :param per_backend_timeout: seconds after which a backend is given
+                                    up, from the time it has been started
+        :type per_backend_timeout: :class:`float`
+        :param max_buffered: maximum number of results waiting to be read
+                             by the consumer; when it is reached, backends
+                             are paused until results are read
+        :type max_buffered: :class:`int`
+        :param merge_key: if set, results of backends are merged to be
+                          given ordered by this key (see :class:`ResultsMerger`)
+        :type merge_key: :class:`callable` or :class:`str`
+        :param merge_reverse: results are merged from the greatest key
+        :type merge_reverse: :class:`bool`
+        :param processes: backends to call in a forked process (names or
+                          instances), or True for every backends
+        :type processes: :class:`bool` or list
+        :param dedup: drop results whose fingerprint has already been seen;
+                      True to use :func:`BaseObject.fingerprint`, or a
+                      function taking a result and returning its
+                      fingerprint (None if it can't be compared)
+        :type dedup: :class:`bool` or :class:`callable`
+        :param stats_callback: function called with the :class:`CallStats`
+                               object once the consumer has finished to
+                               read results
+        :type stats_callback: :class:`callable`
         """
+        pool = kwargs.pop('pool', None)
+        timeout = kwargs.pop('timeout', None)
+        per_backend_timeout = kwargs.pop('per_backend_timeout', None)
+        max_buffered = kwargs.pop('max_buffered', None)
+        merge_key = kwargs.pop('merge_key', None)
+        merge_reverse = kwargs.pop('merge_reverse', False)
+        processes = kwargs.pop('processes', None)
+        dedup = kwargs.pop('dedup', None)
+        stats_callback = kwargs.pop('stats_callback', None)
+
         self.logger = getLogger('bcall')
 
-        self.responses = Queue.Queue()
+        self.responses = Queue.Queue(max_buffered or 0)
         self.errors = []
-        self.tasks = Queue.Queue()
+        # Responses ready to be given to the consumer.
+        self.ready = deque()
+
+        self.backends = list(backends)
+        if merge_key is not None:
+            self.merger = ResultsMerger(self.backends, merge_key, merge_reverse)
+        else:
+            self.merger = None
+        # Number of backends whose end marker has not been read yet.
+        self.running = len(self.backends)
+        # Backends finished or given up by the consumer.
+        self.finished = set()
+        self.timedout = set()
+        # Time when each backend has been started.
+        self.started = {}
+        # Set when the consumer does not want any other result.
+        self.cancelled = Event()
+
+        if dedup is True:
+            dedup = lambda obj: obj.fingerprint() if isinstance(obj, BaseObject) else None
+        self.dedup = dedup
+        # Results already given, by fingerprint, and ids of those results.
+        self.fingerprints = {}
+        self.kept = set()
+
+        self.stats = CallStats(function, self.backends)
+        self.stats_callback = stats_callback
+        self.mutex = Lock()
+        # Notified when a response is put in queue, while the consumer
+        # waits for it.
+        self.wakeup = None
+
+        if processes and not can_fork():
+            self.logger.warning('Unable to call backends in processes on this platform')
+            processes = None
+        self.processes = processes
+
+        self.timeout = timeout
+        self.per_backend_timeout = per_backend_timeout
+        self.deadline = time() + timeout if timeout is not None else None
+
+        if pool is None:
+            # Use a dedicated pool, stopped as soon as every backend has been called.
+            own_pool = pool = ThreadPool(len(backends), 'bcall')
+        else:
+            own_pool = None
+        self.pool = pool
+
+        # Tasks of the pool calling backends, to give them up on timeout.
+        self.tasks = {}
+        for backend in self.backends:
+            self.tasks[backend] = pool.submit(self.backend_process, backend, function, args, kwargs)
+
+        if own_pool is not None:
+            own_pool.shutdown(wait=False)
 
-        for backend in backends:
-            Thread(target=self.backend_process, args=(function, args, kwargs)).start()
-            self.tasks.put(backend)
+    @property
+    def blocked_time(self):
+        """
+        Seconds spent by backends waiting for the consumer to read results.
+        """
+        return self.stats.blocked_time
 
     def store_result(self, backend, result):
+        if self._drop_duplicate(backend, result):
+            return
+
+        stats = self.stats[backend.name]
+        if stats.first_result is None:
+            stats.first_result = time()
+        stats.results += 1
+
         if isinstance(result, BaseObject):
             result.backend = backend.name
-        self.responses.put((backend, result))
+        self.put_response((backend, result))
 
-    def backend_process(self, function, args, kwargs):
-        backend = self.tasks.get()
-        with backend:
-            try:
-                # Call method on backend
+    def put_response(self, response):
+        """
+        Give a response to the consumer. Called from backends threads.
+        """
+        self._enqueue(response)
+
+    def _enqueue(self, response):
+        """
+        Put a response in queue, waiting if it is full.
+
+        Return False if the response has been dropped because nobody will
+        read it anymore.
+        """
+        if self._put(response):
+            self._notify_consumer()
+            return True
+        return False
+
+    def _put(self, response):
+        if self.responses.maxsize <= 0:
+            self.responses.put(response)
+            return True
+
+        try:
+            self.responses.put_nowait(response)
+            return True
+        except Queue.Full:
+            pass
+
+        start = time()
+        try:
+            while not self.is_cancelled(response[0]):
                 try:
-                    self.logger.debug('%s: Calling function %s' % (backend, function))
-                    if callable(function):
-                        result = function(backend, *args, **kwargs)
-                    else:
-                        result = getattr(backend, function)(*args, **kwargs)
+                    self.responses.put(response, timeout=self.PRODUCER_WAIT)
+                    return True
+                except Queue.Full:
+                    continue
+            return False
+        finally:
+            with self.mutex:
+                self.stats.blocked_time += time() - start
+
+    def store_error(self, backend, error, backtrace=None):
+        # Errors of a backend which has been given up are not relevant anymore.
+        if backend not in self.timedout:
+            self.stats[backend.name].errors += 1
+            if backtrace is None:
+                backtrace = get_backtrace(error)
+            self.errors.append((backend, error, backtrace))
+
+    def cancel(self):
+        """
+        Tell backends to stop as soon as possible, because no other result
+        is wanted.
+
+        Backends stop at their next result, and browsers do not load next
+        pages anymore (see :func:`weboob.tools.misc.is_cancelled`). The
+        iteration ends with the results already received.
+        """
+        if self.cancelled.is_set():
+            return
+
+        self.logger.debug('Call is cancelled')
+        self.cancelled.set()
+        self._wakeup_consumer()
+
+    def _wakeup_consumer(self):
+        try:
+            self.responses.put_nowait((None, END_OF_STREAM))
+        except Queue.Full:
+            # Consumer is not waiting.
+            pass
+        else:
+            self._notify_consumer()
+
+    def _notify_consumer(self):
+        wakeup = self.wakeup
+        if wakeup is not None:
+            wakeup.notify()
+
+    def is_duplicate(self, result):
+        """
+        Check if an equivalent result has already been given by a backend.
+
+        The first time a result is seen, it is remembered and this method
+        returns False, so it can be checked again later in the pipeline.
+        Called from backends threads.
+        """
+        if self.dedup is None:
+            return False
+
+        with self.mutex:
+            if id(result) in self.kept:
+                return False
+
+        fingerprint = self.dedup(result)
+        if fingerprint is None:
+            return False
+
+        with self.mutex:
+            if fingerprint in self.fingerprints:
+                return self.fingerprints[fingerprint] is not result
+            # Keep a reference on the result, so its id is not reused.
+            self.fingerprints[fingerprint] = result
+            self.kept.add(id(result))
+            return False
+
+    def _drop_duplicate(self, backend, result):
+        if self.is_duplicate(result):
+            self.logger.debug('%s: Drop duplicated result %r' % (backend, result))
+            self.stats[backend.name].duplicates += 1
+            return True
+        return False
+
+    def is_cancelled(self, backend):
+        """
+        Check if results of this backend are still expected.
+        """
+        return self.cancelled.is_set() or backend in self.timedout
+
+    def in_process(self, backend):
+        """
+        Check if this backend has to be called in a forked process.
+        """
+        if not self.processes:
+            return False
+        if self.processes is True:
+            return True
+        return backend in self.processes or backend.name in self.processes
+
+    def backend_process(self, backend, function, args, kwargs):
+        if self.is_cancelled(backend):
+            # Call has been given up before this backend could be started.
+            return
+
+        stats = self.stats[backend.name]
+        stats.start = self.started[backend] = time()
+        try:
+            with backend:
+                stats.lock_wait = time() - stats.start
+                with cancellable(lambda: self.is_cancelled(backend)):
+                    with deduplicating(lambda obj: self._drop_duplicate(backend, obj)):
+                        if self.in_process(backend):
+                            self._call_in_process(backend, function, args, kwargs)
+                        else:
+                            self._call(backend, function, args, kwargs)
+        finally:
+            stats.end = time()
+            # Tell consumer this backend has finished. Errors are stored
+            # before, so they are all known when the last marker is read.
+            self.put_response((backend, END_OF_STREAM))
+
+    def _call(self, backend, function, args, kwargs):
+        # Call method on backend
+        try:
+            self.logger.debug('%s: Calling function %s' % (backend, function))
+            if callable(function):
+                result = function(backend, *args, **kwargs)
+            else:
+                result = getattr(backend, function)(*args, **kwargs)
+        except Exception as error:
+            self.logger.debug('%s: Called function %s raised an error: %r' % (backend, function, error))
+            self.store_error(backend, error)
+        else:
+            self.logger.debug('%s: Called function %s returned: %r' % (backend, function, result))
+
+            if hasattr(result, '__iter__') and not isinstance(result, basestring):
+                # Loop on iterator
+                try:
+                    for subresult in result:
+                        if self.is_cancelled(backend):
+                            # Nobody will read next results.
+                            self.logger.debug('%s: Stop calling function %s' % (backend, function))
+                            break
+                        self.store_result(backend, subresult)
                 except Exception as error:
-                    self.logger.debug('%s: Called function %s raised an error: %r' % (backend, function, error))
-                    self.errors.append((backend, error, get_backtrace(error)))
-                else:
-                    self.logger.debug('%s: Called function %s returned: %r' % (backend, function, result))
-
-                    if hasattr(result, '__iter__') and not isinstance(result, basestring):
-                        # Loop on iterator
-                        try:
-                            for subresult in result:
-                                self.store_result(backend, subresult)
-                        except Exception as error:
-                            self.errors.append((backend, error, get_backtrace(error)))
-                    else:
-                        self.store_result(backend, result)
-            finally:
-                self.tasks.task_done()
+                    self.store_error(backend, error)
+                finally:
+                    if hasattr(result, 'close'):
+                        # Stop the generator now, so it does not keep
+                        # resources nobody will use.
+                        result.close()
+            else:
+                self.store_result(backend, result)
 
-    def _callback_thread_run(self, callback, errback):
-        while self.tasks.unfinished_tasks or not self.responses.empty():
+    def _call_in_process(self, backend, function, args, kwargs):
+        # The forked process works on a copy of the backend, so for
+        # example a login made there is not kept.
+        self.logger.debug('%s: Calling function %s in a process' % (backend, function))
+        if callable(function):
+            args = (backend,) + tuple(args)
+        else:
+            function = getattr(backend, function)
+
+        for message in iter_in_process(function, args, kwargs, lambda: self.is_cancelled(backend)):
+            if self.is_cancelled(backend):
+                # Leaving the loop kills the process.
+                self.logger.debug('%s: Stop calling function %s' % (backend, function))
+                break
+            if message[0] == 'result':
+                self.store_result(backend, message[1])
+            else:
+                self.logger.debug('%s: Called function %s raised an error: %r' % (backend, function, message[1]))
+                self.store_error(backend, message[1], message[2])
+
+    def _get_next_deadline(self):
+        deadlines = []
+        if self.deadline is not None:
+            deadlines.append(self.deadline)
+        if self.per_backend_timeout is not None:
+            now = time()
+            for backend in self.backends:
+                if backend in self.finished or backend in self.timedout:
+                    continue
+                # A backend not started yet can't expire before now + timeout.
+                started = self.started.get(backend, now)
+                deadlines.append(started + self.per_backend_timeout)
+
+        if deadlines:
+            return min(deadlines)
+        return None
+
+    def _expire_backends(self):
+        """
+        Give up backends which have exceeded their deadline.
+        """
+        now = time()
+        for backend, started in list(self.started.items()):
+            if backend in self.finished or backend in self.timedout:
+                continue
+
+            if self.per_backend_timeout is not None and started + self.per_backend_timeout <= now:
+                self._give_up(backend, self.per_backend_timeout)
+
+        if self.deadline is not None and self.deadline <= now:
+            # Also give up backends which are not started yet.
+            for backend in self.backends:
+                if backend not in self.finished and backend not in self.timedout:
+                    self._give_up(backend, self.timeout)
+
+    def _give_up(self, backend, timeout):
+        self.logger.debug('%s: Timeout after %s seconds' % (backend, timeout))
+        self.timedout.add(backend)
+        self.running -= 1
+        self.stats[backend.name].errors += 1
+        self.errors.append((backend, BackendTimeout(backend, timeout), ''))
+        self._close_stream(backend)
+        # Do not let a stuck backend hold a worker of the pool.
+        self.pool.abandon(self.tasks[backend])
+
+    def _close_stream(self, backend):
+        if self.merger is not None:
+            self.merger.close(backend)
+            self.ready.extend(self.merger.pop_ready())
+
+    def _get_response(self, deadline=None):
+        """
+        Get next response in queue.
+
+        Return None if nothing has come before the deadline.
+        """
+        if self.wakeup is None:
+            # Created before reading the queue, so a response put after this
+            # point is always notified.
+            self.wakeup = Wakeup()
+
+        while True:
             try:
-                callback(*self.responses.get(timeout=0.1))
+                return self.responses.get_nowait()
             except Queue.Empty:
-                continue
+                pass
+
+            if deadline is not None:
+                timeout = deadline - time()
+                if timeout <= 0:
+                    return None
+            else:
+                timeout = None
+
+            self.wakeup.wait(timeout)
+
+    def _iter_responses(self):
+        """
+        Iter on results of backends, until every backend has finished or
+        has been given up.
+        """
+        try:
+            while True:
+                while self.ready:
+                    yield self.ready.popleft()
+
+                if self.running <= 0 or self.cancelled.is_set():
+                    return
+
+                response = self._get_response(self._get_next_deadline())
+                if response is None:
+                    self._expire_backends()
+                else:
+                    self._process_response(response)
+        finally:
+            wakeup, self.wakeup = self.wakeup, None
+            if wakeup is not None:
+                wakeup.close()
+            self._finish()
+
+    def _finish(self):
+        """
+        Called when the consumer has finished to read results.
+        """
+        with self.mutex:
+            if self.stats.end is not None:
+                return
+            self.stats.end = time()
+
+        if self.stats_callback is not None:
+            try:
+                self.stats_callback(self.stats)
+            except Exception:
+                self.logger.warning('Unable to give call stats:\n%s' % get_backtrace())
+
+    def _process_response(self, response):
+        """
+        Update state of the call with a response read in queue, and put
+        the results to give to the user in the ready queue.
+        """
+        backend, result = response
+        if backend is None or backend in self.timedout:
+            # Wake-up after cancel, or late result of a backend which has
+            # been given up.
+            return
+        if result is END_OF_STREAM:
+            self.finished.add(backend)
+            self.running -= 1
+            self._close_stream(backend)
+            return
+
+        if self.merger is not None:
+            self.merger.push(backend, result)
+            self.ready.extend(self.merger.pop_ready())
+        else:
+            self.ready.append(response)
+
+    def _callback_thread_run(self, callback, errback):
+        for backend, result in self._iter_responses():
+            callback(backend, result)
 
         # Raise errors
         while self.errors:
@@ -129,17 +743,27 @@ class BackendsCall(object):
         return thread
 
     def wait(self):
-        self.tasks.join()
+        """
+        Wait for every backend to finish.
+
+        Results are kept, so they can still be read by iterating on this
+        object.
+        """
+        responses = list(self._iter_responses())
+        self.ready.extend(responses)
 
         if self.errors:
             raise CallErrors(self.errors)
 
     def __iter__(self):
-        while self.tasks.unfinished_tasks or not self.responses.empty():
-            try:
-                yield self.responses.get(timeout=0.1)
-            except Queue.Empty:
-                continue
+        try:
+            for response in self._iter_responses():
+                yield response
+        finally:
+            if self.running > 0:
+                # Iteration has been left before the end, do not let
+                # backends work for a consumer which is gone.
+                self.cancel()
 
         if self.errors:
             raise CallErrors(self.errors)
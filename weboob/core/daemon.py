@@ -0,0 +1,511 @@
+# -*- coding: utf-8 -*-
+
+# Copyright(C) 2014 Romain Bignon
+#
+# This file is part of weboob.
+#
+# weboob is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# weboob is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with weboob. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Share loaded backends between processes.
+
+A :class:`WeboobDaemon` serves the backends of a :class:`Weboob` object on
+a Unix socket, and a :class:`RemoteWeboob` calls them from another process,
+so modules are imported, backends configured and websites logged in only
+once.
+
+Messages are pickled, so the socket is only readable and writable by its
+owner.
+"""
+
+import errno
+import os
+import socket
+from threading import Event, Lock, RLock
+from types import FunctionType, GeneratorType
+try:
+    import cPickle as pickle
+except ImportError:
+    import pickle
+
+from weboob.core.bcall import CallErrors
+from weboob.core.ouiboube import WebNip
+from weboob.core.pool import ThreadPool, RemoteError
+from weboob.tools.compat import basestring
+from weboob.tools.log import getLogger
+from weboob.tools.misc import get_backtrace
+
+
+__all__ = ['DaemonError', 'WeboobDaemon', 'DaemonClient', 'RemoteBackend', 'RemoteWeboob', 'get_socket_path']
+
+
+class DaemonError(Exception):
+    """
+    Unable to communicate with the daemon.
+    """
+
+
+def get_socket_path(workdir):
+    """
+    Get path of the daemon socket, which can be set with the
+    ``WEBOOB_DAEMON_SOCKET`` environment variable.
+    """
+    return os.environ.get('WEBOOB_DAEMON_SOCKET', os.path.join(workdir, 'weboobd.sock'))
+
+
+def _send(fp, message):
+    try:
+        data = pickle.dumps(message, pickle.HIGHEST_PROTOCOL)
+    except Exception as error:
+        # Message can't be pickled.
+        error = RemoteError('Unable to send %r: %s' % (message[-1], error))
+        data = pickle.dumps(('error', error, get_backtrace(error)), pickle.HIGHEST_PROTOCOL)
+    fp.write(data)
+    fp.flush()
+
+
+def _iter_results(result):
+    if hasattr(result, '__iter__') and not isinstance(result, basestring):
+        return result
+    return None
+
+
+class WeboobDaemon(object):
+    """
+    Serve backends on a Unix socket.
+
+    Each connection is handled in a thread of a pool, and is used for a
+    single request:
+
+    - ``('backends',)`` gives information about loaded backends;
+    - ``('call', backend_name, method, args, kwargs)`` calls a method of a
+      backend;
+    - ``('do', function, args, kwargs)`` calls :func:`WebNip.do`.
+
+    The daemon answers with ``('value', value)``, or ``('iter',)`` followed
+    by ``('result', ...)`` messages, then ``('end',)``. An exception raised
+    is sent with ``('error', exception, backtrace)``, and an error of a
+    backend during a ``do`` request with ``('failure', backend_name,
+    exception, backtrace)``.
+
+    :param weboob: weboob object with loaded backends
+    :type weboob: :class:`weboob.core.ouiboube.WebNip`
+    :param path: path of the socket
+    :type path: :class:`str`
+    :param max_workers: maximum number of requests handled at once
+    :type max_workers: :class:`int`
+    """
+    def __init__(self, weboob, path, max_workers=None):
+        self.logger = getLogger('daemon')
+        self.weboob = weboob
+        self.path = path
+        self.pool = ThreadPool(max_workers, 'daemon')
+        self.socket = None
+        self.stopped = Event()
+
+    def bind(self):
+        if os.path.exists(self.path):
+            try:
+                DaemonClient(self.path).connect().close()
+            except DaemonError:
+                # Socket of a dead daemon.
+                os.remove(self.path)
+            else:
+                raise DaemonError('A daemon is already listening on %s' % self.path)
+
+        self.socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        umask = os.umask(0o077)
+        try:
+            self.socket.bind(self.path)
+        finally:
+            os.umask(umask)
+        self.socket.listen(16)
+        # Check regularly if the daemon has been stopped.
+        self.socket.settimeout(1.0)
+
+    def serve_forever(self):
+        """
+        Handle requests until :func:`stop` is called.
+        """
+        if self.socket is None:
+            self.bind()
+        self.logger.info(u'Listening on %s' % self.path)
+
+        while not self.stopped.is_set():
+            try:
+                conn, _ = self.socket.accept()
+            except socket.timeout:
+                continue
+            except socket.error as e:
+                if e.errno == errno.EINTR or self.stopped.is_set():
+                    continue
+                raise
+            conn.settimeout(None)
+            self.pool.submit(self._handle, conn)
+
+    def stop(self):
+        if self.stopped.is_set():
+            return
+        self.stopped.set()
+        if self.socket is not None:
+            self.socket.close()
+            if os.path.exists(self.path):
+                os.remove(self.path)
+        self.pool.shutdown(wait=False)
+
+    def _handle(self, conn):
+        rfile = conn.makefile('rb')
+        wfile = conn.makefile('wb')
+        try:
+            request = pickle.load(rfile)
+            handler = getattr(self, 'handle_%s' % request[0], None)
+            if handler is None:
+                raise DaemonError('Unknown request %r' % request[0])
+            handler(wfile, *request[1:])
+            _send(wfile, ('end',))
+        except (EOFError, socket.error) as e:
+            # The client has left, stop there.
+            self.logger.debug(u'Connection closed: %s' % e)
+        except Exception as e:
+            try:
+                _send(wfile, ('error', e, get_backtrace(e)))
+                _send(wfile, ('end',))
+            except socket.error:
+                pass
+        finally:
+            for fp in (rfile, wfile):
+                try:
+                    fp.close()
+                except socket.error:
+                    pass
+            conn.close()
+
+    def get_methods(self, backend):
+        """
+        Get names of public methods of a backend.
+        """
+        methods = set()
+        for klass in type(backend).__mro__:
+            for name, value in vars(klass).items():
+                if not name.startswith('_') and isinstance(value, (FunctionType, classmethod, staticmethod)):
+                    methods.add(name)
+        return methods
+
+    def get_constants(self, backend):
+        """
+        Get public constants of a backend class, like its description or
+        maintainer, which can be sent to clients.
+        """
+        constants = {}
+        for name in dir(type(backend)):
+            value = getattr(type(backend), name)
+            if name.isupper() and not name.startswith('_') and \
+               (value is None or isinstance(value, (basestring, bool, int, float))):
+                constants[name] = value
+        return constants
+
+    def handle_backends(self, out):
+        backends = [(backend.name, backend.NAME, [cap.__name__ for cap in backend.iter_caps()],
+                     sorted(self.get_methods(backend)), self.get_constants(backend))
+                    for backend in self.weboob.backend_instances.values()]
+        _send(out, ('value', backends))
+
+    def handle_call(self, out, backend_name, method, args, kwargs):
+        backend = self.weboob.get_backend(backend_name)
+        if method not in self.get_methods(backend):
+            raise AttributeError('%r object has no method %r' % (backend, method))
+
+        with backend:
+            result = getattr(backend, method)(*args, **kwargs)
+            results = _iter_results(result)
+            if results is None:
+                _send(out, ('value', result))
+                return
+
+            _send(out, ('iter',))
+            for subresult in results:
+                _send(out, ('result', subresult))
+
+    def handle_do(self, out, function, args, kwargs):
+        _send(out, ('iter',))
+        call = self.weboob.do(function, *args, **kwargs)
+        try:
+            for backend, result in call:
+                _send(out, ('result', backend.name, result))
+        except CallErrors as errors:
+            for backend, error, backtrace in errors:
+                _send(out, ('failure', backend.name, error, backtrace))
+        finally:
+            call.cancel()
+
+
+class DaemonClient(object):
+    """
+    Send requests to a :class:`WeboobDaemon`.
+
+    :param path: path of the socket
+    :type path: :class:`str`
+    """
+    def __init__(self, path):
+        self.logger = getLogger('daemon.client')
+        self.path = path
+
+    def connect(self):
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            sock.connect(self.path)
+        except socket.error as e:
+            sock.close()
+            raise DaemonError('Unable to connect to weboobd on %s: %s' % (self.path, e))
+        return sock
+
+    def request(self, *request):
+        """
+        Send a request and get its answer: a value, or an iterator on
+        results.
+        """
+        sock = self.connect()
+        rfile = sock.makefile('rb')
+        wfile = sock.makefile('wb')
+
+        def close():
+            rfile.close()
+            wfile.close()
+            sock.close()
+
+        try:
+            _send(wfile, request)
+            message = self._recv(rfile)
+            if message[0] == 'value':
+                return message[1]
+        except:
+            close()
+            raise
+
+        if message[0] != 'iter':
+            close()
+            raise DaemonError('Unexpected message %r' % (message,))
+
+        return self._iter(rfile, close)
+
+    def _recv(self, rfile):
+        try:
+            message = pickle.load(rfile)
+        except EOFError:
+            raise DaemonError('Connection closed by weboobd')
+        if message[0] == 'error':
+            self.logger.debug(u'Error in weboobd:\n%s' % message[2])
+            raise message[1]
+        return message
+
+    def _iter(self, rfile, close):
+        try:
+            while True:
+                message = self._recv(rfile)
+                if message[0] == 'end':
+                    return
+                yield message
+        finally:
+            close()
+
+    def iter_backends(self):
+        """
+        Iter on (name, module name, capabilities names, methods names,
+        constants) tuples of backends loaded by the daemon.
+        """
+        return iter(self.request('backends'))
+
+    def call(self, backend_name, method, *args, **kwargs):
+        """
+        Call a method of a backend loaded by the daemon.
+        """
+        result = self.request('call', backend_name, method, args, kwargs)
+        if isinstance(result, GeneratorType):
+            return (message[1] for message in result)
+        return result
+
+    def do(self, function, *args, **kwargs):
+        """
+        Call :func:`WebNip.do` in the daemon, and iter on (backend name,
+        result) tuples.
+
+        :raises: :class:`CallErrors` with backend names, once every results
+                 have been given, if some backends have failed.
+        """
+        results = self.request('do', function, args, kwargs)
+        errors = []
+        for message in results:
+            if message[0] == 'failure':
+                errors.append(message[1:])
+            else:
+                yield message[1:]
+        if errors:
+            raise CallErrors(errors)
+
+
+class RemoteBackend(object):
+    """
+    Backend loaded in a daemon.
+
+    Calling a method of the backend sends it to the daemon. The name,
+    capabilities, methods and class constants (``DESCRIPTION``,
+    ``MAINTAINER``...) of the backend are known.
+
+    Attributes which can't be shared with the daemon (see
+    :attr:`LOCAL_ATTRIBUTES`) are the ones of a copy of the backend created
+    in this process the first time one of them is used, so the module is
+    imported only by applications which need them. This copy has its own
+    browser, which is logged in separately.
+
+    :param weboob: weboob object which uses this backend
+    :type weboob: :class:`RemoteWeboob`
+    """
+    LOCAL_ATTRIBUTES = ('config', 'browser', 'storage')
+
+    def __init__(self, weboob, name, module_name, caps, methods, constants):
+        self.weboob = weboob
+        self.client = weboob.client
+        self.name = name
+        self.caps = caps
+        self.methods = set(methods)
+        self.constants = constants
+        self.constants['NAME'] = module_name
+        self.local = None
+        self.mutex = Lock()
+        # Calls are serialized by the daemon, this lock is only taken when
+        # the backend is unloaded.
+        self.lock = RLock()
+
+    def __repr__(self):
+        return '<RemoteBackend %r>' % self.name
+
+    def __enter__(self):
+        # Calls are serialized by the daemon.
+        pass
+
+    def __exit__(self, t, v, tb):
+        pass
+
+    def __getattr__(self, name):
+        if name.startswith('_'):
+            raise AttributeError('%r has no attribute %r' % (self, name))
+        if name in self.constants:
+            return self.constants[name]
+        if name in self.LOCAL_ATTRIBUTES:
+            return getattr(self.get_local_backend(), name)
+        if name not in self.methods:
+            raise AttributeError('%r has no method %r' % (self, name))
+
+        def method(*args, **kwargs):
+            return self.client.call(self.name, name, *args, **kwargs)
+        method.__name__ = name
+        return method
+
+    def get_local_backend(self):
+        """
+        Get the copy of this backend created in this process.
+
+        :rtype: :class:`weboob.tools.backend.Module`
+        """
+        with self.mutex:
+            if self.local is None:
+                self.local = self.weboob.build_local_backend(self.NAME, self.name)
+            return self.local
+
+    def has_caps(self, *caps):
+        """
+        Check if this backend implements at least one of these capabilities.
+        """
+        for c in caps:
+            if isinstance(c, tuple):
+                if self.has_caps(*c):
+                    return True
+            elif (c if isinstance(c, basestring) else c.__name__) in self.caps:
+                return True
+        return False
+
+    def fillobj(self, obj, fields=None):
+        """
+        Fill an object in the daemon, and copy fields in it.
+        """
+        if obj is None:
+            return obj
+        filled = self.client.call(self.name, 'fillobj', obj, fields)
+        if filled is not None and filled is not obj and type(filled) is type(obj):
+            obj.__dict__.update(filled.__dict__)
+        return obj
+
+    def deinit(self):
+        # The backend stays loaded in the daemon.
+        if self.local is not None:
+            self.local.deinit()
+
+
+class RemoteWeboob(WebNip):
+    """
+    Weboob object which uses the backends loaded by a daemon.
+
+    Calls are dispatched to backends in threads as with :class:`WebNip`, but
+    each backend sends the calls of its methods to the daemon.
+
+    :param path: path of the daemon socket
+    :type path: :class:`str`
+    :param weboob: local weboob object, to get its configuration and to
+                   create backends in this process when needed
+    :type weboob: :class:`weboob.core.ouiboube.Weboob`
+    """
+    def __init__(self, path, weboob=None, scheduler=None, max_workers=None):
+        super(RemoteWeboob, self).__init__(modules_path=False, scheduler=scheduler, max_workers=max_workers)
+        self.client = DaemonClient(path)
+        self.local = weboob
+        if weboob is not None:
+            self.callbacks.update(weboob.callbacks)
+            for attr in ('workdir', 'repositories', 'backends_config'):
+                if attr in weboob.__dict__:
+                    setattr(self, attr, getattr(weboob, attr))
+
+    def load_backends(self, caps=None, names=None, modules=None, exclude=None, storage=None, errors=None,
+                      parallel=False):
+        """
+        Use backends loaded by the daemon.
+
+        Parameters are the ones of :func:`weboob.core.ouiboube.Weboob.load_backends`,
+        but *storage* and *parallel* are ignored, as backends are already
+        created in the daemon.
+        """
+        loaded = {}
+        for name, module_name, caps_names, methods, constants in self.client.iter_backends():
+            backend = RemoteBackend(self, name, module_name, caps_names, methods, constants)
+            if names is not None and name not in names or \
+               modules is not None and module_name not in modules or \
+               exclude is not None and module_name in exclude or \
+               caps is not None and not backend.has_caps(caps):
+                continue
+
+            self.backend_instances[name] = loaded[name] = backend
+        return loaded
+
+    def build_local_backend(self, module_name, name):
+        """
+        Create in this process a backend loaded by the daemon, with its
+        configuration.
+
+        :rtype: :class:`weboob.tools.backend.Module`
+        """
+        if self.local is None:
+            raise DaemonError('Unable to create backend %s in this process' % name)
+
+        self.logger.debug(u'Create backend %s in this process' % name)
+        _, params = self.local.backends_config.get_backend(name)
+        return self.local.build_backend(module_name, params, self.local.storage, name)
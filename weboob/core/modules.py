@@ -20,8 +20,11 @@
 import os
 import imp
 import logging
+from threading import Lock
+from time import time
 
 from weboob.tools.backend import Module
+from weboob.tools.importprofile import profile_section
 from weboob.tools.log import getLogger
 
 
@@ -35,9 +38,11 @@ class ModuleLoadError(Exception):
 
 
 class LoadedModule(object):
-    def __init__(self, package):
+    def __init__(self, package, load_time=None):
         self.logger = getLogger('backend')
         self.package = package
+        # Seconds spent to import the package.
+        self.load_time = load_time
         self.klass = None
         for attrname in dir(self.package):
             attr = getattr(self.package, attrname)
@@ -108,13 +113,20 @@ class ModulesLoader(object):
         self.path = path
         self.loaded = {}
         self.logger = getLogger('modules')
+        # Modules can be loaded by several threads, but each one only once.
+        self.mutex = Lock()
+        self.module_locks = {}
 
     def get_or_load_module(self, module_name):
         """
         Can raise a ModuleLoadError exception.
         """
         if module_name not in self.loaded:
-            self.load_module(module_name)
+            with self.mutex:
+                lock = self.module_locks.setdefault(module_name, Lock())
+            with lock:
+                if module_name not in self.loaded:
+                    self.load_module(module_name)
         return self.loaded[module_name]
 
     def iter_existing_module_names(self):
@@ -138,15 +150,13 @@ class ModulesLoader(object):
             self.logger.debug('Module "%s" is already loaded from %s' % (module_name, self.loaded[module_name].package.__path__[0]))
             return
 
-        path = self.get_module_path(module_name)
-
         try:
-            fp, pathname, description = imp.find_module(module_name, [path])
-            try:
-                module = LoadedModule(imp.load_module(module_name, fp, pathname, description))
-            finally:
-                if fp:
-                    fp.close()
+            start = time()
+            with profile_section(module_name):
+                package = self.import_package(module_name)
+            module = LoadedModule(package, time() - start)
+        except ModuleLoadError:
+            raise
         except Exception as e:
             if logging.root.level == logging.DEBUG:
                 self.logger.exception(e)
@@ -157,7 +167,16 @@ class ModulesLoader(object):
                                                % (module.version, self.version))
 
         self.loaded[module_name] = module
-        self.logger.debug('Loaded module "%s" from %s' % (module_name, module.package.__path__[0]))
+        self.logger.debug('Loaded module "%s" from %s in %.3f seconds' % (module_name, module.package.__path__[0], module.load_time))
+
+    def import_package(self, module_name):
+        path = self.get_module_path(module_name)
+        fp, pathname, description = imp.find_module(module_name, [path])
+        try:
+            return imp.load_module(module_name, fp, pathname, description)
+        finally:
+            if fp:
+                fp.close()
 
     def get_module_path(self, module_name):
         return self.path
@@ -174,6 +193,14 @@ class RepositoryModulesLoader(ModulesLoader):
         for name in self.repositories.get_all_modules_info().iterkeys():
             yield name
 
+    def import_package(self, module_name):
+        minfo = self.repositories.get_module_info(module_name)
+        if minfo is not None and not minfo.is_local():
+            bundle = self.repositories.get_bundled_module(module_name)
+            if bundle is not None:
+                return bundle.load_module(module_name)
+        return super(RepositoryModulesLoader, self).import_package(module_name)
+
     def get_module_path(self, module_name):
         minfo = self.repositories.get_module_info(module_name)
         if minfo is None:
@@ -19,15 +19,23 @@
 
 
 import os
+from threading import Lock
+try:
+    import Queue
+except ImportError:
+    import queue as Queue
 
 from weboob.core.bcall import BackendsCall
 from weboob.core.modules import ModulesLoader, RepositoryModulesLoader, ModuleLoadError
 from weboob.core.backendscfg import BackendsConfig
+from weboob.core.pool import ThreadPool, Wakeup
 from weboob.core.repositories import Repositories, IProgress
 from weboob.core.scheduler import Scheduler
 from weboob.tools.backend import Module
 from weboob.tools.config.iconfig import ConfigError
+from weboob.tools.compat import basestring
 from weboob.tools.log import getLogger
+from weboob.tools.misc import get_backtrace
 
 
 __all__ = ['WebNip', 'Weboob']
@@ -50,14 +58,18 @@ class WebNip(object):
     :type storage: :class:`weboob.tools.storage.IStorage`
     :param scheduler: what scheduler to use; default is :class:`weboob.core.scheduler.Scheduler`
     :type scheduler: :class:`weboob.core.scheduler.IScheduler`
+    :param max_workers: maximum number of threads used to call backends
+                        (default: :attr:`weboob.core.pool.ThreadPool.MAX_WORKERS`)
+    :type max_workers: :class:`int`
     """
     VERSION = '1.0'
 
-    def __init__(self, modules_path=None, storage=None, scheduler=None):
+    def __init__(self, modules_path=None, storage=None, scheduler=None, max_workers=None):
         self.logger = getLogger('weboob')
         self.backend_instances = {}
         self.callbacks = {'login':   lambda backend_name, value: None,
                           'captcha': lambda backend_name, image: None,
+                          'stats':   lambda stats: None,
                          }
 
         if modules_path is None:
@@ -73,6 +85,9 @@ class WebNip(object):
 
         self.storage = storage
 
+        # Threads are shared by every calls on backends.
+        self.pool = ThreadPool(max_workers, 'bcall')
+
     def __deinit__(self):
         self.deinit()
 
@@ -81,7 +96,10 @@ class WebNip(object):
         Call this method when you stop using Weboob, to
         properly unload all correctly.
         """
-        self.unload_backends()
+        # Wait for calls in progress, but not for backends which have been
+        # given up after a timeout.
+        self.pool.shutdown()
+        self.unload_backends(wait=False)
 
     def build_backend(self, module_name, params=None, storage=None, name=None):
         """
@@ -139,12 +157,16 @@ class WebNip(object):
         self.backend_instances[name] = backend
         return backend
 
-    def unload_backends(self, names=None):
+    def unload_backends(self, names=None, wait=True):
         """
         Unload backends.
 
         :param names: if specified, only unload that backends
         :type names: :class:`list`
+        :param wait: if False, backends still used by a thread, for example
+                     because a call has been given up after a timeout, are
+                     not deinitialized
+        :type wait: :class:`bool`
         """
         unloaded = {}
         if isinstance(names, basestring):
@@ -152,10 +174,18 @@ class WebNip(object):
         elif names is None:
             names = self.backend_instances.keys()
 
-        for name in names:
+        for name in list(names):
             backend = self.backend_instances.pop(name)
-            with backend:
-                backend.deinit()
+            if wait:
+                with backend:
+                    backend.deinit()
+            elif backend.lock.acquire(False):
+                try:
+                    backend.deinit()
+                finally:
+                    backend.lock.release()
+            else:
+                self.logger.warning(u'Backend %s is still busy, it is not deinitialized', backend.name)
             unloaded[backend.name] = backend
 
         return unloaded
@@ -223,7 +253,78 @@ class WebNip(object):
         :type backends: list[:class:`str`]
         :param caps: iterate on backends which implement this caps
         :type caps: list[:class:`weboob.capabilities.base.Capability`]
+        :param timeout: after this number of seconds, stop waiting for
+                        backends which have not finished
+        :type timeout: :class:`float`
+        :param per_backend_timeout: stop waiting for a backend after this
+                                    number of seconds since it has started
+        :type per_backend_timeout: :class:`float`
+        :param max_buffered: pause backends when this number of results are
+                             waiting to be read
+        :type max_buffered: :class:`int`
+        :param merge_key: if every backend gives results ordered by this key
+                          (a function or an attribute name), merge them to
+                          give results globally ordered, as soon as possible
+        :type merge_key: :class:`callable` or :class:`str`
+        :param merge_reverse: results are ordered from the greatest key
+        :type merge_reverse: :class:`bool`
+        :param processes: backends (names or instances) to call in a forked
+                          process instead of a thread, or True for every
+                          backends; it is useful for CPU-bound backends, but
+                          changes they make on their state are lost
+        :type processes: :class:`bool` or list
+        :param dedup: drop results already given by another backend: True
+                      to compare them with
+                      :func:`weboob.capabilities.base.BaseObject.fingerprint`,
+                      or a function returning the fingerprint of a result
+        :type dedup: :class:`bool` or :class:`callable`
         :rtype: A :class:`weboob.core.bcall.BackendsCall` object (iterable)
+
+        Results received before the timeout are yielded, and every backend
+        which has been given up is reported with a
+        :class:`weboob.core.bcall.BackendTimeout` error in the
+        :class:`weboob.core.bcall.CallErrors` exception.
+
+        Measures of the call are in the ``stats`` attribute of the returned
+        object (see :class:`weboob.core.bcall.CallStats`). They are also
+        given to the ``callbacks['stats']`` function once results have been
+        read, for example to send them to a metrics system.
+        """
+        backends, params = self._pop_call_params(kwargs)
+
+        # The return value MUST BE the BackendsCall instance. Please never iterate
+        # here on this object, because caller might want to use other methods, like
+        # wait() on callback_thread().
+        # Thanks a lot.
+        kwargs.update(params)
+        return BackendsCall(backends, function, pool=self.pool, *args, **kwargs)
+
+    def ado(self, function, *args, **kwargs):
+        """
+        Do calls on loaded backends, and get results in an asyncio event loop.
+
+        Parameters are the same than :func:`do`, with an optional *loop*
+        parameter to select the event loop (default is the current one).
+
+        :rtype: A :class:`weboob.core.aio.AsyncBackendsCall` object
+                (asynchronous iterable)
+        """
+        from weboob.core.aio import asyncio, AsyncBackendsCall
+
+        loop = kwargs.pop('loop', None)
+        if loop is None:
+            loop = asyncio.get_event_loop()
+
+        backends, params = self._pop_call_params(kwargs)
+        kwargs.update(params)
+        return AsyncBackendsCall(loop, backends, function, pool=self.pool, *args, **kwargs)
+
+    def _pop_call_params(self, kwargs):
+        """
+        Get backends to call and parameters of the call from the keyword
+        arguments given to :func:`do`. They are removed from *kwargs*.
+
+        :rtype: tuple[list[:class:`weboob.tools.backend.Module`], :class:`dict`]
         """
         backends = self.backend_instances.values()
         _backends = kwargs.pop('backends', None)
@@ -253,11 +354,16 @@ class WebNip(object):
             caps = kwargs.pop('caps')
             backends = [backend for backend in backends if backend.has_caps(caps)]
 
-        # The return value MUST BE the BackendsCall instance. Please never iterate
-        # here on this object, because caller might want to use other methods, like
-        # wait() on callback_thread().
-        # Thanks a lot.
-        return BackendsCall(backends, function, *args, **kwargs)
+        params = {'timeout':             kwargs.pop('timeout', None),
+                  'per_backend_timeout': kwargs.pop('per_backend_timeout', None),
+                  'max_buffered':        kwargs.pop('max_buffered', None),
+                  'merge_key':           kwargs.pop('merge_key', None),
+                  'merge_reverse':       kwargs.pop('merge_reverse', False),
+                  'processes':           kwargs.pop('processes', None),
+                  'dedup':               kwargs.pop('dedup', None),
+                  'stats_callback':      self.callbacks['stats'],
+                 }
+        return backends, params
 
     def schedule(self, interval, function, *args):
         """
@@ -272,10 +378,13 @@ class WebNip(object):
         """
         return self.scheduler.schedule(interval, function, *args)
 
-    def repeat(self, interval, function, *args):
+    def repeat(self, interval, function, *args, **kwargs):
         """
         Repeat a call to a function
 
+        Keyword arguments are options given to the scheduler, see
+        :func:`weboob.core.scheduler.Scheduler.repeat`.
+
         :param interval: interval between two calls
         :type interval: int
         :param function: function to call
@@ -283,7 +392,7 @@ class WebNip(object):
         :param args: arguments to give to function
         :returns: an event identificator
         """
-        return self.scheduler.repeat(interval, function, *args)
+        return self.scheduler.repeat(interval, function, *args, **kwargs)
 
     def cancel(self, ev):
         """
@@ -318,11 +427,14 @@ class Weboob(WebNip):
     :type backends_filename: str
     :param storage: provide a storage where backends can save data
     :type storage: :class:`weboob.tools.storage.IStorage`
+    :param max_workers: maximum number of threads used to call backends
+    :type max_workers: :class:`int`
     """
     BACKENDS_FILENAME = 'backends'
 
-    def __init__(self, workdir=None, backends_filename=None, scheduler=None, storage=None):
-        super(Weboob, self).__init__(modules_path=False, scheduler=scheduler, storage=storage)
+    def __init__(self, workdir=None, backends_filename=None, scheduler=None, storage=None, max_workers=None):
+        super(Weboob, self).__init__(modules_path=False, scheduler=scheduler, storage=storage,
+                                     max_workers=max_workers)
 
         # Create WORKDIR
         if workdir is not None:
@@ -387,7 +499,8 @@ class Weboob(WebNip):
 
         return super(Weboob, self).build_backend(module_name, params, storage, name)
 
-    def load_backends(self, caps=None, names=None, modules=None, exclude=None, storage=None, errors=None):
+    def load_backends(self, caps=None, names=None, modules=None, exclude=None, storage=None, errors=None,
+                      parallel=False):
         """
         Load backends listed in config file.
 
@@ -403,6 +516,11 @@ class Weboob(WebNip):
         :type storage: :class:`weboob.tools.storage.IStorage`
         :param errors: if specified, store every errors in this list
         :type errors: list[:class:`LoadError`]
+        :param parallel: import modules and create backends in threads (at
+                         most :attr:`weboob.core.pool.ThreadPool.MAX_WORKERS`),
+                         so the time to load them is the one of the slowest;
+                         only use it if modules can be created concurrently
+        :type parallel: :class:`bool`
         :returns: loaded backends
         :rtype: dict[:class:`str`, :class:`weboob.tools.backend.Module`]
         """
@@ -414,6 +532,7 @@ class Weboob(WebNip):
             self.logger.error(u'Repositories are not consistent with the sources.list')
             raise VersionsMismatchError(u'Versions mismatch, please run "weboob-config update"')
 
+        selected = []
         for instance_name, module_name, params in self.backends_config.iter_backends():
             if '_enabled' in params and not params['_enabled'].lower() in ('1', 'y', 'true', 'on', 'yes') or \
                names is not None and instance_name not in names or \
@@ -433,22 +552,103 @@ class Weboob(WebNip):
             if not minfo.is_installed():
                 self.repositories.install(minfo)
 
-            module = None
-            try:
-                module = self.modules_loader.get_or_load_module(module_name)
-            except ModuleLoadError as e:
-                self.logger.error(u'Unable to load module "%s": %s', module_name, e)
-                continue
-
             if instance_name in self.backend_instances:
                 self.logger.warning(u'Oops, the backend "%s" is already loaded. Unload it before reloading...', instance_name)
                 self.unload_backends(instance_name)
 
-            try:
-                backend_instance = module.create_instance(self, instance_name, params, storage)
-            except Module.ConfigError as e:
+            selected.append((instance_name, module_name, params))
+
+        if parallel and len(selected) > 1:
+            results = self._create_backends_in_threads(selected, storage)
+        else:
+            results = (self._create_backend(instance_name, module_name, params, storage)
+                       for instance_name, module_name, params in selected)
+
+        for instance_name, backend_instance, error in results:
+            if error is not None:
                 if errors is not None:
-                    errors.append(self.LoadError(instance_name, e))
-            else:
+                    errors.append(error)
+            elif backend_instance is not None:
                 self.backend_instances[instance_name] = loaded[instance_name] = backend_instance
         return loaded
+
+    def _create_backend(self, instance_name, module_name, params, storage):
+        """
+        Load the module and create a backend.
+
+        :returns: tuple (instance_name, backend, error), where backend is None
+                  if the module can't be loaded or the backend is misconfigured
+        """
+        try:
+            module = self.modules_loader.get_or_load_module(module_name)
+        except ModuleLoadError as e:
+            self.logger.error(u'Unable to load module "%s": %s', module_name, e)
+            return instance_name, None, None
+
+        try:
+            backend_instance = module.create_instance(self, instance_name, params, storage)
+        except Module.ConfigError as e:
+            return instance_name, None, self.LoadError(instance_name, e)
+        return instance_name, backend_instance, None
+
+    def _create_backends_in_threads(self, selected, storage):
+        """
+        Call :func:`_create_backend` for every selected backend in a thread.
+
+        Results are returned in the order of the config file. Callbacks, which
+        may prompt the user, are never called by two threads at once.
+        """
+        pool = ThreadPool(min(len(selected), ThreadPool.MAX_WORKERS), 'load')
+        responses = Queue.Queue()
+
+        def create(instance_name, module_name, params):
+            try:
+                responses.put((instance_name, self._create_backend(instance_name, module_name, params, storage), None))
+            except BaseException as e:
+                responses.put((instance_name, None, (e, get_backtrace(e))))
+
+        callbacks = dict(self.callbacks)
+        callbacks_lock = Lock()
+
+        def serialized(callback):
+            def wrapper(*args, **kwargs):
+                with callbacks_lock:
+                    return callback(*args, **kwargs)
+            return wrapper
+
+        results = {}
+        failure = None
+        self.callbacks.update((key, serialized(callback)) for key, callback in callbacks.items())
+        try:
+            for instance_name, module_name, params in selected:
+                pool.submit(create, instance_name, module_name, params)
+
+            while len(results) < len(selected):
+                try:
+                    # Wait with a timeout, to not ignore KeyboardInterrupt.
+                    instance_name, result, error = responses.get(timeout=Wakeup.INTERRUPTIBLE_WAIT)
+                except Queue.Empty:
+                    continue
+                results[instance_name] = result
+                if error is not None and failure is None:
+                    failure = error
+        except BaseException:
+            # Interrupted: unload backends created until now.
+            self._deinit_created(results.values())
+            raise
+        finally:
+            self.callbacks.update(callbacks)
+            pool.shutdown(wait=False)
+
+        if failure is not None:
+            self.logger.error(u'Unable to create backend:\n%s', failure[1])
+            # Unload backends created before the failure.
+            self._deinit_created(results.values())
+            raise failure[0]
+
+        return [results[name] for name, _, _ in selected]
+
+    def _deinit_created(self, results):
+        for result in results:
+            if result is not None and result[1] is not None:
+                result[1].deinit()
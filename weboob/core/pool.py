@@ -0,0 +1,411 @@
+# -*- coding: utf-8 -*-
+
+# Copyright(C) 2014 Romain Bignon
+#
+# This file is part of weboob.
+#
+# weboob is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# weboob is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with weboob. If not, see <http://www.gnu.org/licenses/>.
+
+
+import errno
+import os
+import select
+import sys
+from collections import deque
+from threading import Thread, Lock, Condition, Event, current_thread, _MainThread
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+from weboob.tools.compat import basestring
+from weboob.tools.misc import get_backtrace
+from weboob.tools.log import getLogger
+
+
+__all__ = ['ThreadPool', 'Task', 'Wakeup', 'RemoteError', 'can_fork', 'iter_in_process', 'imap_in_processes']
+
+
+class Task(object):
+    """
+    Function submitted to a :class:`ThreadPool`.
+    """
+    def __init__(self, function, args, kwargs):
+        self.function = function
+        self.args = args
+        self.kwargs = kwargs
+        # Worker thread running this task.
+        self.thread = None
+        self.done = False
+        self.abandoned = False
+
+    def __repr__(self):
+        return '<Task %r>' % self.function
+
+
+class ThreadPool(object):
+    """
+    Pool of worker threads.
+
+    Threads are started lazily, when a task is submitted and no worker is
+    idle, and there are never more than *max_workers* of them. Started
+    workers are kept alive to run the next tasks, so calling a method on
+    every backend does not cost a thread creation for each one.
+
+    A task which is stuck can be given up with :func:`abandon`: its thread
+    does not count anymore against *max_workers*, and is not waited for
+    by :func:`shutdown`.
+
+    :param max_workers: maximum number of threads to start
+    :type max_workers: :class:`int`
+    :param name: name used for threads and logging
+    :type name: :class:`str`
+    """
+    MAX_WORKERS = 30
+
+    def __init__(self, max_workers=None, name='pool'):
+        self.logger = getLogger(name)
+        self.name = name
+        self.max_workers = max_workers or self.MAX_WORKERS
+
+        self.mutex = Lock()
+        self.changed = Condition(self.mutex)
+        self.tasks = deque()
+        self.workers = []
+        # Workers waiting for a task.
+        self.idle = 0
+        self.started = 0
+        self.stopped = False
+
+    def submit(self, function, *args, **kwargs):
+        """
+        Run a function in a worker thread.
+
+        Exceptions raised by the function are logged and ignored, so the
+        function is responsible to report its errors itself.
+
+        :rtype: :class:`Task`
+        """
+        task = Task(function, args, kwargs)
+        with self.mutex:
+            if self.stopped:
+                raise RuntimeError('Pool %s is stopped' % self.name)
+
+            self.tasks.append(task)
+            self._start_workers()
+            self.changed.notify()
+        return task
+
+    def _start_workers(self):
+        # Called with the mutex held.
+        while len(self.tasks) > self.idle and len(self.workers) < self.max_workers:
+            thread = Thread(target=self._worker_run, name='%s-%d' % (self.name, self.started))
+            thread.daemon = True
+            self.started += 1
+            self.workers.append(thread)
+            # The new worker is counted as idle until it takes a task.
+            self.idle += 1
+            thread.start()
+
+    def abandon(self, task):
+        """
+        Give up a task.
+
+        If it has not been started, it is never run. Otherwise, its thread
+        is left running it, and another worker is started if needed to run
+        the next tasks.
+        """
+        with self.mutex:
+            if task.done or task.abandoned:
+                return
+            task.abandoned = True
+
+            if task.thread is None:
+                self.tasks.remove(task)
+                return
+
+            self.logger.debug('Abandon task %r running in %s' % (task, task.thread.name))
+            self.workers.remove(task.thread)
+            if not self.stopped:
+                self._start_workers()
+
+    def _worker_run(self):
+        thread = current_thread()
+        while True:
+            with self.mutex:
+                while not self.tasks and not self.stopped:
+                    self.changed.wait()
+                if not self.tasks:
+                    self.idle -= 1
+                    self.workers.remove(thread)
+                    return
+
+                task = self.tasks.popleft()
+                task.thread = thread
+                self.idle -= 1
+
+            try:
+                task.function(*task.args, **task.kwargs)
+            except Exception:
+                self.logger.error('Task %r of pool %s failed:\n%s' % (task.function, self.name, get_backtrace()))
+
+            with self.mutex:
+                task.done = True
+                # Drop references before waiting for the next task.
+                task.function = task.args = task.kwargs = None
+                if task.abandoned:
+                    # Another worker has replaced this one.
+                    return
+                self.idle += 1
+
+    def count_workers(self):
+        """
+        Get number of running worker threads, without the ones running
+        abandoned tasks.
+        """
+        return len(self.workers)
+
+    def shutdown(self, wait=True):
+        """
+        Stop workers once the already submitted tasks are done.
+
+        :param wait: if True, wait for every worker to stop, except the
+                     ones running abandoned tasks
+        :type wait: :class:`bool`
+        """
+        with self.mutex:
+            if self.stopped:
+                return
+            self.stopped = True
+            self.changed.notify_all()
+
+            workers = list(self.workers)
+
+        if wait:
+            for thread in workers:
+                if thread is not current_thread():
+                    thread.join()
+
+
+class Wakeup(object):
+    """
+    Wake up a thread waiting for something to happen.
+
+    The waiting thread checks its condition, and calls :func:`wait` if it
+    is not met yet. Other threads call :func:`notify` after they have
+    changed the condition. A notification is kept until the next
+    :func:`wait`, so none is lost between the check and the wait.
+
+    On Python 2, waits of locks and events with a timeout are loops of
+    sleeps of up to 50ms, and waits without timeout can't be interrupted by
+    SIGINT. So when possible, the thread waits in select() on a pipe where
+    :func:`notify` writes. Otherwise an :class:`Event` is used, and the
+    main thread wakes up every :attr:`INTERRUPTIBLE_WAIT` seconds.
+
+    :func:`close` has to be called to release the pipe.
+    """
+    USE_PIPE = fcntl is not None and sys.version_info[0] < 3
+    # Seconds between two wake-ups of the main thread waiting on an event.
+    INTERRUPTIBLE_WAIT = 1.0
+
+    def __init__(self):
+        self.mutex = Lock()
+        self.pipe = None
+        self.event = None
+        if self.USE_PIPE:
+            self.pipe = os.pipe()
+            for fd in self.pipe:
+                fcntl.fcntl(fd, fcntl.F_SETFL, fcntl.fcntl(fd, fcntl.F_GETFL) | os.O_NONBLOCK)
+        else:
+            self.event = Event()
+
+    def notify(self):
+        with self.mutex:
+            if self.event is not None:
+                self.event.set()
+            elif self.pipe is not None:
+                try:
+                    os.write(self.pipe[1], b'\0')
+                except OSError:
+                    # Pipe is full, so the thread will wake up anyway.
+                    pass
+
+    def wait(self, timeout=None):
+        """
+        Wait for a notification.
+
+        It may return earlier without notification, so the condition has to
+        be checked again.
+
+        :param timeout: maximum number of seconds to wait, or None
+        :type timeout: :class:`float`
+        """
+        if self.event is not None:
+            if isinstance(current_thread(), _MainThread):
+                timeout = min(timeout, self.INTERRUPTIBLE_WAIT) if timeout is not None else self.INTERRUPTIBLE_WAIT
+            self.event.wait(timeout)
+            self.event.clear()
+            return
+
+        try:
+            readable, _, _ = select.select([self.pipe[0]], [], [], timeout)
+        except select.error as e:
+            # SIGINT raises KeyboardInterrupt from select().
+            if e.args[0] != errno.EINTR:
+                raise
+            return
+
+        if readable:
+            try:
+                os.read(self.pipe[0], 4096)
+            except OSError:
+                pass
+
+    def close(self):
+        with self.mutex:
+            if self.pipe is not None:
+                for fd in self.pipe:
+                    os.close(fd)
+                self.pipe = None
+
+
+class RemoteError(Exception):
+    """
+    Error in a worker process which can't be given back as is.
+    """
+
+
+def can_fork():
+    """
+    Check if functions can be run in forked processes on this platform.
+    """
+    return hasattr(os, 'fork')
+
+
+def _process_send(conn, message):
+    try:
+        conn.send(message)
+    except Exception as error:
+        # Message can't be pickled.
+        conn.send(('error', RemoteError('Unable to send %r: %s' % (message[1], error)), get_backtrace(error)))
+
+
+def _process_run(conn, function, args, kwargs):
+    try:
+        result = function(*args, **kwargs)
+        if hasattr(result, '__iter__') and not isinstance(result, basestring):
+            for subresult in result:
+                _process_send(conn, ('result', subresult))
+        else:
+            _process_send(conn, ('result', result))
+    except Exception as error:
+        _process_send(conn, ('error', error, get_backtrace(error)))
+    finally:
+        conn.send(('end',))
+        conn.close()
+
+
+def iter_in_process(function, args=(), kwargs=None, cancelled=None, wait=0.1):
+    """
+    Call a function in a forked process, and iter on what it returns.
+
+    The process is a copy of the current one, so the function and its
+    arguments do not need to be pickable, but every changes it makes are
+    lost. Results are pickled to be sent back.
+
+    It yields tuples:
+
+    - ``('result', value)`` for each item returned by the function (or
+      once if it does not return an iterable);
+    - ``('error', exception, backtrace)`` if an exception is raised.
+
+    :param cancelled: if given, function called regularly to know if the
+                      process has to be killed
+    :type cancelled: :class:`callable`
+    :param wait: seconds between two calls of *cancelled*
+    :type wait: :class:`float`
+    """
+    if kwargs is None:
+        kwargs = {}
+
+    import multiprocessing
+    if hasattr(multiprocessing, 'get_context'):
+        context = multiprocessing.get_context('fork')
+    else:
+        context = multiprocessing
+
+    reader, writer = context.Pipe(duplex=False)
+    process = context.Process(target=_process_run, args=(writer, function, args, kwargs))
+    process.daemon = True
+    process.start()
+    writer.close()
+
+    try:
+        while True:
+            while not reader.poll(wait):
+                if cancelled is not None and cancelled():
+                    return
+            try:
+                message = reader.recv()
+            except EOFError:
+                yield ('error', RemoteError('Worker process %s has died' % process.pid), '')
+                return
+
+            if message[0] == 'end':
+                return
+            yield message
+    finally:
+        reader.close()
+        if process.is_alive():
+            process.terminate()
+        process.join()
+
+
+def imap_in_processes(function, items, max_workers=None):
+    """
+    Call a function on every items in a pool of forked processes, and
+    iter on what it returns, in no particular order.
+
+    As with :func:`iter_in_process`, processes are copies of the current
+    one and every changes made by the function are lost. The function has
+    to be defined at the top level of a module, as it is pickled with
+    items and results. If the platform can't fork, the function is called
+    in the current process.
+
+    :param max_workers: maximum number of processes (default: number of CPUs)
+    :type max_workers: :class:`int`
+    """
+    items = list(items)
+    if not items:
+        return
+
+    if not can_fork():
+        for item in items:
+            yield function(item)
+        return
+
+    import multiprocessing
+    if hasattr(multiprocessing, 'get_context'):
+        context = multiprocessing.get_context('fork')
+    else:
+        context = multiprocessing
+
+    processes = min(max_workers or multiprocessing.cpu_count(), len(items))
+    pool = context.Pool(processes)
+    try:
+        for result in pool.imap_unordered(function, items):
+            yield result
+    finally:
+        pool.terminate()
+        pool.join()
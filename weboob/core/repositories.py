@@ -28,13 +28,18 @@ import os
 import subprocess
 from datetime import datetime
 from contextlib import closing
-from compileall import compile_dir
 from io import BytesIO
+from threading import Event, Lock
+try:
+    import Queue
+except ImportError:
+    import queue as Queue
 
 from weboob.tools.exceptions import BrowserHTTPError, BrowserHTTPNotFound
 from .modules import LoadedModule
+from .pool import ThreadPool, imap_in_processes
 from weboob.tools.log import getLogger
-from weboob.tools.misc import to_unicode
+from weboob.tools.misc import get_backtrace, to_unicode
 try:
     from ConfigParser import RawConfigParser, DEFAULTSECT
 except ImportError:
@@ -42,7 +47,7 @@ except ImportError:
 
 
 __all__ = ['IProgress', 'ModuleInstallError', 'ModuleInfo', 'RepositoryUnavailable',
-           'Repository', 'Versions', 'Repositories', 'InvalidSignature', 'Keyring']
+           'Repository', 'Versions', 'HTTPCache', 'SignatureCache', 'ModulesBundle', 'Repositories', 'InvalidSignature', 'Keyring']
 
 
 class ModuleInfo(object):
@@ -112,6 +117,7 @@ class Repository(object):
     Represents a repository.
     """
     INDEX = 'modules.list'
+    HASHES = 'modules.hashes'
     KEYDIR = '.keys'
     KEYRING = 'trusted.gpg'
 
@@ -149,13 +155,24 @@ class Repository(object):
             return self.url[len('file://'):]
         return self.url
 
-    def retrieve_index(self, browser, repo_path):
+    def download(self, browser, url, cache=None):
+        """
+        Get the content of a file of this repository, with a conditional
+        request if a cache is given.
+        """
+        if cache is not None:
+            return cache.open(browser, url)
+        return browser.open(url).content
+
+    def retrieve_index(self, browser, repo_path, cache=None):
         """
         Retrieve the index file of this repository. It can use network
         if this is a remote repository.
 
         :param repo_path: path to save the downloaded index file.
         :type repo_path: str
+        :param cache: cache to not download again an unchanged index
+        :type cache: :class:`HTTPCache`
         """
         if self.local:
             # Repository is local, open the file.
@@ -170,7 +187,7 @@ class Repository(object):
         else:
             # This is a remote repository, download file
             try:
-                fp = BytesIO(browser.open(posixpath.join(self.url, self.INDEX)).content)
+                fp = BytesIO(self.download(browser, posixpath.join(self.url, self.INDEX), cache))
             except BrowserHTTPError as e:
                 raise RepositoryUnavailable(unicode(e))
 
@@ -183,7 +200,7 @@ class Repository(object):
         # Save the repository index in ~/.weboob/repositories/
         self.save(repo_path, private=True)
 
-    def retrieve_keyring(self, browser, keyring_path):
+    def retrieve_keyring(self, browser, keyring_path, cache=None):
         # ignore local
         if self.local:
             return
@@ -198,8 +215,13 @@ class Repository(object):
         if not keyring.exists() or self.key_update > keyring.version:
             # This is a remote repository, download file
             try:
-                keyring_data = browser.open(posixpath.join(self.url, self.KEYRING)).content
-                sig_data = browser.open(posixpath.join(self.url, self.KEYRING + '.sig')).content
+                keyring_data = self.download(browser, posixpath.join(self.url, self.KEYRING), cache)
+                if keyring.exists() and keyring.has_data(keyring_data):
+                    # Only the version has changed, the keyring is
+                    # already trusted.
+                    keyring.save(keyring_data, self.key_update)
+                    return
+                sig_data = self.download(browser, posixpath.join(self.url, self.KEYRING + '.sig'), cache)
             except BrowserHTTPError as e:
                 raise RepositoryUnavailable(unicode(e))
             if keyring.exists():
@@ -254,14 +276,21 @@ class Repository(object):
                 module.signed = self.signed
             self.modules[section] = module
 
-    def build_index(self, path, filename):
+    def build_index(self, path, filename, max_workers=None):
         """
         Rebuild index of modules of repository.
 
+        A hash of the files of each module is saved in a HASHES file next
+        to the index. Modules which have not changed since the previous
+        index are not imported again, and the other ones are imported in
+        forked processes.
+
         :param path: path of the repository
         :type path: str
         :param filename: file to save index
         :type filename: str
+        :param max_workers: maximum number of processes importing modules
+        :type max_workers: int
         """
         print('Rebuild index')
         self.modules.clear()
@@ -273,44 +302,112 @@ class Repository(object):
             self.signed = False
             self.key_update = 0
 
+        hashes_path = os.path.join(os.path.dirname(filename), self.HASHES)
+        previous_hashes = self.load_hashes(hashes_path)
+        previous_modules = {}
+        if previous_hashes:
+            try:
+                with open(filename, 'r') as fp:
+                    config = RawConfigParser()
+                    config.readfp(fp)
+                for section in config.sections():
+                    previous_modules[section] = dict(config.items(section))
+            except Exception:
+                # The index is rebuilt from scratch.
+                pass
+
+        hashes = {}
+        infos = {}
+        to_load = []
         for name in sorted(os.listdir(path)):
             module_path = os.path.join(path, name)
             if not os.path.isdir(module_path) or '.' in name or name == self.KEYDIR:
                 continue
 
-            try:
-                fp, pathname, description = imp.find_module(name, [path])
-                try:
-                    module = LoadedModule(imp.load_module(name, fp, pathname, description))
-                finally:
-                    if fp:
-                        fp.close()
-            except Exception as e:
-                print('Unable to build module %s: [%s] %s' % (name, type(e).__name__, e), file=sys.stderr)
+            hashes[name] = self.get_tree_hash(module_path)
+            if previous_hashes.get(name) == hashes[name] and name in previous_modules:
+                m = ModuleInfo(name)
+                m.load(previous_modules[name])
+                infos[name] = m
+            else:
+                to_load.append((path, name))
+
+        for name, items, error in imap_in_processes(_load_module_info, to_load, max_workers):
+            if error is not None:
+                print('Unable to build module %s: %s' % (name, error), file=sys.stderr)
+                del hashes[name]
             else:
-                m = ModuleInfo(module.name)
-                m.version = self.get_tree_mtime(module_path)
-                m.capabilities = list(set([c.__name__ for c in module.iter_caps()]))
-                m.description = module.description
-                m.maintainer = module.maintainer
-                m.license = module.license
-                m.icon = module.icon or ''
-                self.modules[module.name] = m
+                m = ModuleInfo(items['name'])
+                for key, value in items.items():
+                    setattr(m, key, value)
+                infos[name] = m
+
+        for name in sorted(infos):
+            m = infos[name]
+            m.version = self.get_tree_mtime(os.path.join(path, name))
+            self.modules[m.name] = m
 
         self.update = int(datetime.now().strftime('%Y%m%d%H%M'))
         self.save(filename)
+        self.save_hashes(hashes_path, hashes)
+
+    @staticmethod
+    def load_hashes(path):
+        hashes = {}
+        try:
+            with open(path, 'r') as fp:
+                for line in fp:
+                    name, value = line.split()
+                    hashes[name] = value
+        except (IOError, ValueError):
+            return {}
+        return hashes
+
+    @staticmethod
+    def save_hashes(path, hashes):
+        with open(path + '.tmp', 'w') as fp:
+            for name in sorted(hashes):
+                fp.write('%s %s\n' % (name, hashes[name]))
+        os.rename(path + '.tmp', path)
+
+    @staticmethod
+    def get_tree_hash(path):
+        """
+        Get a hash of the names and contents of files in a tree.
+        """
+        import hashlib
+        h = hashlib.sha1()
+        for root, dirs, files in os.walk(path):
+            dirs.sort()
+            for f in sorted(files):
+                if f.endswith('.pyc'):
+                    continue
+                filepath = os.path.join(root, f)
+                h.update(os.path.relpath(filepath, path).encode('utf-8') + b'\0')
+                with open(filepath, 'rb') as fp:
+                    h.update(hashlib.sha1(fp.read()).digest())
+        return h.hexdigest()
 
     @staticmethod
     def get_tree_mtime(path, include_root=False):
+        # Local times only change every minute, so files modified in the
+        # same minute are converted once.
+        minutes = {}
+
+        def to_version(mtime):
+            minute = int(mtime // 60)
+            if minute not in minutes:
+                minutes[minute] = int(datetime.fromtimestamp(minute * 60).strftime('%Y%m%d%H%M'))
+            return minutes[minute]
+
         mtime = 0
         if include_root:
-            mtime = int(datetime.fromtimestamp(os.path.getmtime(path)).strftime('%Y%m%d%H%M'))
+            mtime = to_version(os.path.getmtime(path))
         for root, dirs, files in os.walk(path):
             for f in files:
                 if f.endswith('.pyc'):
                     continue
-                m = int(datetime.fromtimestamp(os.path.getmtime(os.path.join(root, f))).strftime('%Y%m%d%H%M'))
-                mtime = max(mtime, m)
+                mtime = max(mtime, to_version(os.path.getmtime(os.path.join(root, f))))
 
         return mtime
 
@@ -341,6 +438,32 @@ class Repository(object):
             config.write(f)
 
 
+def _load_module_info(args):
+    """
+    Import a module of a repository to get the information of its index.
+
+    It is called in a worker process by :func:`Repository.build_index`.
+    """
+    path, name = args
+    try:
+        fp, pathname, description = imp.find_module(name, [path])
+        try:
+            module = LoadedModule(imp.load_module(name, fp, pathname, description))
+        finally:
+            if fp:
+                fp.close()
+    except Exception as e:
+        return name, None, u'[%s] %s' % (type(e).__name__, to_unicode(e))
+
+    return name, {'name': module.name,
+                  'capabilities': list(set([c.__name__ for c in module.iter_caps()])),
+                  'description': module.description,
+                  'maintainer': module.maintainer,
+                  'license': module.license,
+                  'icon': module.icon or '',
+                 }, None
+
+
 class Versions(object):
     VERSIONS_LIST = 'versions.list'
 
@@ -370,8 +493,230 @@ class Versions(object):
         config = RawConfigParser()
         for name, version in self.versions.iteritems():
             config.set(DEFAULTSECT, name, version)
-        with open(os.path.join(self.path, self.VERSIONS_LIST), 'wb') as fp:
+        path = os.path.join(self.path, self.VERSIONS_LIST)
+        with open(path + '.tmp', 'wb') as fp:
             config.write(fp)
+        os.rename(path + '.tmp', path)
+
+
+class HTTPCache(object):
+    """
+    Local copies of files downloaded from repositories.
+
+    The ``ETag`` and ``Last-Modified`` headers of responses are stored
+    with the content, to make a conditional request the next time: if
+    the server answers that the file is not modified, the local copy is
+    used.
+    """
+    HEADERS = (('etag', 'If-None-Match'), ('last-modified', 'If-Modified-Since'))
+
+    def __init__(self, path):
+        self.path = path
+
+    def get_paths(self, url):
+        """
+        Get paths of the content and of the headers saved for an URL.
+        """
+        name = Repositories.url2filename(url)
+        return os.path.join(self.path, name), os.path.join(self.path, name + '.headers')
+
+    def open(self, browser, url):
+        """
+        Get the content of an URL, from the local copy if it is not
+        modified.
+
+        :rtype: :class:`str`
+        """
+        data_path, headers_path = self.get_paths(url)
+
+        headers = {}
+        if os.path.exists(data_path) and os.path.exists(headers_path):
+            config = RawConfigParser()
+            config.read(headers_path)
+            for key, request_header in self.HEADERS:
+                if config.has_option(DEFAULTSECT, key):
+                    headers[request_header] = config.get(DEFAULTSECT, key)
+
+        response = browser.open(url, headers=headers)
+        if headers and response.status_code == 304:
+            with open(data_path, 'rb') as fp:
+                return fp.read()
+
+        data = response.content
+        config = RawConfigParser()
+        for key, request_header in self.HEADERS:
+            if response.headers.get(key):
+                config.set(DEFAULTSECT, key, response.headers[key])
+        if config.defaults():
+            # Headers are written last, so they never describe another
+            # content.
+            self._write(data_path, data)
+            with open(headers_path + '.tmp', 'wb') as fp:
+                config.write(fp)
+            os.rename(headers_path + '.tmp', headers_path)
+        else:
+            self.remove(url)
+        return data
+
+    def _write(self, path, data):
+        with open(path + '.tmp', 'wb') as fp:
+            fp.write(data)
+        os.rename(path + '.tmp', path)
+
+    def remove(self, url):
+        for path in self.get_paths(url):
+            if os.path.exists(path):
+                os.remove(path)
+
+
+class SignatureCache(object):
+    """
+    Signatures which have already been checked by gpgv.
+
+    An entry is made of the SHA-256 hashes of a keyring, of signed data
+    and of its signature, so the same data is not checked again with the
+    same keyring. Only valid signatures are saved.
+    """
+    FILENAME = 'signatures.list'
+
+    def __init__(self, path):
+        self.path = os.path.join(path, self.FILENAME)
+        self.entries = None
+        self.mutex = Lock()
+
+    def load(self):
+        self.entries = set()
+        try:
+            with open(self.path, 'r') as fp:
+                for line in fp:
+                    entry = tuple(line.split())
+                    if len(entry) == 3:
+                        self.entries.add(entry)
+        except IOError:
+            pass
+
+    def __contains__(self, entry):
+        with self.mutex:
+            if self.entries is None:
+                self.load()
+            return entry in self.entries
+
+    def add(self, entry):
+        with self.mutex:
+            if self.entries is None:
+                self.load()
+            if entry in self.entries:
+                return
+            self.entries.add(entry)
+            with open(self.path, 'a') as fp:
+                fp.write('%s\n' % ' '.join(entry))
+
+
+class ModulesBundle(object):
+    """
+    Zip archive of installed modules, with their precompiled bytecode.
+
+    Importing a module from it costs a few reads of a single file, instead
+    of many stat and open calls on the modules directory.
+    """
+    BUNDLE_FILENAME = 'modules.zip'
+    VERSIONS_LIST = 'bundle.list'
+
+    def __init__(self, path):
+        self.path = os.path.join(path, self.BUNDLE_FILENAME)
+        self.versions = None
+
+    def exists(self):
+        return os.path.isfile(self.path)
+
+    def load(self):
+        """
+        Read versions of bundled modules.
+        """
+        self.versions = {}
+        if not self.exists():
+            return
+
+        import zipfile
+        try:
+            with closing(zipfile.ZipFile(self.path)) as zf:
+                for line in zf.read(self.VERSIONS_LIST).decode('ascii').splitlines():
+                    name, version = line.split()
+                    self.versions[name] = int(version)
+        except (zipfile.BadZipfile, KeyError, ValueError) as e:
+            getLogger('repositories').warning(u'Ignoring invalid modules bundle %s: %s', self.path, e)
+            self.versions = {}
+
+    def get(self, name):
+        if self.versions is None:
+            self.load()
+        return self.versions.get(name, None)
+
+    def build(self, modules_dir, versions):
+        """
+        Write the bundle of every installed modules.
+
+        :param modules_dir: directory where modules are installed
+        :type modules_dir: :class:`str`
+        :param versions: versions of installed modules
+        :type versions: :class:`Versions`
+        """
+        from py_compile import compile as compile_file
+        from tempfile import mkstemp
+        import zipfile
+
+        tmp_path = self.path + '.tmp'
+        fd, pyc_path = mkstemp(suffix='.pyc')
+        os.close(fd)
+        bundled = {}
+        try:
+            with closing(zipfile.ZipFile(tmp_path, 'w', zipfile.ZIP_DEFLATED)) as zf:
+                for name, version in sorted(versions.versions.items()):
+                    module_dir = os.path.join(modules_dir, name)
+                    if not os.path.isdir(module_dir):
+                        continue
+
+                    for root, dirs, files in os.walk(module_dir):
+                        dirs[:] = [d for d in dirs if d != '__pycache__']
+                        for filename in sorted(files):
+                            if filename.endswith(('.pyc', '.pyo')):
+                                continue
+                            path = os.path.join(root, filename)
+                            arcname = os.path.relpath(path, modules_dir).replace(os.sep, '/')
+                            zf.write(path, arcname)
+                            if filename.endswith('.py'):
+                                # zipimport looks for bytecode next to sources.
+                                compile_file(path, pyc_path, os.path.join(self.path, arcname), True)
+                                zf.write(pyc_path, arcname + 'c')
+                    bundled[name] = version
+
+                zf.writestr(self.VERSIONS_LIST, ''.join('%s %d\n' % item for item in sorted(bundled.items())))
+            os.rename(tmp_path, self.path)
+        finally:
+            os.remove(pyc_path)
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+        self._invalidate()
+        self.versions = bundled
+
+    def remove(self):
+        if self.exists():
+            os.remove(self.path)
+            self._invalidate()
+        self.versions = {}
+
+    def _invalidate(self):
+        # zipimport keeps the content of archives it has already read.
+        import zipimport
+        getattr(zipimport, '_zip_directory_cache', {}).pop(self.path, None)
+
+    def load_module(self, name):
+        """
+        Import the package of a module from the bundle.
+        """
+        import zipimport
+        return zipimport.zipimporter(self.path).load_module(name)
 
 
 class IProgress(object):
@@ -402,17 +747,39 @@ http://updates.weboob.org/%(version)s/main/
 
 
 class Repositories(object):
+    """
+    Manage repositories and modules installed from them.
+
+    :param use_bundle: pack installed modules in a :class:`ModulesBundle`
+                       and import them from it. The default is given by
+                       the ``WEBOOB_MODULES_BUNDLE`` environment variable.
+    :type use_bundle: :class:`bool`
+    """
     SOURCES_LIST = 'sources.list'
     MODULES_DIR = 'modules'
     REPOS_DIR = 'repositories'
     KEYRINGS_DIR = 'keyrings'
     ICONS_DIR = 'icons'
+    CACHE_DIR = 'cache'
+
+    SHARE_DIRS = [MODULES_DIR, REPOS_DIR, KEYRINGS_DIR, ICONS_DIR, CACHE_DIR]
 
-    SHARE_DIRS = [MODULES_DIR, REPOS_DIR, KEYRINGS_DIR, ICONS_DIR]
+    # Modules installed at the same time by install_modules(). Not more
+    # than the connections kept alive by the browser.
+    INSTALL_WORKERS = 8
+    # Size of chunks read from network when downloading modules.
+    CHUNK_SIZE = 64 * 1024
+    # Maximum time to wait for installing threads before checking for
+    # KeyboardInterrupt.
+    INTERRUPTIBLE_WAIT = 1.0
 
-    def __init__(self, workdir, datadir, version):
+    def __init__(self, workdir, datadir, version, use_bundle=None):
         self.logger = getLogger('repositories')
+        self.mutex = Lock()
         self.version = version
+        if use_bundle is None:
+            use_bundle = os.environ.get('WEBOOB_MODULES_BUNDLE', '0') == '1'
+        self.use_bundle = use_bundle
 
         self.browser = None
 
@@ -423,16 +790,25 @@ class Repositories(object):
         self.repos_dir = os.path.join(self.datadir, self.REPOS_DIR)
         self.keyrings_dir = os.path.join(self.datadir, self.KEYRINGS_DIR)
         self.icons_dir = os.path.join(self.datadir, self.ICONS_DIR)
+        self.cache_dir = os.path.join(self.datadir, self.CACHE_DIR)
 
         self.create_dir(self.datadir)
         self.create_dir(self.modules_dir)
         self.create_dir(self.repos_dir)
         self.create_dir(self.keyrings_dir)
         self.create_dir(self.icons_dir)
+        self.create_dir(self.cache_dir)
 
         self.versions = Versions(self.modules_dir)
+        self.bundle = ModulesBundle(self.modules_dir)
+        self.http_cache = HTTPCache(self.cache_dir)
+        self.signatures = SignatureCache(self.cache_dir)
 
         self.repositories = []
+        # Indexes of ModuleInfo by module name and of module names by
+        # capability name, built from repositories on first lookup. They
+        # are replaced together, as modules can be installed in threads.
+        self._index = None
 
         if not os.path.exists(self.sources_list):
             with open(self.sources_list, 'w') as f:
@@ -462,6 +838,35 @@ class Repositories(object):
 
         return info
 
+    def _get_modules_index(self):
+        """
+        Get the index of ModuleInfo by module name, where modules of the
+        last repositories take precedence, and the index of module names
+        by capability name.
+
+        :rtype: tuple[:class:`dict`, :class:`dict`]
+        """
+        index = self._index
+        if index is None:
+            modules = {}
+            caps_index = {}
+            for repos in reversed(self.repositories):
+                for name, info in repos.modules.iteritems():
+                    if name not in modules:
+                        modules[name] = self._extend_module_info(repos, info)
+                        for cap in info.capabilities:
+                            caps_index.setdefault(cap, set()).add(name)
+            index = self._index = (modules, caps_index)
+        return index
+
+    def invalidate_index(self):
+        """
+        Forget the index of modules, to build it again on next lookup.
+
+        It has to be called when repositories or installed modules change.
+        """
+        self._index = None
+
     def get_all_modules_info(self, caps=None):
         """
         Get all ModuleInfo instances available.
@@ -470,12 +875,18 @@ class Repositories(object):
         :type caps: list[str]
         :rtype: dict[:class:`ModuleInfo`]
         """
-        modules = {}
-        for repos in reversed(self.repositories):
-            for name, info in repos.modules.iteritems():
-                if not name in modules and (not caps or info.has_caps(caps)):
-                    modules[name] = self._extend_module_info(repos, info)
-        return modules
+        modules, caps_index = self._get_modules_index()
+        if not caps:
+            return dict(modules)
+
+        if not isinstance(caps, (list, tuple)):
+            caps = [caps]
+        names = set()
+        for cap in caps:
+            if isinstance(cap, type):
+                cap = cap.__name__
+            names.update(caps_index.get(cap, ()))
+        return dict((name, modules[name]) for name in names)
 
     def get_module_info(self, name):
         """
@@ -484,17 +895,14 @@ class Repositories(object):
         It tries all repositories from last to first, and set
         the 'path' attribute of ModuleInfo if it is installed.
         """
-        for repos in reversed(self.repositories):
-            if name in repos.modules:
-                m = repos.modules[name]
-                self._extend_module_info(repos, m)
-                return m
-        return None
+        modules, _ = self._get_modules_index()
+        return modules.get(name)
 
     def load(self):
         """
         Load repositories from ~/.local/share/weboob/repositories/.
         """
+        self.invalidate_index()
         self.repositories = []
         for name in sorted(os.listdir(self.repos_dir)):
             path = os.path.join(self.repos_dir, name)
@@ -554,6 +962,7 @@ class Repositories(object):
         :param progress: observer object.
         :type progress: :class:`IProgress`
         """
+        self.invalidate_index()
         self.repositories = []
         for name in os.listdir(self.repos_dir):
             os.remove(os.path.join(self.repos_dir, name))
@@ -567,9 +976,9 @@ class Repositories(object):
             repo_path = os.path.join(self.repos_dir, prio_filename)
             keyring_path = os.path.join(self.keyrings_dir, filename)
             try:
-                repository.retrieve_index(self.browser, repo_path)
+                repository.retrieve_index(self.browser, repo_path, self.http_cache)
                 if gpgv:
-                    repository.retrieve_keyring(self.browser, keyring_path)
+                    repository.retrieve_keyring(self.browser, keyring_path, self.http_cache)
                 else:
                     progress.error('Cannot find gpgv to check for repository authenticity.\n'
                                     'You should install GPG for better security.')
@@ -577,6 +986,7 @@ class Repositories(object):
                 progress.error('Unable to load repository: %s' % e)
             else:
                 self.repositories.append(repository)
+        self.invalidate_index()
 
     def check_repositories(self):
         """
@@ -593,35 +1003,135 @@ class Repositories(object):
             l.append(repository)
         return True
 
-    def update(self, progress=IProgress()):
+    def update(self, progress=IProgress(), max_workers=None):
         """
         Update repositories and install new packages versions.
 
         :param progress: observer object.
         :type progress: :class:`IProgress`
+        :param max_workers: maximum number of modules installed at the same time
+        :type max_workers: :class:`int`
         """
-        self.update_repositories()
+        self.update_repositories(progress)
 
         to_update = []
         for name, info in self.get_all_modules_info().iteritems():
             if not info.is_local() and info.is_installed():
                 to_update.append(info)
 
+        self.install_modules(to_update, progress, max_workers)
+        self.update_bundle()
+
+    def install_modules(self, modules, progress=IProgress(), max_workers=None):
+        """
+        Install several modules at the same time.
+
+        Modules are installed in threads, so a module is checked and
+        extracted while the next ones are downloaded by the browser. The
+        progress of every modules is given to *progress* from the calling
+        thread. A module which can't be installed does not stop the other
+        ones, its error is given as progress message.
+
+        The bundle of installed modules is not updated.
+
+        :param modules: modules to install
+        :type modules: list[:class:`ModuleInfo`]
+        :param progress: observer object
+        :type progress: :class:`IProgress`
+        :param max_workers: maximum number of modules installed at the same time
+        :type max_workers: :class:`int`
+        :returns: errors of modules which have not been installed
+        :rtype: dict[:class:`str`, :class:`Exception`]
+        """
+        errors = {}
+        if not modules:
+            return errors
+
+        # Create the browser before threads use it.
+        self.load_browser()
+        events = Queue.Queue()
+        cancelled = Event()
+
         class InstallProgress(IProgress):
             def __init__(self, n):
                 self.n = n
 
             def progress(self, percent, message):
-                progress.progress(float(self.n)/len(to_update) + 1.0/len(to_update)*percent, message)
+                events.put(('progress', self.n, percent, message))
 
-        for n, info in enumerate(to_update):
+            def error(self, message):
+                events.put(('error', self.n, None, message))
+
+        def install(n, info):
+            if cancelled.is_set():
+                return
             inst_progress = InstallProgress(n)
             try:
-                self.install(info, inst_progress)
+                self.install(info, inst_progress, update_bundle=False)
             except ModuleInstallError as e:
+                errors[info.name] = e
                 inst_progress.progress(1.0, unicode(e))
+            except Exception as e:
+                self.logger.error('Unable to install module %s:\n%s' % (info.name, get_backtrace(e)))
+                errors[info.name] = e
+                inst_progress.progress(1.0, u'Unable to install %s: %s' % (info.name, to_unicode(e)))
+            finally:
+                events.put(('done', n, None, None))
+
+        pool = ThreadPool(max_workers or self.INSTALL_WORKERS, 'install')
+        try:
+            for n, info in enumerate(modules):
+                pool.submit(install, n, info)
 
-    def install(self, module, progress=IProgress()):
+            percents = [0.0] * len(modules)
+            remaining = len(modules)
+            while remaining > 0:
+                try:
+                    # Wait with a timeout, to not ignore KeyboardInterrupt.
+                    event, n, percent, message = events.get(timeout=self.INTERRUPTIBLE_WAIT)
+                except Queue.Empty:
+                    continue
+                if event == 'done':
+                    remaining -= 1
+                elif event == 'error':
+                    progress.error(message)
+                else:
+                    percents[n] = percent
+                    progress.progress(sum(percents) / len(modules), message)
+        except BaseException:
+            # Modules which are not started are skipped. The ones being
+            # installed are not waited for, as an installed module is only
+            # replaced once the new version is completely extracted.
+            cancelled.set()
+            pool.shutdown(wait=False)
+            raise
+
+        pool.shutdown()
+        return errors
+
+    def update_bundle(self):
+        """
+        Rebuild the bundle of installed modules, or remove it if it is not
+        used.
+        """
+        if self.use_bundle:
+            self.bundle.build(self.modules_dir, self.versions)
+        else:
+            self.bundle.remove()
+
+    def get_bundled_module(self, name):
+        """
+        Get the bundle where the installed version of a module can be
+        imported from, or None.
+        """
+        if not self.use_bundle:
+            return None
+        installed = self.versions.get(name)
+        if installed is None or self.bundle.get(name) != installed:
+            return None
+        return self.bundle
+
+    def install(self, module, progress=IProgress(), update_bundle=True):
         """
         Install a module.
 
@@ -629,8 +1139,9 @@ class Repositories(object):
         :type module: :class:`str` or :class:`ModuleInfo`
         :param progress: observer object
         :type progress: :class:`IProgress`
+        :param update_bundle: rebuild the bundle of installed modules
+        :type update_bundle: :class:`bool`
         """
-        import tarfile
         self.load_browser()
 
         if isinstance(module, ModuleInfo):
@@ -658,40 +1169,118 @@ class Repositories(object):
             raise ModuleInstallError('The latest version of %s is already installed' % module.name)
 
         progress.progress(0.2, 'Downloading module...')
-        try:
-            tardata = self.browser.open(module.url).content
-        except BrowserHTTPError as e:
-            raise ModuleInstallError('Unable to fetch module: %s' % e)
-
-        # Check signature
-        if module.signed and Keyring.find_gpgv():
-            progress.progress(0.5, 'Checking module authenticity...')
-            sig_data = self.browser.open(posixpath.join(module.url + '.sig')).content
-            keyring_path = os.path.join(self.keyrings_dir, self.url2filename(module.repo_url))
-            keyring = Keyring(keyring_path)
-            if not keyring.exists():
-                raise ModuleInstallError('No keyring found, please update repos.')
-            if not keyring.is_valid(tardata, sig_data):
-                raise ModuleInstallError('Invalid signature for %s.' % module.name)
-
-        # Extract module from tarball.
-        if os.path.isdir(module_dir):
-            shutil.rmtree(module_dir)
-        progress.progress(0.7, 'Setting up module...')
-        with closing(tarfile.open('', 'r:gz', BytesIO(tardata))) as tar:
-            tar.extractall(self.modules_dir)
-        if not os.path.isdir(module_dir):
-            raise ModuleInstallError('The archive for %s looks invalid.' % module.name)
-        # Precompile
-        compile_dir(module_dir, quiet=True)
-
-        self.versions.set(module.name, module.version)
+        from tempfile import NamedTemporaryFile
+        with NamedTemporaryFile(prefix='weboob-%s-' % module.name, suffix='.tar.gz') as tarball:
+            try:
+                data_hash = self.download(module.url, tarball)
+            except (BrowserHTTPError, BrowserHTTPNotFound) as e:
+                raise ModuleInstallError('Unable to fetch module: %s' % e)
+
+            # Check signature
+            if module.signed and Keyring.find_gpgv():
+                progress.progress(0.5, 'Checking module authenticity...')
+                sig_data = self.browser.open(posixpath.join(module.url + '.sig')).content
+                keyring_path = os.path.join(self.keyrings_dir, self.url2filename(module.repo_url))
+                keyring = Keyring(keyring_path)
+                if not keyring.exists():
+                    raise ModuleInstallError('No keyring found, please update repos.')
+                if not self.check_signature(keyring, tarball.name, data_hash, sig_data):
+                    raise ModuleInstallError('Invalid signature for %s.' % module.name)
+
+            progress.progress(0.7, 'Setting up module...')
+            self.extract_module(module, tarball.name)
+
+        with self.mutex:
+            self.versions.set(module.name, module.version)
+            self.invalidate_index()
+        if update_bundle and self.use_bundle:
+            progress.progress(0.8, 'Updating modules bundle...')
+            self.bundle.build(self.modules_dir, self.versions)
 
         progress.progress(0.9, 'Downloading icon...')
         self.retrieve_icon(module)
 
         progress.progress(1.0, 'Module %s has been installed!' % module.name)
 
+    def download(self, url, fp):
+        """
+        Download a file by chunks, so it is never entirely in memory.
+
+        :param fp: file object where the content is written
+        :returns: SHA-256 hash of the content
+        :rtype: :class:`str`
+        """
+        import hashlib
+        h = hashlib.sha256()
+        response = self.browser.open(url, stream=True)
+        try:
+            for chunk in response.iter_content(self.CHUNK_SIZE):
+                h.update(chunk)
+                fp.write(chunk)
+        finally:
+            response.close()
+        fp.flush()
+        return h.hexdigest()
+
+    def check_signature(self, keyring, path, data_hash, sigdata):
+        """
+        Check the signature of a file, unless the same file and signature
+        have already been checked with this keyring.
+
+        :param data_hash: SHA-256 hash of the file, as given by :func:`download`
+        :type data_hash: :class:`str`
+        """
+        import hashlib
+        entry = (keyring.get_hash(), data_hash, hashlib.sha256(sigdata).hexdigest())
+        if entry in self.signatures:
+            return True
+        if not keyring.is_file_valid(path, sigdata):
+            return False
+        self.signatures.add(entry)
+        return True
+
+    def extract_module(self, module, tarpath):
+        """
+        Extract a module from its tarball, and replace the installed one.
+
+        The module is extracted and precompiled in a staging directory, so
+        a partially extracted module is never used. The replacement is
+        nearly atomic: the installed module is renamed before the staged
+        one takes its place, so for a moment the module directory does not
+        exist.
+        """
+        import tarfile
+        from compileall import compile_dir
+        from tempfile import mkdtemp
+
+        module_dir = os.path.join(self.modules_dir, module.name)
+        # The leading dot excludes it from modules.
+        staging = mkdtemp(prefix='.%s-' % module.name, dir=self.modules_dir)
+        previous = staging + '-previous'
+        try:
+            try:
+                with closing(tarfile.open(tarpath, 'r:gz')) as tar:
+                    tar.extractall(staging)
+            except tarfile.TarError as e:
+                raise ModuleInstallError('The archive for %s looks invalid: %s' % (module.name, e))
+
+            staged_dir = os.path.join(staging, module.name)
+            if not os.path.isdir(staged_dir):
+                raise ModuleInstallError('The archive for %s looks invalid.' % module.name)
+            compile_dir(staged_dir, ddir=module_dir, quiet=True)
+
+            if os.path.isdir(module_dir):
+                os.rename(module_dir, previous)
+            try:
+                os.rename(staged_dir, module_dir)
+            except OSError:
+                if os.path.isdir(previous):
+                    os.rename(previous, module_dir)
+                raise
+        finally:
+            shutil.rmtree(staging, ignore_errors=True)
+            shutil.rmtree(previous, ignore_errors=True)
+
     @staticmethod
     def url2filename(url):
         """
@@ -736,6 +1325,21 @@ class Keyring(object):
                     return True
         return False
 
+    def get_hash(self):
+        """
+        Get the SHA-256 hash of the saved keyring.
+        """
+        import hashlib
+        with open(self.path, 'rb') as fp:
+            return hashlib.sha256(fp.read()).hexdigest()
+
+    def has_data(self, keyring_data):
+        """
+        Check if the saved keyring has this content.
+        """
+        import hashlib
+        return self.get_hash() == hashlib.sha256(keyring_data).hexdigest()
+
     def save(self, keyring_data, version):
         with open(self.path, 'wb') as fp:
             fp.write(keyring_data)
@@ -759,18 +1363,28 @@ class Keyring(object):
         Check if the data is signed by an accepted key.
         data and sigdata should be strings.
         """
+        assert isinstance(data, basestring)
+        return self._check_signature(sigdata, '-', data)
+
+    def is_file_valid(self, path, sigdata):
+        """
+        Check if the content of a file is signed by an accepted key.
+        sigdata should be a string.
+        """
+        return self._check_signature(sigdata, os.path.realpath(path))
+
+    def _check_signature(self, sigdata, data_path, data=None):
         gpgv = self.find_gpgv()
         from tempfile import NamedTemporaryFile
         with NamedTemporaryFile(suffix='.sig') as sigfile:
             sigfile.write(sigdata)
             sigfile.flush()  # very important
-            assert isinstance(data, basestring)
             # Yes, all of it is necessary
             proc = subprocess.Popen([gpgv,
                     '--status-fd', '1',
                     '--keyring', os.path.realpath(self.path),
                     os.path.realpath(sigfile.name),
-                    '-'],
+                    data_path],
                 stdin=subprocess.PIPE,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE)
@@ -20,12 +20,13 @@
 
 from __future__ import print_function
 
-from threading import Event, RLock
-try:
-    from threading import _Timer as Timer
-except ImportError:
-    from threading import Timer
+from collections import deque
+from heapq import heappush, heappop
+import random
+from threading import Event, RLock, Thread, current_thread
+from time import time
 
+from weboob.core.pool import ThreadPool, Wakeup
 from weboob.tools.log import getLogger
 from weboob.tools.misc import get_backtrace
 
@@ -37,7 +38,14 @@ class IScheduler(object):
     def schedule(self, interval, function, *args):
         raise NotImplementedError()
 
-    def repeat(self, interval, function, *args):
+    def repeat(self, interval, function, *args, **kwargs):
+        """
+        Call a function immediately, then every *interval* seconds.
+
+        Keyword arguments are options of the scheduler (see
+        :func:`Scheduler.repeat`). A scheduler which does not support an
+        option ignores it.
+        """
         raise NotImplementedError()
 
     def cancel(self, ev):
@@ -50,93 +58,293 @@ class IScheduler(object):
         raise NotImplementedError()
 
 
-class RepeatedTimer(Timer):
-    def run(self):
-        while not self.finished.isSet():
-            try:
-                self.function(*self.args, **self.kwargs)
-            except Exception:
-                # do not stop timer because of an exception
-                print(get_backtrace())
-            self.finished.wait(self.interval)
-        self.finished.set()
+class _Job(object):
+    def __init__(self, interval, function, args, repeat=False, jitter=0, backoff=None, max_interval=None, group=None):
+        self.interval = interval
+        self.function = function
+        self.args = args
+        self.repeat = repeat
+        self.jitter = jitter
+        self.backoff = backoff
+        self.max_interval = max_interval
+        self.group = group
+        # Interval until next call, increased by backoff.
+        self.current_interval = interval
+
+    def next_delay(self):
+        delay = self.current_interval
+        if self.jitter:
+            delay += random.uniform(-self.jitter, self.jitter) * delay
+        return max(0, delay)
+
+    def first_delay(self):
+        if not self.repeat:
+            return self.interval
+        # A repeated function is called immediately, and jitter spreads
+        # functions repeated since the same time.
+        return random.uniform(0, self.jitter * self.interval)
+
+    def update_interval(self, result, failed):
+        if self.backoff is None:
+            return
+
+        if failed or not result:
+            self.current_interval = min(self.current_interval * self.backoff, self.max_interval)
+        else:
+            self.current_interval = self.interval
 
 
 class Scheduler(IScheduler):
-    def __init__(self):
+    """
+    Call functions at given times.
+
+    Events are kept in a heap ordered by their due time, and a single
+    dispatcher thread sleeps until the next one is due, or until it is told
+    that an earlier event has been added, then gives it to a pool of worker
+    threads. So there are not one thread per event, and a
+    slow function does not delay the other ones.
+
+    A repeated function is scheduled again once it has returned, so two
+    calls of the same function never run at the same time. See
+    :func:`repeat` for options to spread the load of repeated functions.
+
+    :param max_workers: maximum number of functions running at the same time
+    :type max_workers: :class:`int`
+    """
+    MAX_WORKERS = 10
+    # Default maximum interval of a backed off function, relatively to its
+    # interval.
+    MAX_BACKOFF = 16
+
+    def __init__(self, max_workers=None):
         self.logger = getLogger('scheduler')
         self.mutex = RLock()
         self.stop_event = Event()
+        # Wake up the dispatcher when the next event changes, and run()
+        # when the scheduler is stopped.
+        self.changed = None
+        self.stopped = None
         self.count = 0
+        # Scheduled jobs by their ID.
         self.queue = {}
+        # (time, ID) of jobs, with IDs of cancelled jobs removed lazily.
+        self.heap = []
+        # Maximum number of running jobs by group, number of running jobs
+        # and IDs of due jobs waiting for a running one to end.
+        self.group_limits = {}
+        self.group_running = {}
+        self.group_waiting = {}
+        self.pool = ThreadPool(max_workers or self.MAX_WORKERS, 'scheduler')
+        self.dispatcher = None
 
     def schedule(self, interval, function, *args):
-        return self._schedule(Timer, interval, self._schedule_callback, function, *args)
+        return self._schedule(_Job(interval, function, args))
+
+    def repeat(self, interval, function, *args, **kwargs):
+        """
+        Call a function immediately, then every *interval* seconds.
+
+        Options are given as keyword arguments:
+
+        - *jitter*: ratio of the interval randomly added to or removed from
+          each delay (for example 0.1 for ±10%), so functions repeated
+          with the same interval do not run at the same time;
+        - *backoff*: if set, the interval is multiplied by this factor each
+          time the function raises an exception or returns a false value
+          (nothing new), and reset when it returns a true value;
+        - *max_interval*: maximum interval reached by backoff (default is
+          :attr:`MAX_BACKOFF` times the interval);
+        - *group*: name of a group whose number of functions running at the
+          same time is limited by :func:`set_group_limit`.
+
+        :rtype: ID of the event, to :func:`cancel` it
+        """
+        jitter = kwargs.pop('jitter', 0)
+        backoff = kwargs.pop('backoff', None)
+        max_interval = kwargs.pop('max_interval', None)
+        group = kwargs.pop('group', None)
+        if kwargs:
+            raise TypeError('Unexpected options: %s' % ', '.join(kwargs))
+        if max_interval is None:
+            max_interval = interval * self.MAX_BACKOFF
 
-    def repeat(self, interval, function, *args):
-        return self._schedule(RepeatedTimer, interval, self._repeat_callback, function, *args)
+        return self._schedule(_Job(interval, function, args, repeat=True, jitter=jitter,
+                                   backoff=backoff, max_interval=max_interval, group=group))
+
+    def set_group_limit(self, group, limit):
+        """
+        Limit the number of functions of a group running at the same time.
+
+        Functions due while the limit is reached wait for a running one to
+        end.
+
+        :param group: name of group, given to :func:`repeat`
+        :type group: :class:`str`
+        :param limit: maximum number of running functions, or None for no limit
+        :type limit: :class:`int`
+        """
+        with self.mutex:
+            if limit is None:
+                self.group_limits.pop(group, None)
+            else:
+                self.group_limits[group] = limit
+            # Run waiting functions allowed by the new limit.
+            self._release_group(group)
 
-    def _schedule(self, klass, interval, meta_func, function, *args):
+    def _schedule(self, job):
         if self.stop_event.isSet():
             return
 
         with self.mutex:
             self.count += 1
-            self.logger.debug('function "%s" will be called in %s seconds' % (function.__name__, interval))
-            timer = klass(interval, meta_func, (self.count, interval, function, args))
-            self.queue[self.count] = timer
-            timer.start()
+            delay = job.first_delay()
+            self.logger.debug('function "%s" will be called in %s seconds' % (job.function.__name__, delay))
+            self.queue[self.count] = job
+            if self.changed is None:
+                self.changed = Wakeup()
+            self._push(self.count, delay)
+
+            if self.dispatcher is None:
+                self.dispatcher = Thread(target=self._dispatch, name='scheduler')
+                self.dispatcher.daemon = True
+                self.dispatcher.start()
             return self.count
 
-    def _schedule_callback(self, count, interval, function, args):
+    def _push(self, count, delay):
         with self.mutex:
-            self.queue.pop(count)
-        return function(*args)
+            heappush(self.heap, (time() + delay, count))
+            if self.heap[0][1] == count:
+                # Dispatcher has to wake up earlier.
+                self.changed.notify()
 
-    def _repeat_callback(self, count, interval, function, args):
-        function(*args)
-        with self.mutex:
-            try:
-                e = self.queue[count]
-            except KeyError:
+    def _dispatch(self):
+        while True:
+            delay = self._dispatch_due()
+            if delay is False:
                 return
-            else:
-                self.logger.debug('function "%s" will be called in %s seconds' % (function.__name__, e.interval))
+            # Sleep until the next event is due, or a new one is added.
+            self.changed.wait(delay)
+
+    def _dispatch_due(self):
+        """
+        Start every due events.
+
+        Return the delay until the next one (None if there is none), or
+        False if the scheduler is stopped.
+        """
+        with self.mutex:
+            while not self.stop_event.isSet():
+                if not self.heap:
+                    return None
+
+                when, count = self.heap[0]
+                if count not in self.queue:
+                    # Cancelled.
+                    heappop(self.heap)
+                    continue
+
+                delay = when - time()
+                if delay > 0:
+                    return delay
+
+                heappop(self.heap)
+                group = self.queue[count].group
+                if group is not None and self.group_running.get(group, 0) >= self.group_limits.get(group, float('inf')):
+                    self.group_waiting.setdefault(group, deque()).append(count)
+                else:
+                    self._start(count)
+            return False
+
+    def _start(self, count):
+        job = self.queue[count]
+        if job.group is not None:
+            self.group_running[job.group] = self.group_running.get(job.group, 0) + 1
+        self.pool.submit(self._run, count, job)
+
+    def _release_group(self, group):
+        waiting = self.group_waiting.get(group)
+        limit = self.group_limits.get(group, float('inf'))
+        while waiting and self.group_running.get(group, 0) < limit and not self.stop_event.isSet():
+            count = waiting.popleft()
+            if count in self.queue:
+                self._start(count)
+
+    def _run(self, count, job):
+        with self.mutex:
+            # It may have been cancelled after being dispatched.
+            cancelled = count not in self.queue
+            if not cancelled and not job.repeat:
+                self.queue.pop(count)
+
+        result = None
+        failed = False
+        try:
+            if not cancelled:
+                result = job.function(*job.args)
+        except Exception:
+            # do not stop a repeated function because of an exception
+            self.logger.error('Scheduled function "%s" has failed:\n%s' % (job.function.__name__, get_backtrace()))
+            failed = True
+        finally:
+            if job.group is not None:
+                with self.mutex:
+                    self.group_running[job.group] -= 1
+                    self._release_group(job.group)
+
+        if job.repeat:
+            with self.mutex:
+                if count in self.queue and not self.stop_event.isSet():
+                    job.update_interval(result, failed)
+                    delay = job.next_delay()
+                    self.logger.debug('function "%s" will be called in %s seconds' % (job.function.__name__, delay))
+                    self._push(count, delay)
 
     def cancel(self, ev):
         with self.mutex:
             try:
-                e = self.queue.pop(ev)
+                job = self.queue.pop(ev)
             except KeyError:
                 return False
-            e.cancel()
-            self.logger.debug('scheduled function "%s" is canceled' % e.function.__name__)
+            # The heap entry is dropped by the dispatcher.
+            self.logger.debug('scheduled function "%s" is canceled' % job.function.__name__)
             return True
 
     def _wait_to_stop(self):
         self.want_stop()
-        with self.mutex:
-            for e in self.queue.itervalues():
-                e.cancel()
-                e.join()
-            self.queue = {}
+        dispatcher = self.dispatcher
+        if dispatcher is not None and dispatcher is not current_thread():
+            dispatcher.join()
+            self.changed.close()
+        # Wait for running functions.
+        self.pool.shutdown(wait=True)
 
     def run(self):
+        with self.mutex:
+            if self.stopped is None:
+                self.stopped = Wakeup()
         try:
-            while True:
-                self.stop_event.wait(0.1)
+            while not self.stop_event.isSet():
+                self.stopped.wait()
         except KeyboardInterrupt:
             self._wait_to_stop()
             raise
         else:
             self._wait_to_stop()
+        finally:
+            with self.mutex:
+                self.stopped.close()
+                self.stopped = None
         return True
 
     def want_stop(self):
         self.stop_event.set()
         with self.mutex:
-            for t in self.queue.itervalues():
-                t.cancel()
-                # Contrary to _wait_to_stop(), don't call t.join
-                # because want_stop() have to be non-blocking.
             self.queue = {}
+            self.heap = []
+            self.group_waiting = {}
+            for wakeup in (self.changed, self.stopped):
+                if wakeup is not None:
+                    wakeup.notify()
+        # Contrary to _wait_to_stop(), don't wait for running functions
+        # because want_stop() have to be non-blocking.
+        self.pool.shutdown(wait=False)
@@ -0,0 +1,901 @@
+# -*- coding: utf-8 -*-
+
+# Copyright(C) 2014 Romain Bignon
+#
+# This file is part of weboob.
+#
+# weboob is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# weboob is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with weboob. If not, see <http://www.gnu.org/licenses/>.
+
+import hashlib
+import os
+import shutil
+import sys
+import tarfile
+import tempfile
+from decimal import Decimal
+from threading import Event, Lock, RLock, Thread, current_thread
+from time import sleep, time
+from unittest import TestCase
+try:
+    from BaseHTTPServer import BaseHTTPRequestHandler, HTTPServer
+except ImportError:
+    from http.server import BaseHTTPRequestHandler, HTTPServer
+
+from weboob.capabilities.housing import Housing
+from weboob.core.bcall import BackendTimeout, CallErrors
+from weboob.core.modules import ModulesLoader
+from weboob.core.ouiboube import WebNip
+from weboob.core.pool import Wakeup
+from weboob.core.repositories import Repositories, Repository, ModuleInfo, IProgress, InvalidSignature, \
+    ModuleInstallError
+from weboob.core.scheduler import Scheduler
+from weboob.tools import importprofile
+
+
+INDEX = '''[DEFAULT]
+name = test
+update = %(update)d
+maintainer = weboob@weboob.org
+signed = %(signed)d
+key_update = %(key_update)d
+'''
+
+INDEX_MODULE = '''
+[%(name)s]
+version = %(version)d
+capabilities = %(caps)s
+description = Example
+maintainer = Weboob
+license = AGPLv3+
+icon =
+urls =
+'''
+
+
+MODULE = """import time
+from weboob.tools.backend import Module
+
+time.sleep(0.1)
+
+
+class TestModule(Module):
+    NAME = '%s'
+    VERSION = '1.0'
+"""
+
+# Module of a local repository, which logs its imports.
+REPOSITORY_MODULE = """from weboob.tools.backend import Module
+
+with open(%(log)r, 'a') as fp:
+    fp.write('%(name)s\\n')
+
+
+class TestModule(Module):
+    NAME = '%(name)s'
+    VERSION = '1.0'
+"""
+
+# Accept every signatures, and log calls.
+GPGV = """#!/bin/sh
+echo "$@" >> "%s"
+echo GOODSIG VALIDSIG
+"""
+
+
+class FakeBackend(object):
+    """
+    Backend giving *results*, after the *release* event is set if given.
+    """
+    def __init__(self, name, results=(), release=None):
+        self.name = name
+        self.results = results
+        self.release = release
+        self.lock = RLock()
+        # Set once the iteration has started, and once it has stopped.
+        self.called = Event()
+        self.stopped = Event()
+        # Number of results given.
+        self.given = 0
+
+    def __enter__(self):
+        self.lock.acquire()
+
+    def __exit__(self, t, v, tb):
+        self.lock.release()
+
+    def __repr__(self):
+        return '<FakeBackend %r>' % self.name
+
+    def iter_results(self):
+        self.called.set()
+        try:
+            if self.release is not None:
+                self.release.wait()
+            for result in self.results:
+                self.given += 1
+                yield result
+        finally:
+            self.stopped.set()
+
+    def deinit(self):
+        pass
+
+
+class QuietProgress(IProgress):
+    def progress(self, percent, message):
+        pass
+
+
+class RecordProgress(IProgress):
+    """
+    Record progress percents, and the threads giving them.
+    """
+    def __init__(self):
+        self.percents = []
+        self.threads = set()
+
+    def progress(self, percent, message):
+        self.percents.append(percent)
+        self.threads.add(current_thread())
+
+
+class RepositoryHandler(BaseHTTPRequestHandler):
+    """
+    Serve files of a repository directory, with an ETag.
+    """
+    def do_GET(self):
+        self.server.requests.append(self.path)
+        path = os.path.join(self.server.root, self.path.lstrip('/'))
+        if not os.path.isfile(path):
+            self.send_error(404)
+            return
+
+        with open(path, 'rb') as fp:
+            data = fp.read()
+        etag = '"%s"' % hashlib.sha1(data).hexdigest()
+        if self.headers.get('If-None-Match') == etag:
+            self.server.not_modified.append(self.path)
+            self.send_response(304)
+            self.end_headers()
+            return
+
+        self.send_response(200)
+        self.send_header('ETag', etag)
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+class RepositoriesTest(TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp(prefix='weboob_test_')
+        self.root = os.path.join(self.tmpdir, 'www')
+        os.makedirs(self.root)
+        self.write_index(update=1)
+
+        self.server = HTTPServer(('127.0.0.1', 0), RepositoryHandler)
+        self.server.root = self.root
+        self.server.requests = []
+        self.server.not_modified = []
+        thread = Thread(target=self.server.serve_forever)
+        thread.daemon = True
+        thread.start()
+
+        self.workdir = os.path.join(self.tmpdir, 'config')
+        os.makedirs(self.workdir)
+        with open(os.path.join(self.workdir, 'sources.list'), 'w') as fp:
+            fp.write('http://127.0.0.1:%d/\n' % self.server.server_address[1])
+
+        self.gpgv = os.environ.get('GPGV_EXECUTABLE')
+        # The keyring is accepted without check the first time, and
+        # every following checks fail.
+        os.environ['GPGV_EXECUTABLE'] = 'false'
+
+        self.repositories = Repositories(self.workdir, os.path.join(self.tmpdir, 'data'), '1.0')
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        if self.gpgv is None:
+            del os.environ['GPGV_EXECUTABLE']
+        else:
+            os.environ['GPGV_EXECUTABLE'] = self.gpgv
+        shutil.rmtree(self.tmpdir)
+
+    def write_index(self, update, signed=0, key_update=0, modules=(('example', 201411010000, 'CapBank'),)):
+        with open(os.path.join(self.root, 'modules.list'), 'w') as fp:
+            fp.write(INDEX % {'update': update, 'signed': signed, 'key_update': key_update})
+            for name, version, caps in modules:
+                fp.write(INDEX_MODULE % {'name': name, 'version': version, 'caps': caps})
+
+    def write_keyring(self, data):
+        for filename in ('trusted.gpg', 'trusted.gpg.sig'):
+            with open(os.path.join(self.root, filename), 'w') as fp:
+                fp.write(data)
+
+    def write_module(self, name, content='\n'):
+        path = os.path.join(self.tmpdir, name)
+        if os.path.exists(path):
+            shutil.rmtree(path)
+        os.makedirs(path)
+        with open(os.path.join(path, '__init__.py'), 'w') as fp:
+            fp.write(content)
+        with tarfile.open(os.path.join(self.root, '%s.tar.gz' % name), 'w:gz') as tar:
+            tar.add(path, name)
+        with open(os.path.join(self.root, '%s.tar.gz.sig' % name), 'w') as fp:
+            fp.write('signature')
+
+    def use_fake_gpgv(self):
+        gpgv = os.path.join(self.tmpdir, 'gpgv')
+        self.gpgv_log = os.path.join(self.tmpdir, 'gpgv.log')
+        with open(gpgv, 'w') as fp:
+            fp.write(GPGV % self.gpgv_log)
+        os.chmod(gpgv, 0o700)
+        os.environ['GPGV_EXECUTABLE'] = gpgv
+
+    def count_gpgv_calls(self):
+        if not os.path.exists(self.gpgv_log):
+            return 0
+        with open(self.gpgv_log) as fp:
+            return len(fp.readlines())
+
+    def update(self):
+        self.server.requests = []
+        self.server.not_modified = []
+        self.repositories.update_repositories(QuietProgress())
+        return self.server.requests
+
+    def test_index_not_modified(self):
+        self.assertEqual(self.update(), ['/modules.list'])
+        self.assertEqual(self.repositories.repositories[0].update, 1)
+
+        # The index is not downloaded again, but repositories are loaded.
+        self.assertEqual(self.update(), ['/modules.list'])
+        self.assertEqual(self.server.not_modified, ['/modules.list'])
+        self.assertEqual(len(self.repositories.repositories), 1)
+        self.assertEqual(self.repositories.repositories[0].update, 1)
+        self.assertIsNotNone(self.repositories.get_module_info('example'))
+
+        self.write_index(update=2)
+        self.update()
+        self.assertEqual(self.server.not_modified, [])
+        self.assertEqual(self.repositories.repositories[0].update, 2)
+
+    def test_keyring_not_modified(self):
+        self.write_index(update=1, signed=1, key_update=1)
+        self.write_keyring('keyring')
+        self.assertEqual(self.update(), ['/modules.list', '/trusted.gpg', '/trusted.gpg.sig'])
+
+        # Same keyring with a new version, its signature is not checked.
+        self.write_index(update=2, signed=1, key_update=2)
+        self.assertEqual(self.update(), ['/modules.list', '/trusted.gpg'])
+        self.assertEqual(len(self.repositories.repositories), 1)
+
+        # A new keyring has to be signed by the previous one.
+        self.write_index(update=3, signed=1, key_update=3)
+        self.write_keyring('new keyring')
+        self.assertRaises(InvalidSignature, self.update)
+        self.assertEqual(self.server.requests, ['/modules.list', '/trusted.gpg', '/trusted.gpg.sig'])
+
+    def test_signature_cache(self):
+        self.use_fake_gpgv()
+        self.write_index(update=1, signed=1, key_update=1)
+        self.write_keyring('keyring')
+        self.write_module('example')
+        self.update()
+
+        self.repositories.install('example', QuietProgress())
+        self.assertEqual(self.count_gpgv_calls(), 1)
+        self.assertEqual(self.repositories.versions.get('example'), 201411010000)
+
+        # The same tarball is not checked again.
+        shutil.rmtree(os.path.join(self.repositories.modules_dir, 'example'))
+        self.repositories.install('example', QuietProgress())
+        self.assertEqual(self.count_gpgv_calls(), 1)
+
+        # Invalid signatures are not saved.
+        with open(os.path.join(self.root, 'example.tar.gz.sig'), 'w') as fp:
+            fp.write('another signature')
+        os.environ['GPGV_EXECUTABLE'] = 'false'
+        shutil.rmtree(os.path.join(self.repositories.modules_dir, 'example'))
+        self.assertRaises(ModuleInstallError, self.repositories.install, 'example', QuietProgress())
+        self.use_fake_gpgv()
+        self.repositories.install('example', QuietProgress())
+        self.assertEqual(self.count_gpgv_calls(), 2)
+
+    def list_modules_dir(self):
+        return sorted(name for name in os.listdir(self.repositories.modules_dir)
+                      if os.path.isdir(os.path.join(self.repositories.modules_dir, name)))
+
+    def read_installed(self, name):
+        with open(os.path.join(self.repositories.modules_dir, name, '__init__.py')) as fp:
+            return fp.read()
+
+    def test_install_modules(self):
+        self.write_index(update=2, modules=[(name, 201411010000, 'CapBank')
+                                            for name in ('example', 'other', 'corrupted', 'missing')])
+        self.write_module('example')
+        self.write_module('other')
+        with open(os.path.join(self.root, 'corrupted.tar.gz'), 'w') as fp:
+            fp.write('not a tarball')
+        self.update()
+
+        progress = RecordProgress()
+        modules = [self.repositories.get_module_info(name) for name in ('example', 'other', 'corrupted', 'missing')]
+        errors = self.repositories.install_modules(modules, progress, max_workers=2)
+
+        # Errors are collected without stopping other modules.
+        self.assertEqual(sorted(errors), ['corrupted', 'missing'])
+        for error in errors.values():
+            self.assertIsInstance(error, ModuleInstallError)
+        self.assertEqual(self.list_modules_dir(), ['example', 'other'])
+        self.assertEqual(self.repositories.versions.get('example'), 201411010000)
+        self.assertEqual(self.repositories.versions.get('other'), 201411010000)
+        self.assertIsNone(self.repositories.versions.get('corrupted'))
+
+        # Progress is given by the calling thread only.
+        self.assertEqual(progress.threads, set([current_thread()]))
+        self.assertEqual(progress.percents[-1], 1.0)
+
+    def test_install_modules_in_threads(self):
+        mutex = Lock()
+        running = []
+        installed = []
+        # Number of modules installed at the same time.
+        concurrency = []
+
+        def install(info, progress, update_bundle=True):
+            self.assertFalse(update_bundle)
+            with mutex:
+                running.append(info.name)
+                concurrency.append(len(running))
+            sleep(0.1)
+            with mutex:
+                running.remove(info.name)
+                installed.append(info.name)
+
+        self.repositories.install = install
+        modules = [ModuleInfo(name) for name in ('a', 'b', 'c', 'd')]
+        start = time()
+        self.assertEqual(self.repositories.install_modules(modules, QuietProgress(), max_workers=2), {})
+
+        self.assertEqual(sorted(installed), ['a', 'b', 'c', 'd'])
+        self.assertEqual(max(concurrency), 2)
+        self.assertLess(time() - start, 0.35)
+
+    def test_install_modules_interrupted(self):
+        release = Event()
+        started = []
+
+        def install(info, progress, update_bundle=True):
+            started.append(info.name)
+            progress.progress(0.5, 'Installing %s' % info.name)
+            release.wait()
+
+        class InterruptingProgress(IProgress):
+            def progress(self, percent, message):
+                raise KeyboardInterrupt()
+
+        self.repositories.install = install
+        modules = [ModuleInfo(name) for name in ('a', 'b', 'c', 'd')]
+        try:
+            self.assertRaises(KeyboardInterrupt, self.repositories.install_modules, modules, InterruptingProgress(),
+                              max_workers=2)
+        finally:
+            release.set()
+
+        # Modules which were not started are skipped.
+        sleep(0.1)
+        self.assertIn('a', started)
+        self.assertNotIn('c', started)
+        self.assertNotIn('d', started)
+
+    def test_extract_module(self):
+        self.write_module('example', 'VERSION = 1\n')
+        self.update()
+        self.repositories.install('example', QuietProgress())
+        self.assertEqual(self.read_installed('example'), 'VERSION = 1\n')
+
+        # The installed module is replaced, and the staging directory is
+        # removed.
+        self.write_index(update=2, modules=[('example', 201411020000, 'CapBank')])
+        self.write_module('example', 'VERSION = 2\n')
+        self.update()
+        self.repositories.install('example', QuietProgress())
+        self.assertEqual(self.read_installed('example'), 'VERSION = 2\n')
+        self.assertTrue(os.path.exists(os.path.join(self.repositories.modules_dir, 'example', '__init__.pyc')))
+        self.assertEqual(self.list_modules_dir(), ['example'])
+
+        # An invalid archive does not touch the installed module.
+        self.write_index(update=3, modules=[('example', 201411030000, 'CapBank')])
+        with open(os.path.join(self.root, 'example.tar.gz'), 'w') as fp:
+            fp.write('not a tarball')
+        self.update()
+        self.assertRaises(ModuleInstallError, self.repositories.install, 'example', QuietProgress())
+        self.assertEqual(self.read_installed('example'), 'VERSION = 2\n')
+        self.assertEqual(self.list_modules_dir(), ['example'])
+        self.assertEqual(self.repositories.versions.get('example'), 201411020000)
+
+    def test_bundle(self):
+        self.repositories.use_bundle = True
+        self.write_module('example', 'VERSION = 1\n')
+        self.update()
+        self.repositories.install('example', QuietProgress())
+
+        bundle = self.repositories.get_bundled_module('example')
+        self.assertIs(bundle, self.repositories.bundle)
+        try:
+            module = bundle.load_module('example')
+            self.assertEqual(module.VERSION, 1)
+            self.assertTrue(module.__file__.startswith(bundle.path))
+        finally:
+            sys.modules.pop('example', None)
+
+        # A module installed without updating the bundle is not imported
+        # from it.
+        self.write_index(update=2, modules=[('example', 201411020000, 'CapBank')])
+        self.write_module('example', 'VERSION = 2\n')
+        self.update()
+        self.repositories.install_modules([self.repositories.get_module_info('example')], QuietProgress())
+        self.assertIsNone(self.repositories.get_bundled_module('example'))
+        self.repositories.update_bundle()
+        self.assertIs(self.repositories.get_bundled_module('example'), bundle)
+
+        self.repositories.use_bundle = False
+        self.repositories.update_bundle()
+        self.assertFalse(bundle.exists())
+        self.assertIsNone(self.repositories.get_bundled_module('example'))
+
+    def test_modules_index(self):
+        self.write_index(update=1, modules=[('example', 201411010000, 'CapBank'),
+                                            ('other', 201411010000, 'CapBank CapWeather')])
+        self.update()
+        self.assertEqual(sorted(self.repositories.get_all_modules_info()), ['example', 'other'])
+        self.assertEqual(sorted(self.repositories.get_all_modules_info(['CapBank'])), ['example', 'other'])
+        self.assertEqual(sorted(self.repositories.get_all_modules_info('CapWeather')), ['other'])
+        self.assertEqual(self.repositories.get_all_modules_info('CapMessages'), {})
+
+        # The index is built again when repositories are updated.
+        self.write_index(update=2, modules=[('example', 201411020000, 'CapWeather')])
+        self.update()
+        self.assertEqual(sorted(self.repositories.get_all_modules_info('CapWeather')), ['example'])
+        self.assertIsNone(self.repositories.get_module_info('other'))
+        self.assertEqual(self.repositories.get_module_info('example').version, 201411020000)
+
+    def test_build_index(self):
+        path = os.path.join(self.tmpdir, 'local')
+        log = os.path.join(self.tmpdir, 'imports.log')
+        for name in ('first', 'second', 'broken'):
+            os.makedirs(os.path.join(path, name))
+            with open(os.path.join(path, name, '__init__.py'), 'w') as fp:
+                if name == 'broken':
+                    fp.write('raise ImportError("broken")\n')
+                else:
+                    fp.write(REPOSITORY_MODULE % {'log': log, 'name': name})
+
+        def build_index():
+            repository = Repository('file://' + path)
+            repository.name = 'local'
+            repository.build_index(path, os.path.join(path, Repository.INDEX), max_workers=2)
+            with open(log) as fp:
+                imported = sorted(fp.read().split())
+            os.remove(log)
+            return repository, imported
+
+        repository, imported = build_index()
+        self.assertEqual(imported, ['first', 'second'])
+        self.assertEqual(sorted(repository.modules), ['first', 'second'])
+        saved = Repository('file://' + path)
+        with open(os.path.join(path, Repository.INDEX)) as fp:
+            saved.parse_index(fp)
+        self.assertEqual(sorted(saved.modules), ['first', 'second'])
+
+        # Only modules which have changed are imported again.
+        with open(os.path.join(path, 'second', '__init__.py'), 'a') as fp:
+            fp.write('# Changed\n')
+        repository, imported = build_index()
+        self.assertEqual(imported, ['second'])
+        self.assertEqual(sorted(repository.modules), ['first', 'second'])
+
+
+class ImportProfileTest(TestCase):
+    NAMES = ('profilea', 'profileb', 'profilec', 'profiled')
+
+    def setUp(self):
+        self.path = tempfile.mkdtemp(prefix='weboob_test_')
+        for name in self.NAMES:
+            os.makedirs(os.path.join(self.path, name))
+            with open(os.path.join(self.path, name, '__init__.py'), 'w') as fp:
+                fp.write(MODULE % name)
+
+        self.assertIsNone(importprofile.get_profiler())
+        self.profiler = importprofile.start_profiler(report_at_exit=False)
+
+    def tearDown(self):
+        self.profiler.stop()
+        importprofile._profiler = None
+        for name in self.NAMES:
+            sys.modules.pop(name, None)
+        shutil.rmtree(self.path)
+
+    def test_parallel_sections(self):
+        loader = ModulesLoader(self.path, '1.0')
+        threads = [Thread(target=loader.get_or_load_module, args=(name,)) for name in self.NAMES]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(sorted(loader.loaded), sorted(self.NAMES))
+
+        root = self.profiler.root
+        self.assertIs(self.profiler.current, root)
+        sections = dict((record.name, record) for record in root.children)
+        self.assertEqual(sorted(sections), sorted('module %s' % name for name in self.NAMES))
+        for record in sections.values():
+            self.assertGreaterEqual(record.cumulative, 0.1)
+            self.assertEqual(record.children, [])
+
+
+class LazyBrowserTest(TestCase):
+    MODULE = """from weboob.tools.backend import Module, LazyBrowser
+
+
+class LazyModule(Module):
+    NAME = 'lazy'
+    BROWSER = LazyBrowser('.browser', 'LazyBrowser')
+"""
+
+    BROWSER = """%s
+
+class LazyBrowser(object):
+    def __init__(self, *args, **kwargs):
+        pass
+"""
+
+    def setUp(self):
+        self.path = tempfile.mkdtemp(prefix='weboob_test_')
+        sys.path.insert(0, self.path)
+
+    def tearDown(self):
+        sys.path.remove(self.path)
+        for name in ('lazytest', 'lazytest.module', 'lazytest.browser'):
+            sys.modules.pop(name, None)
+        shutil.rmtree(self.path)
+
+    def write_module(self, browser_imports=''):
+        os.makedirs(os.path.join(self.path, 'lazytest'))
+        with open(os.path.join(self.path, 'lazytest', '__init__.py'), 'w') as fp:
+            fp.write('from .module import LazyModule\n')
+        with open(os.path.join(self.path, 'lazytest', 'module.py'), 'w') as fp:
+            fp.write(self.MODULE)
+        with open(os.path.join(self.path, 'lazytest', 'browser.py'), 'w') as fp:
+            fp.write(self.BROWSER % browser_imports)
+
+        from lazytest import LazyModule
+        return LazyModule(None, 'lazy', {})
+
+    def test_first_access(self):
+        backend = self.write_module()
+        self.assertNotIn('lazytest.browser', sys.modules)
+
+        browser = backend.browser
+        self.assertIn('lazytest.browser', sys.modules)
+        self.assertIsInstance(browser, sys.modules['lazytest.browser'].LazyBrowser)
+        self.assertIs(backend.browser, browser)
+        self.assertIs(backend.BROWSER, sys.modules['lazytest.browser'].LazyBrowser)
+
+    def test_missing_dependency(self):
+        # The module is loaded, the error is only raised when the browser
+        # is needed.
+        backend = self.write_module('import weboob_test_missing_dependency')
+        self.assertRaises(ImportError, getattr, backend, 'browser')
+
+
+class BackendsCallTest(TestCase):
+    def setUp(self):
+        self.release = Event()
+        self.weboob = WebNip(modules_path=False, max_workers=2)
+
+    def tearDown(self):
+        self.release.set()
+        self.weboob.deinit()
+
+    def add_backends(self, *backends):
+        for backend in backends:
+            self.weboob.backend_instances[backend.name] = backend
+        return list(backends)
+
+    def test_timeout_frees_workers(self):
+        slow = self.add_backends(FakeBackend('slow1', [1], self.release),
+                                 FakeBackend('slow2', [2], self.release))
+        fast = self.add_backends(FakeBackend('fast', [3]))
+
+        try:
+            list(self.weboob.do('iter_results', backends=slow, timeout=0.2))
+        except CallErrors as errors:
+            self.assertEqual(sorted((backend.name, type(error)) for backend, error, _ in errors),
+                             [('slow1', BackendTimeout), ('slow2', BackendTimeout)])
+        else:
+            self.fail('Slow backends have not timed out')
+
+        # Stuck backends do not prevent the next call to run.
+        results = list(self.weboob.do('iter_results', backends=fast, timeout=1))
+        self.assertEqual([(backend.name, result) for backend, result in results], [('fast', 3)])
+        # Threads of given up backends are not counted.
+        self.assertEqual(self.weboob.pool.count_workers(), 1)
+
+        # Nor deinit() to return.
+        start = time()
+        self.weboob.deinit()
+        self.assertLess(time() - start, 1)
+        self.assertEqual(self.weboob.backend_instances, {})
+
+    def test_per_backend_timeout(self):
+        backends = self.add_backends(FakeBackend('slow', [1], self.release),
+                                     FakeBackend('fast', [2]))
+
+        results = []
+        try:
+            for backend, result in self.weboob.do('iter_results', backends=backends, per_backend_timeout=0.2):
+                results.append((backend.name, result))
+        except CallErrors as errors:
+            self.assertEqual([(backend.name, type(error)) for backend, error, _ in errors],
+                             [('slow', BackendTimeout)])
+        else:
+            self.fail('Slow backend has not timed out')
+        self.assertEqual(results, [('fast', 2)])
+
+    def test_max_buffered(self):
+        backend, = self.add_backends(FakeBackend('backend', range(10)))
+
+        call = self.weboob.do('iter_results', backends=[backend], max_buffered=2)
+        sleep(0.2)
+        # Two results are waiting in queue, and the third one to be put.
+        self.assertEqual(backend.given, 3)
+        self.assertFalse(backend.stopped.is_set())
+
+        self.assertEqual([result for _, result in call], list(range(10)))
+        self.assertGreater(call.stats.blocked_time, 0.1)
+
+    def test_break_stops_backends(self):
+        backend, = self.add_backends(FakeBackend('backend', range(1000)))
+
+        for _, result in self.weboob.do('iter_results', backends=[backend], max_buffered=1):
+            if result == 2:
+                break
+
+        self.assertTrue(backend.stopped.wait(1))
+        self.assertLess(backend.given, 10)
+
+    def test_cancel(self):
+        # With two workers, the third backend is not started before cancel.
+        backends = self.add_backends(FakeBackend('backend1', [1], self.release),
+                                     FakeBackend('backend2', [2], self.release),
+                                     FakeBackend('backend3', [3]))
+
+        call = self.weboob.do('iter_results', backends=backends)
+        self.assertTrue(backends[0].called.wait(1))
+        self.assertTrue(backends[1].called.wait(1))
+        call.cancel()
+        self.assertEqual(list(call), [])
+        self.release.set()
+
+        # Running backends stop at their next result.
+        self.assertTrue(backends[0].stopped.wait(1))
+        self.assertTrue(backends[1].stopped.wait(1))
+        self.assertEqual([backend.given for backend in backends[:2]], [1, 1])
+        # And the third one is never called.
+        sleep(0.1)
+        self.assertEqual(backends[2].given, 0)
+        self.assertFalse(backends[2].stopped.is_set())
+
+    def test_count(self):
+        from weboob.tools.application.base import Application
+
+        class CountApplication(Application):
+            APPNAME = 'test'
+
+            def create_weboob(self):
+                return WebNip(modules_path=False)
+
+        app = CountApplication()
+        app._is_default_count = False
+        backend, = self.add_backends(FakeBackend('backend', range(1000)))
+        try:
+            results = self.weboob.do(app._do_complete, 3, [], 'iter_results', backends=[backend])
+            self.assertEqual([result for _, result in results], [0, 1, 2])
+        finally:
+            app.deinit()
+
+        # The backend iterator is closed, so it does not load next pages.
+        self.assertTrue(backend.stopped.is_set())
+        self.assertEqual(backend.given, 3)
+
+    def test_processes(self):
+        backends = self.add_backends(FakeBackend('forked', [1, 2]), FakeBackend('local', [3]))
+
+        results = self.weboob.do(lambda backend: [(result, os.getpid()) for result in backend.iter_results()],
+                                 backends=backends, processes=['forked'])
+        results = sorted((backend.name, result, pid == os.getpid()) for backend, (result, pid) in results)
+        self.assertEqual(results, [('forked', 1, False), ('forked', 2, False), ('local', 3, True)])
+        # Changes made in the forked process are lost.
+        self.assertEqual([backend.given for backend in backends], [0, 1])
+
+    def test_merge(self):
+        backends = self.add_backends(FakeBackend('backend1', [1, 4, 5]),
+                                     FakeBackend('backend2', [2, 3, 6]),
+                                     FakeBackend('backend3', []))
+
+        results = self.weboob.do('iter_results', backends=backends, merge_key=lambda result: result)
+        self.assertEqual([result for _, result in results], [1, 2, 3, 4, 5, 6])
+
+        results = self.weboob.do('iter_results', backends=backends[:2], merge_key=lambda result: -result,
+                                 merge_reverse=True)
+        self.assertEqual([result for _, result in results], [1, 2, 3, 4, 5, 6])
+
+    def test_dedup(self):
+        def housing(id, title, location):
+            housing = Housing(id)
+            housing.title = title
+            housing.cost = Decimal('500')
+            housing.location = location
+            return housing
+
+        # Results of the second backend are read after those of the first one.
+        first = FakeBackend('first', [housing('1', u'Appartement T2', u'Paris'),
+                                      housing('2', u'Studio', u'Évreux')])
+        second = FakeBackend('second', [housing('a', u'appartement  t2', u'paris'),
+                                        housing('b', u'Studio', u'Rouen')], first.stopped)
+        self.add_backends(first, second)
+
+        stats = []
+        self.weboob.callbacks['stats'] = stats.append
+        results = self.weboob.do('iter_results', backends=[first, second], dedup=True)
+        self.assertEqual([(backend.name, result.id) for backend, result in results],
+                         [('first', '1'), ('first', '2'), ('second', 'b')])
+
+        stats, = stats
+        self.assertEqual([(s.name, s.results, s.duplicates) for s in stats], [('first', 2, 0), ('second', 1, 1)])
+
+    def test_stats(self):
+        def iter_results(backend):
+            if backend.name == 'broken':
+                raise ValueError('broken')
+            return backend.iter_results()
+
+        backends = self.add_backends(FakeBackend('backend', [1, 2]), FakeBackend('broken'))
+        stats = []
+        self.weboob.callbacks['stats'] = stats.append
+        call = self.weboob.do(iter_results, backends=backends)
+        self.assertRaises(CallErrors, list, call)
+
+        self.assertEqual(stats, [call.stats])
+        self.assertEqual(call.stats.function, 'iter_results')
+        self.assertEqual([(s.name, s.results, s.errors) for s in call.stats], [('backend', 2, 0), ('broken', 0, 1)])
+        self.assertGreaterEqual(call.stats.wall_time, 0)
+        self.assertGreaterEqual(call.stats['backend'].wall_time, 0)
+        self.assertGreaterEqual(call.stats['backend'].time_to_first, 0)
+        self.assertIsNone(call.stats['broken'].time_to_first)
+
+
+class SchedulerTest(TestCase):
+    def setUp(self):
+        self.scheduler = Scheduler()
+        self.calls = []
+        self.mutex = Lock()
+
+    def tearDown(self):
+        self.scheduler.want_stop()
+
+    def record(self, name, result=None, duration=0):
+        def function():
+            with self.mutex:
+                self.calls.append((name, time()))
+            sleep(duration)
+            return result
+        function.__name__ = name
+        return function
+
+    def names(self):
+        with self.mutex:
+            return [name for name, _ in self.calls]
+
+    def test_order(self):
+        for name, delay in (('c', 0.3), ('a', 0.1), ('b', 0.2)):
+            self.scheduler.schedule(delay, self.record(name))
+        sleep(0.5)
+        self.assertEqual(self.names(), ['a', 'b', 'c'])
+
+    def test_dispatcher_sleeps(self):
+        self.scheduler.schedule(1, self.record('a'))
+
+        wakeup = self.scheduler.changed
+        waits = []
+
+        def wait(timeout=None):
+            waits.append(timeout)
+            Wakeup.wait(wakeup, timeout)
+        wakeup.wait = wait
+
+        # The dispatcher sleeps until the event is due, it may only wake up
+        # once at start, as it has been notified of the event.
+        sleep(0.5)
+        self.assertLessEqual(len(waits), 2)
+        self.assertEqual(self.names(), [])
+
+    def test_cancel(self):
+        event = self.scheduler.schedule(0.1, self.record('once'))
+        repeated = self.scheduler.repeat(0.1, self.record('repeated'))
+        sleep(0.05)
+        self.assertTrue(self.scheduler.cancel(event))
+        self.assertTrue(self.scheduler.cancel(repeated))
+        self.assertFalse(self.scheduler.cancel(event))
+        sleep(0.2)
+        # Only the immediate call of the repeated function has been made.
+        self.assertEqual(self.names(), ['repeated'])
+
+    def test_group_limit(self):
+        running = []
+        concurrent = []
+
+        def poll():
+            with self.mutex:
+                running.append(None)
+                concurrent.append(len(running))
+            sleep(0.05)
+            with self.mutex:
+                running.pop()
+
+        self.scheduler.set_group_limit('sites', 1)
+        for _ in range(3):
+            self.scheduler.repeat(0.05, poll, group='sites')
+        sleep(0.5)
+        self.assertGreater(len(concurrent), 3)
+        self.assertEqual(max(concurrent), 1)
+
+    def test_backoff(self):
+        results = [False, False, False, True, True]
+
+        def poll():
+            with self.mutex:
+                self.calls.append(('poll', time()))
+                return results.pop(0) if results else True
+
+        self.scheduler.repeat(0.05, poll, backoff=2, max_interval=0.15)
+        sleep(0.65)
+        times = [when for _, when in self.calls]
+        delays = [b - a for a, b in zip(times, times[1:])]
+        # Interval is doubled after each result without anything new, up
+        # to max_interval, then reset by a new result.
+        expected = [0.1, 0.15, 0.15, 0.05, 0.05]
+        self.assertGreaterEqual(len(delays), len(expected))
+        for delay, interval in zip(delays, expected):
+            self.assertAlmostEqual(delay, interval, delta=0.03)
+
+    def test_stop(self):
+        self.scheduler.repeat(0.05, self.record('repeated'))
+        self.scheduler.schedule(0.1, self.scheduler.want_stop)
+        self.scheduler.schedule(0.3, self.record('late'))
+
+        start = time()
+        self.assertTrue(self.scheduler.run())
+        self.assertLess(time() - start, 0.25)
+        count = len(self.calls)
+        sleep(0.3)
+        self.assertEqual(len(self.calls), count)
+        self.assertNotIn('late', self.names())
+        self.assertIsNone(self.scheduler.schedule(0.1, self.record('after')))
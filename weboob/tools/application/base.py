@@ -34,7 +34,7 @@ from weboob.core.backendscfg import BackendsConfig
 from weboob.tools.config.iconfig import ConfigError
 from weboob.tools.exceptions import FormFieldConversionWarning
 from weboob.tools.log import createColoredFormatter, getLogger, settings as log_settings
-from weboob.tools.misc import to_unicode
+from weboob.tools.misc import to_unicode, is_duplicate
 from .results import ResultsConditionError
 
 __all__ = ['Application']
@@ -276,17 +276,27 @@ class Application(object):
 
     def _do_complete_iter(self, backend, count, fields, res):
         modif = 0
-        for i, sub in enumerate(res):
-            sub = self._do_complete_obj(backend, fields, sub)
-            if self.condition and not self.condition.is_valid(sub):
-                modif += 1
-            else:
-                if count and i - modif == count:
-                    if self._is_default_count:
+        try:
+            for i, sub in enumerate(res):
+                if is_duplicate(sub):
+                    # Do not spend time to complete an object which is dropped.
+                    modif += 1
+                    continue
+                sub = self._do_complete_obj(backend, fields, sub)
+                if self.condition and not self.condition.is_valid(sub):
+                    modif += 1
+                else:
+                    if count and i - modif == count:
                         raise MoreResultsAvailable()
-                    else:
+                    yield sub
+                    if count and not self._is_default_count and i - modif + 1 == count:
+                        # Do not fetch a result which won't be displayed.
                         return
-                yield sub
+        finally:
+            # Close the backend iterator as soon as the count is reached,
+            # so it does not load next pages.
+            if hasattr(res, 'close'):
+                res.close()
 
     def _do_complete(self, backend, count, selected_fields, function, *args, **kwargs):
         assert count is None or count > 0
@@ -30,6 +30,7 @@ import os
 from weboob.capabilities import UserError
 from weboob.capabilities.account import CapAccount, Account, AccountRegisterError
 from weboob.core.backendscfg import BackendAlreadyExists
+from weboob.core.bcall import BackendTimeout
 from weboob.core.modules import ModuleLoadError
 from weboob.core.repositories import ModuleInstallError
 from weboob.tools.exceptions import BrowserUnavailable, BrowserIncorrectPassword, BrowserForbidden, BrowserSSLError
@@ -75,7 +76,12 @@ class ConsoleApplication(Application):
 
     def __init__(self, option_parser=None):
         Application.__init__(self, option_parser)
+        self._parser.add_option('--profile-calls', action='store_true', help='display time spent by each backend after calls')
+        self._parser.add_option('--daemon', action='store_true', help='use backends loaded by weboobd')
+        self._parser.add_option('--parallel-load', action='store_true',
+                                help='load backends in threads (modules must support it)')
         self.weboob.callbacks['login'] = self.login_cb
+        self.weboob.callbacks['stats'] = self.stats_cb
         self.enabled_backends = set()
 
     def login_cb(self, backend_name, value):
@@ -85,6 +91,22 @@ class ConsoleApplication(Application):
                         default='',
                         regexp=value.regexp)
 
+    def stats_cb(self, stats):
+        if self.options is None or not self.options.profile_calls:
+            return
+
+        def fmt(seconds):
+            return '-' if seconds is None else '%.3f' % seconds
+
+        print('Call of %s: %ss, %ss blocked on output' % (stats.function, fmt(stats.wall_time), fmt(stats.blocked_time)), file=self.stderr)
+        print('  %-20s %9s %9s %8s %6s %7s %9s' % ('backend', 'wall (s)', 'first (s)', 'results', 'dups', 'errors', 'lock (s)'),
+              file=self.stderr)
+        for backend in sorted(stats, key=lambda b: b.wall_time or 0, reverse=True):
+            print('  %-20s %9s %9s %8d %6d %7d %9s' % (backend.name, fmt(backend.wall_time), fmt(backend.time_to_first),
+                                                      backend.results, backend.duplicates, backend.errors,
+                                                      fmt(backend.lock_wait)),
+                  file=self.stderr)
+
     def unload_backends(self, *args, **kwargs):
         unloaded = self.weboob.unload_backends(*args, **kwargs)
         for backend in unloaded.itervalues():
@@ -179,18 +201,38 @@ class ConsoleApplication(Application):
         print('Right right!')
 
     def _handle_options(self):
+        if self.options.daemon:
+            self.use_daemon()
         self.load_default_backends()
 
+    def use_daemon(self):
+        """
+        Replace the weboob object by one which calls backends loaded by the
+        weboobd daemon.
+        """
+        from weboob.core.daemon import DaemonError, RemoteWeboob, get_socket_path
+
+        weboob = RemoteWeboob(get_socket_path(self.weboob.workdir), self.weboob)
+        try:
+            weboob.client.connect().close()
+        except DaemonError as e:
+            print('Error: %s. Hint: start it with "weboobd".' % e, file=self.stderr)
+            sys.exit(1)
+
+        self.weboob.deinit()
+        self.weboob = weboob
+
     def load_default_backends(self):
         """
         By default loads all backends.
 
         Applications can overload this method to restrict backends loaded.
         """
+        parallel = self.options.parallel_load
         if len(self.STORAGE) > 0:
-            self.load_backends(self.CAPS, storage=self.create_storage())
+            self.load_backends(self.CAPS, storage=self.create_storage(), parallel=parallel)
         else:
-            self.load_backends(self.CAPS)
+            self.load_backends(self.CAPS, parallel=parallel)
 
     @classmethod
     def run(klass, args=None):
@@ -555,6 +597,8 @@ class ConsoleApplication(Application):
             print(u'Error(%s): %s' % (backend.name, to_unicode(error)), file=self.stderr)
         elif isinstance(error, MoreResultsAvailable):
             print(u'Hint: There are more results for backend %s' % (backend.name), file=self.stderr)
+        elif isinstance(error, BackendTimeout):
+            print(u'Error(%s): no answer after %s seconds, results may be incomplete.' % (backend.name, error.timeout), file=self.stderr)
         elif isinstance(error, BrowserSSLError):
             print(u'FATAL(%s): ' % backend.name + self.BOLD + '/!\ SERVER CERTIFICATE IS INVALID /!\\' + self.NC, file=self.stderr)
         else:
@@ -22,8 +22,6 @@ from __future__ import print_function
 
 import os
 from subprocess import PIPE, Popen
-import cookielib
-import urllib2
 
 from weboob.tools.log import getLogger
 
@@ -127,6 +125,9 @@ class MediaPlayer(object):
         print(player_name + ' ' + args)
         proc = Popen(player_name + ' ' + args, stdin=PIPE, shell=True)
 
+        import cookielib
+        import urllib2
+
         # Handle cookies (and redirection 302...)
         cj = cookielib.CookieJar()
         url_opener = urllib2.build_opener(urllib2.HTTPCookieProcessor(cj))
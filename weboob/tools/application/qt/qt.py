@@ -63,7 +63,10 @@ class QtScheduler(IScheduler):
         self.app.connect(timer, SIGNAL("timeout()"), lambda: self.timeout(count, None, function, *args))
         self.timers[count] = timer
 
-    def repeat(self, interval, function, *args):
+    def repeat(self, interval, function, *args, **kwargs):
+        # Options of weboob.core.scheduler.Scheduler.repeat() (jitter,
+        # backoff, max_interval and group) are ignored, the function is
+        # called every interval.
         timer = QTimer()
         timer.setSingleShot(False)
 
@@ -368,7 +368,10 @@ class ReplApplication(Cmd, ConsoleApplication):
                 print('Warning: some selected fields will not be displayed by the formatter. Fallback to another. Hint: use option -f', file=self.stderr)
                 self.formatter = self.formatters_loader.build_formatter(ReplApplication.DEFAULT_FORMATTER)
 
-        return self.weboob.do(self._do_complete, self.options.count, fields, function, *args, **kwargs)
+        call = self.weboob.do(self._do_complete, self.options.count, fields, function, *args, **kwargs)
+        # Report the real method in stats, not the wrapper.
+        call.stats.function = function
+        return call
 
     # -- command tools ------------
     def parse_command_args(self, line, nb, req_n=None):
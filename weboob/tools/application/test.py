@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+
+# Copyright(C) 2014 Romain Bignon
+#
+# This file is part of weboob.
+#
+# weboob is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# weboob is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with weboob. If not, see <http://www.gnu.org/licenses/>.
+
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+from time import time
+from unittest import TestCase
+
+import weboob
+
+
+PROJECT = os.path.dirname(os.path.dirname(os.path.abspath(weboob.__file__)))
+
+# Run a script and print the modules it has imported.
+RUNNER = '''
+import json, runpy, sys
+sys.argv = sys.argv[1:]
+try:
+    runpy.run_path(sys.argv[0], run_name='__main__')
+except SystemExit:
+    pass
+sys.stderr.write(json.dumps([name for name, module in sys.modules.items() if module is not None]))
+'''
+
+
+class StartupTest(TestCase):
+    # Libraries which are only needed by some commands.
+    HEAVY_MODULES = ('dateutil', 'feedparser', 'html2text', 'lxml', 'mechanize', 'multiprocessing',
+                     'prettytable', 'requests', 'yaml', 'zipfile')
+    MAX_MODULES = 160
+    # Maximum ratio of the time spent by --help to the startup time of the
+    # interpreter alone. It is generous, so it does not depend on the load
+    # of the machine, but eager imports of heavy libraries exceed it.
+    MAX_HELP_RATIO = 20
+
+    def setUp(self):
+        self.workdir = tempfile.mkdtemp(prefix='weboob_test_')
+        # An empty sources.list, to not fetch repositories.
+        with open(os.path.join(self.workdir, 'sources.list'), 'w') as fp:
+            fp.write('\n')
+
+        self.env = os.environ.copy()
+        self.env['PYTHONPATH'] = os.pathsep.join(p for p in [PROJECT, os.getenv('PYTHONPATH')] if p)
+        self.env['WEBOOB_WORKDIR'] = self.workdir
+        self.env['WEBOOB_BACKENDS'] = os.path.join(self.workdir, 'backends')
+        self.env['XDG_DATA_HOME'] = self.workdir
+        self.env.pop('WEBOOB_IMPORT_PROFILE', None)
+
+    def tearDown(self):
+        shutil.rmtree(self.workdir)
+
+    def run_script(self, name, *args):
+        proc = subprocess.Popen([sys.executable, '-c', RUNNER, os.path.join(PROJECT, 'scripts', name)] + list(args),
+                                env=self.env, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        out, err = proc.communicate()
+        return json.loads(err.decode('utf-8').splitlines()[-1])
+
+    def run_time(self, *args):
+        with open(os.devnull, 'w') as devnull:
+            start = time()
+            subprocess.call([sys.executable] + list(args), env=self.env, stdout=devnull, stderr=devnull)
+            return time() - start
+
+    def test_help_imports(self):
+        for name in ('boobank', 'boobmsg', 'videoob', 'weboob-cli', 'weboob-config'):
+            modules = self.run_script(name, '--help')
+            heavy = [m for m in modules if m.split('.', 1)[0] in self.HEAVY_MODULES]
+            self.assertEqual(heavy, [], '%s --help imports %s' % (name, ', '.join(sorted(heavy))))
+            self.assertLessEqual(len(modules), self.MAX_MODULES,
+                                 '%s --help imports %d modules' % (name, len(modules)))
+
+    def test_help_time(self):
+        python = []
+        elapsed = []
+        # Runs are interleaved, so a load peak affects both measures.
+        for _ in range(3):
+            python.append(self.run_time('-c', 'pass'))
+            elapsed.append(self.run_time(os.path.join(PROJECT, 'scripts', 'boobank'), '--help'))
+        self.assertLess(min(elapsed), min(python) * self.MAX_HELP_RATIO,
+                        'boobank --help takes %.3fs, python alone %.3fs' % (min(elapsed), min(python)))
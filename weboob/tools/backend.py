@@ -19,6 +19,7 @@
 
 
 import os
+import sys
 from threading import RLock
 from copy import copy
 
@@ -29,7 +30,7 @@ from weboob.tools.log import getLogger
 from weboob.tools.value import ValuesDict
 
 
-__all__ = ['BackendStorage', 'BackendConfig', 'Module']
+__all__ = ['BackendStorage', 'BackendConfig', 'LazyBrowser', 'Module']
 
 
 class BackendStorage(object):
@@ -202,6 +203,70 @@ class BackendConfig(ValuesDict):
         self.weboob.backends_config.add_backend(self.instname, self.modname, dump, edit)
 
 
+class LazyBrowser(object):
+    """
+    Browser class of a module, imported at its first use.
+
+    Use it as :attr:`Module.BROWSER` value, instead of importing the
+    browser module at the top of the module, so loading a module does not
+    import its browser, pages and their dependencies until a backend
+    needs a browser::
+
+        class FooModule(Module):
+            BROWSER = LazyBrowser('.browser', 'FooBrowser')
+
+    :param module: name of the python module containing the browser,
+                   relative to the package of the class using it
+    :type module: :class:`str`
+    :param name: name of the browser class
+    :type name: :class:`str`
+
+    As the browser module is imported only when it is used, an
+    :class:`ImportError` raised by it, for example because a dependency is
+    missing, does not prevent the module to be loaded anymore: it is raised
+    by the first access to :attr:`Module.browser` or to ``BROWSER``.
+    """
+    def __init__(self, module, name):
+        self.module = module
+        self.name = name
+        self.klass = None
+
+    def __get__(self, obj, owner):
+        if self.klass is None:
+            module = __import__(self._get_module_name(owner), fromlist=[self.name])
+            self.klass = getattr(module, self.name)
+        return self.klass
+
+    def _get_module_name(self, owner):
+        name = self.module.lstrip('.')
+        level = len(self.module) - len(name)
+        if level == 0:
+            return name
+
+        package = self._get_package(owner)
+        for _ in range(level - 1):
+            package = package.rpartition('.')[0]
+        if name:
+            return '%s.%s' % (package, name)
+        return package
+
+    def _get_package(self, owner):
+        # Find the class which has been defined with this attribute, as
+        # the import is relative to its package.
+        for klass in owner.__mro__:
+            if klass.__dict__.get('BROWSER') is self:
+                owner = klass
+                break
+
+        module = sys.modules[owner.__module__]
+        if hasattr(module, '__path__'):
+            return module.__name__
+        return module.__name__.rpartition('.')[0]
+
+    def __repr__(self):
+        return '<LazyBrowser %s.%s>' % (self.module, self.name)
+
+
 class Module(object):
     """
     Base class for modules.
@@ -236,7 +301,7 @@ class Module(object):
     CONFIG = BackendConfig()
     # Storage
     STORAGE = {}
-    # Browser class
+    # Browser class, or a LazyBrowser to import it at its first use
     BROWSER = None
     # URL to an optional icon.
     # If you want to create your own icon, create a 'favicon.ico' ico in
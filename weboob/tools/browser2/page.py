@@ -35,6 +35,7 @@ from weboob.tools.regex_helper import normalize
 from weboob.tools.compat import basestring
 
 from weboob.tools.log import getLogger
+from weboob.tools.misc import is_cancelled
 
 from .browser import DomainBrowser
 
@@ -335,7 +336,8 @@ class PagesBrowser(DomainBrowser):
         This helper function can be used to handle pagination pages easily.
 
         When the called function raises an exception :class:`NextPage`, it goes
-        on the wanted page and recall the function.
+        on the wanted page and recall the function, unless the call has been
+        cancelled (see :func:`weboob.tools.misc.is_cancelled`).
 
         :class:`NextPage` constructor can take an url or a Request object.
 
@@ -360,6 +362,9 @@ class PagesBrowser(DomainBrowser):
                 for r in func(*args, **kwargs):
                     yield r
             except NextPage as e:
+                if is_cancelled():
+                    self.logger.debug('Call is cancelled, do not load next page %s' % e.request)
+                    return
                 self.location(e.request)
             else:
                 return
@@ -369,7 +374,8 @@ def pagination(func):
     This helper decorator can be used to handle pagination pages easily.
 
     When the called function raises an exception :class:`NextPage`, it goes on
-    the wanted page and recall the function.
+    the wanted page and recall the function, unless the call has been
+    cancelled (see :func:`weboob.tools.misc.is_cancelled`).
 
     :class:`NextPage` constructor can take an url or a Request object.
 
@@ -396,6 +402,9 @@ def pagination(func):
                 for r in func(page, *args, **kwargs):
                     yield r
             except NextPage as e:
+                if is_cancelled():
+                    page.logger.debug('Call is cancelled, do not load next page %s' % e.request)
+                    return
                 result = page.browser.location(e.request)
                 page = result.page
             else:
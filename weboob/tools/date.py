@@ -17,26 +17,34 @@
 # You should have received a copy of the GNU Affero General Public License
 # along with weboob. If not, see <http://www.gnu.org/licenses/>.
 
-import dateutil.parser
 from datetime import date as real_date, datetime as real_datetime, timedelta
 import time
 import re
-try:
-    from dateutil import tz
-except ImportError:
-    raise ImportError('Please install python-dateutil')
 
 
 __all__ = ['local2utc', 'utc2local', 'LinearDateGuesser', 'date', 'datetime', 'new_date', 'new_datetime']
 
 
+def _import_dateutil(name):
+    """
+    Import a module of dateutil, only when it is used, as it is slow to
+    import.
+    """
+    try:
+        return getattr(__import__('dateutil', fromlist=[name]), name)
+    except ImportError:
+        raise ImportError('Please install python-dateutil')
+
+
 def local2utc(dateobj):
+    tz = _import_dateutil('tz')
     dateobj = dateobj.replace(tzinfo=tz.tzlocal())
     dateobj = dateobj.astimezone(tz.tzutc())
     return dateobj
 
 
 def utc2local(dateobj):
+    tz = _import_dateutil('tz')
     dateobj = dateobj.replace(tzinfo=tz.tzutc())
     dateobj = dateobj.astimezone(tz.tzlocal())
     return dateobj
@@ -264,7 +272,7 @@ def parse_french_date(date):
     for fr, en in DATE_TRANSLATE_FR:
         date = fr.sub(en, date)
 
-    return dateutil.parser.parse(date)
+    return _import_dateutil('parser').parse(date)
 
 
 WEEK   = {'MONDAY': 0,
@@ -22,14 +22,16 @@ import warnings
 __all__ = ['html2text']
 
 
-try:
-    import html2text as h2t
+def html2text(html):
+    # python-html2text is imported on first use, as it is slow to load.
+    try:
+        import html2text as h2t
+    except ImportError:
+        warnings.warn('python-html2text is not present. HTML pages are not converted into text.', stacklevel=2)
+        return html
+
     h2t.UNICODE_SNOB = 1
     h2t.SKIP_INTERNAL_LINKS = True
     h2t.INLINE_LINKS = False
     h2t.LINKS_EACH_PARAGRAPH = True
-    html2text = h2t.html2text
-except ImportError:
-    def html2text(html):
-        warnings.warn('python-html2text is not present. HTML pages are not converted into text.', stacklevel=2)
-        return html
+    return h2t.html2text(html)
@@ -0,0 +1,250 @@
+# -*- coding: utf-8 -*-
+
+# Copyright(C) 2014 Romain Bignon
+#
+# This file is part of weboob.
+#
+# weboob is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# weboob is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with weboob. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Measure the time spent to import python modules.
+
+Set the ``WEBOOB_IMPORT_PROFILE`` environment variable to ``1`` to profile
+every import made after the ``weboob`` package is imported, and print a
+report on exit. ``weboob-debug --profile-imports`` gives the same report
+for the loading of modules.
+"""
+
+from __future__ import print_function
+
+from contextlib import contextmanager
+from threading import Lock, local
+from time import time
+import sys
+try:
+    import __builtin__ as builtins
+except ImportError:
+    import builtins
+try:
+    from thread import get_ident
+except ImportError:
+    from threading import get_ident
+
+
+__all__ = ['ImportProfiler', 'start_profiler', 'get_profiler', 'profile_section']
+
+
+class ImportRecord(object):
+    """
+    Import of python modules, or section of code which imports them.
+    """
+    def __init__(self, name, parent=None):
+        self.name = name
+        self.parent = parent
+        self.children = []
+        # Python modules loaded by this record itself, not by children.
+        self.modules = []
+        self.cumulative = 0.0
+        self.self_time = 0.0
+
+    @property
+    def top_level(self):
+        return self.name.split('.', 1)[0]
+
+    def get_third_party(self):
+        """
+        Get the name of the package installed outside of the python
+        standard library and weboob imported by this record, if any.
+        """
+        for name in self.modules:
+            path = getattr(sys.modules.get(name), '__file__', None) or ''
+            if 'site-packages' in path or 'dist-packages' in path:
+                return name.split('.', 1)[0]
+        return None
+
+    def iter_dependencies(self):
+        """
+        Iter on (package name, record) of third-party imports made in this
+        record, without the ones made by them.
+        """
+        for child in self.children:
+            package = child.get_third_party()
+            if package is not None:
+                yield package, child
+            else:
+                for dependency in child.iter_dependencies():
+                    yield dependency
+
+    def __repr__(self):
+        return '<ImportRecord %s cumulative=%.3f self=%.3f>' % (self.name, self.cumulative, self.self_time)
+
+
+class ImportProfiler(object):
+    """
+    Record the time spent by imports.
+
+    When it is started, the builtin ``__import__`` function is replaced to
+    measure import statements which load new modules. Only imports made
+    by the thread which has started the profiler are measured, but
+    sections can be recorded by any thread: each thread has its own
+    current record, and sections of other threads are attached to the
+    root.
+    """
+    SECTION_PREFIX = 'module '
+
+    def __init__(self):
+        self.root = ImportRecord('<root>')
+        self.records = []
+        self.seen = set()
+        self.original_import = None
+        self.thread = None
+        self.mutex = Lock()
+        self._local = local()
+
+    @property
+    def current(self):
+        return getattr(self._local, 'current', self.root)
+
+    @current.setter
+    def current(self, record):
+        self._local.current = record
+
+    def start(self):
+        if self.original_import is not None:
+            return
+        self.seen.update(sys.modules)
+        self.thread = get_ident()
+        self.original_import = builtins.__import__
+        builtins.__import__ = self._import
+
+    def stop(self):
+        if self.original_import is None:
+            return
+        builtins.__import__ = self.original_import
+        self.original_import = None
+
+    def _import(self, name, *args, **kwargs):
+        if get_ident() != self.thread:
+            return self.original_import(name, *args, **kwargs)
+
+        with self._record(name):
+            return self.original_import(name, *args, **kwargs)
+
+    def section(self, name):
+        """
+        Record imports made by a block of code, like the loading of a
+        module package.
+        """
+        return self._record(self.SECTION_PREFIX + name, force=True)
+
+    @contextmanager
+    def _record(self, name, force=False):
+        record = ImportRecord(name, self.current)
+        self.current = record
+        count = len(sys.modules)
+        start = time()
+        try:
+            yield record
+        finally:
+            record.cumulative = time() - start
+            self.current = record.parent
+
+            with self.mutex:
+                if len(sys.modules) != count:
+                    new = [n for n in list(sys.modules) if n not in self.seen]
+                    self.seen.update(new)
+                    # Python 2 caches failed relative imports as None.
+                    record.modules = sorted(n for n in new if sys.modules.get(n) is not None)
+
+                if force or record.modules or record.children:
+                    record.self_time = record.cumulative - sum(child.cumulative for child in record.children)
+                    if record.modules and not force:
+                        # Name it after the imported module, as it may be a
+                        # relative name.
+                        matching = [n for n in record.modules if n == name or n.endswith('.' + name)]
+                        record.name = min(matching or record.modules, key=lambda n: n.count('.'))
+                    record.parent.children.append(record)
+                    self.records.append(record)
+
+    def iter_reported(self):
+        """
+        Iter on records of weboob modules and module packages.
+        """
+        for record in self.records:
+            if record.name.startswith(self.SECTION_PREFIX) or record.top_level == 'weboob':
+                yield record
+
+    def report(self, stream=None, limit=None):
+        """
+        Print imports of weboob and module packages, ordered by cumulative
+        time, with third-party dependencies they have imported.
+        """
+        if stream is None:
+            stream = sys.stderr
+
+        records = sorted(self.iter_reported(), key=lambda r: r.cumulative, reverse=True)
+        if limit:
+            records = records[:limit]
+
+        print('%9s %9s  %-40s %s' % ('cumul(ms)', 'self(ms)', 'name', 'third-party dependencies (ms)'), file=stream)
+        for record in records:
+            dependencies = {}
+            for package, dependency in record.iter_dependencies():
+                dependencies[package] = dependencies.get(package, 0) + dependency.cumulative
+            dependencies = sorted(dependencies.items(), key=lambda d: d[1], reverse=True)
+            print('%9.1f %9.1f  %-40s %s' % (record.cumulative * 1000, record.self_time * 1000, record.name,
+                                             ', '.join('%s (%.1f)' % (n, t * 1000) for n, t in dependencies)),
+                  file=stream)
+
+
+_profiler = None
+
+
+def get_profiler():
+    """
+    Get the running profiler, or None.
+    """
+    return _profiler
+
+
+def start_profiler(report_at_exit=True):
+    """
+    Start to profile imports.
+
+    :param report_at_exit: print the report on stderr when python exits
+    :type report_at_exit: :class:`bool`
+    :rtype: :class:`ImportProfiler`
+    """
+    global _profiler
+    if _profiler is None:
+        _profiler = ImportProfiler()
+        _profiler.start()
+        if report_at_exit:
+            import atexit
+            atexit.register(_profiler.report)
+    return _profiler
+
+
+@contextmanager
+def profile_section(name):
+    """
+    Record imports made by a block of code in the running profiler, if
+    there is one.
+    """
+    if _profiler is None:
+        yield
+    else:
+        with _profiler.section(name):
+            yield
+
@@ -18,6 +18,8 @@
 # along with weboob. If not, see <http://www.gnu.org/licenses/>.
 
 
+from contextlib import contextmanager
+from threading import local
 from time import time, sleep
 import os
 import sys
@@ -28,7 +30,7 @@ from .compat import unicode
 
 
 __all__ = ['get_backtrace', 'get_bytes_size', 'iter_fields',
-            'to_unicode', 'limit']
+            'to_unicode', 'limit', 'is_cancelled', 'is_duplicate']
 
 
 def get_backtrace(empty="Empty backtrace."):
@@ -136,3 +138,68 @@ def ratelimit(group, delay):
         sleep(delay - offset)
 
     os.utime(path, None)
+
+
+_context = local()
+
+
+@contextmanager
+def cancellable(check):
+    """
+    Run a block of code which can be cancelled.
+
+    While this block is run, :func:`is_cancelled` calls in the same thread
+    return the result of *check*.
+
+    :param check: function returning True when the work is cancelled
+    :type check: :class:`callable`
+    """
+    previous = getattr(_context, 'check', None)
+    _context.check = check
+    try:
+        yield
+    finally:
+        _context.check = previous
+
+
+def is_cancelled():
+    """
+    Check if the current work has been cancelled, for example because the
+    caller of a backend does not want any other result.
+
+    Long operations, like loading next pages of a list, should stop when
+    it returns True.
+    """
+    check = getattr(_context, 'check', None)
+    return check is not None and check()
+
+
+@contextmanager
+def deduplicating(check):
+    """
+    Run a block of code where duplicated objects can be dropped.
+
+    While this block is run, :func:`is_duplicate` calls in the same thread
+    return the result of *check*.
+
+    :param check: function taking an object and returning True if an
+                  equivalent one has already been found
+    :type check: :class:`callable`
+    """
+    previous = getattr(_context, 'duplicate', None)
+    _context.duplicate = check
+    try:
+        yield
+    finally:
+        _context.duplicate = previous
+
+
+def is_duplicate(obj):
+    """
+    Check if an equivalent object has already been found by the current
+    call, for example on another backend.
+
+    It is used to drop duplicates before spending time to complete them.
+    """
+    check = getattr(_context, 'duplicate', None)
+    return check is not None and check(obj)
@@ -19,6 +19,7 @@
 
 
 from copy import deepcopy
+from threading import RLock
 
 from .config.yamlconfig import YamlConfig
 
@@ -59,25 +60,32 @@ class StandardStorage(IStorage):
     def __init__(self, path):
         self.config = YamlConfig(path)
         self.config.load()
+        # Backends may be created and called in several threads.
+        self.lock = RLock()
 
     def load(self, what, name, default={}):
-        d = {}
-        if not what in self.config.values:
-            self.config.values[what] = {}
-        else:
-            d = self.config.values[what].get(name, {})
+        with self.lock:
+            d = {}
+            if not what in self.config.values:
+                self.config.values[what] = {}
+            else:
+                d = self.config.values[what].get(name, {})
 
-        self.config.values[what][name] = deepcopy(default)
-        self.config.values[what][name].update(d)
+            self.config.values[what][name] = deepcopy(default)
+            self.config.values[what][name].update(d)
 
     def save(self, what, name):
-        self.config.save()
+        with self.lock:
+            self.config.save()
 
     def set(self, what, name, *args):
-        self.config.set(what, name, *args)
+        with self.lock:
+            self.config.set(what, name, *args)
 
     def delete(self, what, name, *args):
-        self.config.delete(what, name, *args)
+        with self.lock:
+            self.config.delete(what, name, *args)
 
     def get(self, what, name, *args, **kwargs):
-        return self.config.get(what, name, *args, **kwargs)
+        with self.lock:
+            return self.config.get(what, name, *args, **kwargs)